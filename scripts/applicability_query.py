@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Query applicable and mandatory CSCRF guidelines for a resolved tag set.
+
+Each guideline's applicability is precomputed as a bitmask over the canonical
+and conditional tags, and each tag as a column bitset over all guidelines. A
+query ORs the columns for the requested tags and ANDs the result with the
+mandatory bitset, so filtering all 97 guidelines is a handful of integer ops
+instead of a loop over every file and guideline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from framework_index import FrameworkIndex, load_index
+from resolve_entity_tags import ResolverError, resolve_tags
+
+CANONICAL_TAGS = ("mii", "qualified", "mid-size", "small-size", "self-certification")
+CONDITIONAL_TAGS = (
+    "cii",
+    "third-party-soc",
+    "stock-brokers",
+    "depository-participants",
+    "qualified-stock-brokers-dps",
+    "mid-size-stock-brokers-dps",
+)
+TAG_ORDER = CANONICAL_TAGS + CONDITIONAL_TAGS
+TAG_BITS = {tag: 1 << position for position, tag in enumerate(TAG_ORDER)}
+
+
+@dataclass
+class ApplicabilityResult:
+    tags: List[str]
+    applicable: List[str]
+    mandatory: List[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"tags": self.tags, "applicable": self.applicable, "mandatory": self.mandatory}
+
+
+def tag_mask(tags: Iterable[str]) -> int:
+    """Encode a tag set as a bitmask over TAG_ORDER."""
+    mask = 0
+    for tag in tags:
+        bit = TAG_BITS.get(tag)
+        if bit is None:
+            raise ValueError(f"Unknown applicability tag: {tag}")
+        mask |= bit
+    return mask
+
+
+class ApplicabilityEngine:
+    """Bitset query engine over the compiled framework index."""
+
+    def __init__(self, index: FrameworkIndex) -> None:
+        self.guideline_ids: List[str] = list(index.guidelines)
+        self.positions: Dict[str, int] = {gid: pos for pos, gid in enumerate(self.guideline_ids)}
+        self.guideline_masks: List[int] = []
+        self.tag_columns: Dict[str, int] = {tag: 0 for tag in TAG_ORDER}
+        self.mandatory_bits = 0
+
+        for position, guideline_id in enumerate(self.guideline_ids):
+            record = index.guidelines[guideline_id]
+            self.guideline_masks.append(tag_mask(record["applicability"]))
+            for tag in record["applicability"]:
+                self.tag_columns[tag] |= 1 << position
+            if record["mandatory"]:
+                self.mandatory_bits |= 1 << position
+
+        self._memo: Dict[int, Tuple[int, int]] = {}
+        self._decoded: Dict[int, Tuple[List[str], List[str]]] = {}
+
+    def _bits_for_mask(self, mask: int) -> Tuple[int, int]:
+        cached = self._memo.get(mask)
+        if cached is not None:
+            return cached
+        applicable = 0
+        for tag in TAG_ORDER:
+            if mask & TAG_BITS[tag]:
+                applicable |= self.tag_columns[tag]
+        cached = (applicable, applicable & self.mandatory_bits)
+        self._memo[mask] = cached
+        return cached
+
+    def _decode(self, bits: int) -> List[str]:
+        ids: List[str] = []
+        while bits:
+            low = bits & -bits
+            ids.append(self.guideline_ids[low.bit_length() - 1])
+            bits ^= low
+        return ids
+
+    def query(self, tags: Iterable[str]) -> ApplicabilityResult:
+        tag_list = sorted(set(tags))
+        mask = tag_mask(tag_list)
+        decoded = self._decoded.get(mask)
+        if decoded is None:
+            applicable, mandatory = self._bits_for_mask(mask)
+            decoded = (self._decode(applicable), self._decode(mandatory))
+            self._decoded[mask] = decoded
+        return ApplicabilityResult(
+            tags=tag_list,
+            applicable=list(decoded[0]),
+            mandatory=list(decoded[1]),
+        )
+
+    def query_many(self, tag_sets: Iterable[Iterable[str]]) -> List[ApplicabilityResult]:
+        return [self.query(tags) for tags in tag_sets]
+
+    def applies(self, guideline_id: str, tags: Iterable[str]) -> bool:
+        position = self.positions[guideline_id]
+        return bool(self.guideline_masks[position] & tag_mask(tags))
+
+
+def naive_query(index: FrameworkIndex, tags: Iterable[str]) -> ApplicabilityResult:
+    """Reference implementation of the SCHEMA.md loop, used for benchmarking."""
+    my_tags = set(tags)
+    applicable: List[str] = []
+    mandatory: List[str] = []
+    for guideline_id, record in index.guidelines.items():
+        if my_tags & set(record["applicability"]):
+            applicable.append(guideline_id)
+            if record["mandatory"]:
+                mandatory.append(guideline_id)
+    return ApplicabilityResult(tags=sorted(my_tags), applicable=applicable, mandatory=mandatory)
+
+
+_ENGINE: ApplicabilityEngine | None = None
+
+
+def get_engine() -> ApplicabilityEngine:
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = ApplicabilityEngine(load_index())
+    return _ENGINE
+
+
+def benchmark(engine: ApplicabilityEngine, index: FrameworkIndex, queries: int, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    tag_sets: List[List[str]] = []
+    for _ in range(queries):
+        tags = [rng.choice(CANONICAL_TAGS)]
+        tags.extend(tag for tag in CONDITIONAL_TAGS if rng.random() < 0.2)
+        tag_sets.append(tags)
+
+    start = time.perf_counter()
+    naive = [naive_query(index, tags) for tags in tag_sets]
+    naive_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = engine.query_many(tag_sets)
+    bitset_s = time.perf_counter() - start
+
+    mismatches = sum(
+        1 for a, b in zip(naive, fast) if (a.applicable, a.mandatory) != (b.applicable, b.mandatory)
+    )
+    return {
+        "queries": queries,
+        "naive_s": round(naive_s, 6),
+        "bitset_s": round(bitset_s, 6),
+        "speedup": round(naive_s / bitset_s, 1) if bitset_s else None,
+        "mismatches": mismatches,
+    }
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tags", help="Comma-separated resolved tags, e.g. mid-size,stock-brokers")
+    parser.add_argument("--profile", type=Path, help="Entity profile JSON to resolve first")
+    parser.add_argument("--entity-type", help="Entity type")
+    parser.add_argument("--category", help="Entity category")
+    parser.add_argument("--cii", action="store_true", help="Set CII true")
+    parser.add_argument("--third-party-soc", action="store_true", help="Set third-party-soc true")
+    parser.add_argument("--mandatory-only", action="store_true", help="Only print mandatory guidelines")
+    parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON")
+    parser.add_argument(
+        "--benchmark",
+        type=int,
+        metavar="N",
+        help="Compare the bitset engine with the naive loop over N random tag sets",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for --benchmark")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    index = load_index()
+    engine = ApplicabilityEngine(index)
+
+    if args.benchmark:
+        stats = benchmark(engine, index, args.benchmark, args.seed)
+        print(json.dumps(stats, indent=2 if args.pretty else None))
+        return 1 if stats["mismatches"] else 0
+
+    if args.tags:
+        tags = [tag.strip() for tag in args.tags.split(",") if tag.strip()]
+    else:
+        profile: Dict[str, Any] = {}
+        if args.profile:
+            try:
+                profile = json.loads(args.profile.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError) as exc:
+                print(f"ERROR: cannot read profile {args.profile}: {exc}", file=sys.stderr)
+                return 2
+        if args.entity_type is not None:
+            profile["entity_type"] = args.entity_type
+        if args.category is not None:
+            profile["category"] = args.category
+        if args.cii:
+            profile["cii"] = True
+        if args.third_party_soc:
+            profile["third_party_soc"] = True
+        try:
+            tags = resolve_tags(profile)["tags"]
+        except ResolverError as exc:
+            print(f"ERROR: {exc}", file=sys.stderr)
+            return 2
+
+    try:
+        result = engine.query(tags).to_dict()
+    except ValueError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+
+    if args.mandatory_only:
+        del result["applicable"]
+    print(
+        json.dumps(result, indent=2, ensure_ascii=True)
+        if args.pretty
+        else json.dumps(result, separators=(",", ":"), ensure_ascii=True)
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
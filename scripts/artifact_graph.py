@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""Make-like dependency graph for the /ciso workflow artifacts.
+
+The artifacts in a workspace (docs/.ciso-work, or one per entity under the
+workspace root, see workspaces.py) form a chain:
+
+    entity-profile.json -> entity-tags.json -> gap-analysis.json/.md
+        -> policy-plan.md -> roadmap.md
+
+Whenever an artifact is built or recorded, the graph stores the content hashes
+of its inputs in <work-dir>/.build-graph.json. Inputs are the upstream
+artifacts, the resolver source, the framework index digest (every
+framework/*.md file) and the policy-area-map.json version. An artifact is
+stale when any of those hashes changed since, or when an upstream artifact
+is stale and regenerated by the skill, so its next content is unknown.
+
+Deterministic artifacts (entity-tags.json) are recomputed in memory. If the
+result matches the file on disk, downstream artifacts stay fresh, so a
+profile edit that does not change the tags costs no downstream re-run.
+`build` writes the stale deterministic artifacts and hands the first stale
+skill phase back (e.g. `/ciso assess`). After the skill regenerates that
+phase's artifacts, `record` stamps them with their current input hashes.
+
+Usage:
+    python3 scripts/artifact_graph.py status
+    python3 scripts/artifact_graph.py build --json
+    python3 scripts/artifact_graph.py record gap-analysis.json gap-analysis.md
+    python3 scripts/artifact_graph.py record            # adopt every existing artifact
+    python3 scripts/artifact_graph.py status --workspace acme-broking
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from framework_index import load_index
+from resolve_entity_tags import ResolverError, resolve_tags
+from workspaces import ROOT_ENV, artifact_path, atomic_write, locked, select, workspace_root
+
+ROOT = Path(__file__).resolve().parent.parent
+MAP_PATH = ROOT / ".claude/skills/ciso/references/policy-area-map.json"
+RESOLVER_PATH = Path(__file__).resolve().parent / "resolve_entity_tags.py"
+GRAPH_FILE = ".build-graph.json"
+GRAPH_FORMAT = 1
+
+SOURCES = ("entity-profile.json",)
+# Outputs the workflow may skip (verify-ciso-artifacts.sh treats them as optional).
+OPTIONAL = frozenset({"policy-plan.md"})
+
+
+def ok(message: str) -> None:
+    print(f"[PASS] {message}")
+
+
+def fail(message: str) -> None:
+    print(f"[FAIL] {message}")
+
+
+# ---------------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------------
+
+# A deterministic recipe maps the work dir to {artifact name: content}.
+Recipe = Callable[[Path], Dict[str, bytes]]
+
+
+def _build_entity_tags(work_dir: Path) -> Dict[str, bytes]:
+    """Same output as `resolve_entity_tags.py --profile ... --pretty --output ...`."""
+    profile = json.loads((work_dir / "entity-profile.json").read_text(encoding="utf-8"))
+    if not isinstance(profile, dict):
+        raise ResolverError("entity-profile.json must be a JSON object")
+    resolved = resolve_tags(profile)
+    text = json.dumps(resolved, indent=2, ensure_ascii=True) + "\n"
+    return {"entity-tags.json": text.encode("utf-8")}
+
+
+@dataclass(frozen=True)
+class Rule:
+    outputs: Tuple[str, ...]
+    artifacts: Tuple[str, ...]  # upstream artifacts in the work dir
+    externals: Tuple[str, ...]  # keys of external_inputs()
+    phase: str  # /ciso command that (re)generates the outputs
+    recipe: Optional[Recipe] = None
+
+
+# Topological order. The gap analysis sees the profile only through its tags;
+# that is what lets an edit that leaves the tags unchanged stop at entity-tags.json.
+RULES: Tuple[Rule, ...] = (
+    Rule(("entity-tags.json",), ("entity-profile.json",), ("resolver",), "/ciso start", _build_entity_tags),
+    Rule(
+        ("gap-analysis.json", "gap-analysis.md"),
+        ("entity-tags.json",),
+        ("framework", "policy-area-map"),
+        "/ciso assess",
+    ),
+    Rule(("policy-plan.md",), ("gap-analysis.json",), ("policy-area-map",), "/ciso policy"),
+    Rule(("roadmap.md",), ("gap-analysis.json", "policy-plan.md"), (), "/ciso roadmap"),
+)
+ARTIFACTS: Tuple[str, ...] = SOURCES + tuple(name for rule in RULES for name in rule.outputs)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def external_inputs() -> Dict[str, str]:
+    """Hashes of the non-artifact inputs rules can depend on."""
+    try:
+        version = json.loads(MAP_PATH.read_text(encoding="utf-8")).get("version")
+    except (OSError, ValueError, AttributeError):
+        version = None
+    return {
+        "resolver": _sha256(RESOLVER_PATH.read_bytes()),
+        "framework": load_index().digest,
+        "policy-area-map": f"version:{version}",
+    }
+
+
+# ---------------------------------------------------------------------------
+# Build records
+# ---------------------------------------------------------------------------
+
+
+def load_records(work_dir: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        data = json.loads((work_dir / GRAPH_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("format") != GRAPH_FORMAT:
+        return {}
+    artifacts = data.get("artifacts")
+    return artifacts if isinstance(artifacts, dict) else {}
+
+
+def save_records(work_dir: Path, records: Dict[str, Dict[str, Any]]) -> None:
+    payload = {"format": GRAPH_FORMAT, "artifacts": dict(sorted(records.items()))}
+    atomic_write(work_dir / GRAPH_FILE, (json.dumps(payload, indent=2) + "\n").encode("utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ArtifactStatus:
+    name: str
+    state: str  # source | fresh | rebuilt | absent (optional) | stale | missing | unrecorded
+    phase: str = ""
+    reasons: List[str] = field(default_factory=list)
+
+
+@dataclass
+class GraphReport:
+    artifacts: List[ArtifactStatus]
+    # Stale skill phases in chain order; only the first can run before the others' inputs settle.
+    handoff: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def clean(self) -> bool:
+        return all(status.state in ("source", "fresh", "rebuilt", "absent") for status in self.artifacts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "clean": self.clean,
+            "artifacts": [asdict(status) for status in self.artifacts],
+            "handoff": self.handoff,
+        }
+
+
+def _current_hashes(work_dir: Path) -> Dict[str, Optional[str]]:
+    hashes: Dict[str, Optional[str]] = {}
+    for name in ARTIFACTS:
+        path = artifact_path(work_dir, name)
+        hashes[name] = _sha256(path.read_bytes()) if path.exists() else None
+    return hashes
+
+
+def _input_hashes(
+    rule: Rule, hashes: Dict[str, Optional[str]], externals: Dict[str, str]
+) -> Dict[str, Optional[str]]:
+    inputs: Dict[str, Optional[str]] = {name: hashes[name] for name in rule.artifacts}
+    inputs.update((name, externals[name]) for name in rule.externals)
+    return inputs
+
+
+def evaluate(
+    work_dir: Path,
+    build: bool = False,
+    externals: Optional[Dict[str, str]] = None,
+) -> GraphReport:
+    """Classify every artifact; with ``build``, write stale deterministic outputs and record them.
+
+    Deterministic rules are always recomputed in memory when stale, so a
+    rebuild that reproduces the current content does not mark downstream
+    artifacts stale, with or without ``build``.
+    """
+    externals = externals if externals is not None else external_inputs()
+    records = load_records(work_dir)
+    disk = _current_hashes(work_dir)
+    # What each artifact will hash to once stale deterministic rules are rebuilt.
+    hashes = dict(disk)
+    pending: Dict[str, str] = {}  # stale skill artifact -> phase that regenerates it
+    statuses: List[ArtifactStatus] = [
+        ArtifactStatus(name, "source" if disk[name] else "missing") for name in SOURCES
+    ]
+    handoff: List[Dict[str, Any]] = []
+    records_changed = False
+
+    for rule in RULES:
+        inputs = _input_hashes(rule, hashes, externals)
+        reasons: List[str] = []
+        for name in rule.artifacts:
+            if name in pending:
+                reasons.append(f"upstream {name} is stale (regenerated by {pending[name]})")
+            elif hashes[name] is None and name in SOURCES:
+                reasons.append(f"source {name} is missing")
+
+        rule_statuses: List[ArtifactStatus] = []
+        for output in rule.outputs:
+            status = ArtifactStatus(output, "fresh", rule.phase, list(reasons))
+            record = records.get(output)
+            if disk[output] is None:
+                status.state = "absent" if output in OPTIONAL and not reasons else "missing"
+            elif not isinstance(record, dict):
+                status.state = "unrecorded"
+                status.reasons.append("no build record; run `record` once it is known to be current")
+            else:
+                recorded = record.get("inputs", {})
+                for name, digest in inputs.items():
+                    if recorded.get(name) != digest:
+                        status.reasons.append(f"{name} changed")
+                edited = record.get("output") != disk[output]
+                if edited and rule.recipe is not None:
+                    status.reasons.append("edited since it was built")
+                if status.reasons:
+                    status.state = "stale"
+                elif edited:
+                    # Hand edits to skill output are kept; downstream artifacts see the new hash.
+                    status.reasons.append("edited since it was recorded")
+            rule_statuses.append(status)
+
+        if all(status.state in ("fresh", "absent") for status in rule_statuses):
+            statuses.extend(rule_statuses)
+            continue
+
+        if rule.recipe is not None and not any(name in pending for name in rule.artifacts):
+            try:
+                built = rule.recipe(work_dir)
+            except (OSError, ValueError, ResolverError) as exc:
+                for status in rule_statuses:
+                    status.state = "stale"
+                    status.reasons.append(f"cannot rebuild: {exc}")
+                    pending[status.name] = rule.phase
+                statuses.extend(rule_statuses)
+                continue
+            for status in rule_statuses:
+                content = built[status.name]
+                digest = _sha256(content)
+                unchanged = digest == disk[status.name]
+                hashes[status.name] = digest
+                if build:
+                    if not unchanged:
+                        atomic_write(work_dir / status.name, content)
+                    records[status.name] = {"inputs": inputs, "output": digest}
+                    records_changed = True
+                    status.state = "rebuilt"
+                    status.reasons.append("rebuilt; content unchanged" if unchanged else "rebuilt")
+                elif unchanged:
+                    status.state = "stale"
+                    status.reasons.append("rebuild reproduces the current content; downstream unaffected")
+                else:
+                    status.state = "stale" if disk[status.name] else "missing"
+                    status.reasons.append("`build` regenerates it")
+            statuses.extend(rule_statuses)
+            continue
+
+        # Unrecorded artifacts are not known to be stale, so they neither block
+        # downstream artifacts nor get handed back; `record` adopts them.
+        stale = [status for status in rule_statuses if status.state in ("stale", "missing")]
+        for status in stale:
+            pending[status.name] = rule.phase
+        if stale:
+            handoff.append(
+                {
+                    "phase": rule.phase,
+                    "artifacts": [status.name for status in stale],
+                    "ready": not any(name in pending for name in rule.artifacts),
+                    "reasons": sorted({reason for status in stale for reason in status.reasons}),
+                }
+            )
+        statuses.extend(rule_statuses)
+
+    if records_changed:
+        save_records(work_dir, records)
+    return GraphReport(statuses, handoff)
+
+
+def record(
+    work_dir: Path,
+    names: Sequence[str] = (),
+    externals: Optional[Dict[str, str]] = None,
+) -> List[str]:
+    """Stamp artifacts with their current input hashes; all existing outputs when ``names`` is empty."""
+    outputs = {name: rule for rule in RULES for name in rule.outputs}
+    unknown = [name for name in names if name not in outputs]
+    if unknown:
+        raise ValueError(f"not a recordable artifact: {', '.join(unknown)} (choose from {', '.join(outputs)})")
+    externals = externals if externals is not None else external_inputs()
+    hashes = _current_hashes(work_dir)
+    records = load_records(work_dir)
+    stamped: List[str] = []
+    for name, rule in outputs.items():
+        if names and name not in names:
+            continue
+        if hashes[name] is None:
+            if names:
+                raise ValueError(f"cannot record missing artifact: {name}")
+            continue
+        records[name] = {"inputs": _input_hashes(rule, hashes, externals), "output": hashes[name]}
+        stamped.append(name)
+    save_records(work_dir, records)
+    return stamped
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def print_report(report: GraphReport) -> None:
+    labels = {
+        "source": "[PASS]",
+        "fresh": "[PASS]",
+        "rebuilt": "[PASS]",
+        "absent": "[PASS]",
+        "stale": "[STALE]",
+        "missing": "[WARN]",
+        "unrecorded": "[WARN]",
+    }
+    for status in report.artifacts:
+        detail = f" ({'; '.join(status.reasons)})" if status.reasons else ""
+        print(f"{labels[status.state]} {status.name}: {status.state}{detail}")
+    for step in report.handoff:
+        verb = "run" if step["ready"] else "then run"
+        print(f"[HANDOFF] {verb} `{step['phase']}` to regenerate {', '.join(step['artifacts'])}")
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Track /ciso workflow artifacts and recompute only the stale ones.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("mode", choices=["status", "build", "record"], help="What to do")
+    parser.add_argument("artifacts", nargs="*", help="record: artifacts to stamp (default: all present)")
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        help="Workflow artifact directory (default: the workspace root, or --workspace under it)",
+    )
+    parser.add_argument("--workspace", help="Entity workspace under the workspace root")
+    parser.add_argument(
+        "--workspace-root",
+        type=Path,
+        help=f"Workspace root (default: ${ROOT_ENV} or docs/.ciso-work)",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    return parser.parse_intermixed_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    if args.work_dir is not None and args.workspace:
+        fail("--work-dir and --workspace are mutually exclusive")
+        return 2
+    if args.work_dir is not None:
+        work_dir = args.work_dir.resolve()
+    else:
+        root = workspace_root(args.workspace_root)
+        try:
+            work_dir = select(root, [args.workspace])[0].path if args.workspace else root
+        except ValueError as exc:
+            fail(str(exc))
+            return 2
+    if not work_dir.is_dir():
+        fail(f"work directory does not exist: {work_dir}")
+        return 2
+
+    if args.mode == "record":
+        try:
+            with locked(work_dir):
+                stamped = record(work_dir, args.artifacts)
+        except (OSError, ValueError) as exc:
+            fail(str(exc))
+            return 2
+        ok(f"recorded {len(stamped)} artifact(s): {', '.join(stamped) or 'none'}")
+        return 0
+
+    if args.artifacts:
+        fail(f"{args.mode} takes no artifact names")
+        return 2
+    try:
+        with locked(work_dir, shared=args.mode == "status"):
+            report = evaluate(work_dir, build=args.mode == "build")
+    except OSError as exc:
+        fail(str(exc))
+        return 2
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+    else:
+        print_report(report)
+    return 0 if report.clean else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
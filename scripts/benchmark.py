@@ -0,0 +1,556 @@
+#!/usr/bin/env python3
+"""Benchmark suite for the parse, resolve, query and validate hot paths.
+
+Each benchmark runs at several input sizes on a seeded synthetic corpus
+(scripts/synthetic_corpus.py, generated once into .cache/bench-corpus/). It
+records the best and median wall time over --repeat runs, time per item,
+and peak traced memory from a separate tracemalloc run, so tracing overhead
+does not distort the timings. Results are written as JSON. `compare` flags
+benchmarks that got slower, or grew their peak memory, past a threshold
+relative to a saved baseline.
+
+Usage:
+    python3 scripts/benchmark.py list
+    python3 scripts/benchmark.py run --sizes 100,1000,10000 --save-baseline
+    python3 scripts/benchmark.py run --only ids_for_files --only resolve_tags --compare
+    python3 scripts/benchmark.py compare results/benchmarks/bench_2026-01-15T10-00-00Z.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import compliance_calendar
+import frontmatter
+import portfolio
+import synthetic_corpus
+import validate_ciso_outputs
+import validate_skill_functional_contracts
+from eval_skills_api import match_skill_from_prompt, match_skills_batch
+from resolve_entity_tags import ResolverError, resolve_tags
+
+ROOT = Path(__file__).resolve().parent.parent
+CORPUS_DIR = ROOT / ".cache/bench-corpus"
+RESULTS_DIR = ROOT / "results/benchmarks"
+BASELINE_PATH = RESULTS_DIR / "baseline.json"
+
+# Bump when benchmark inputs or the result layout change; compare refuses mixed versions.
+BENCHMARK_VERSION = 1
+
+DEFAULT_SIZES = [100, 1000, 10000]
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.20
+DEFAULT_MEMORY_THRESHOLD = 0.25
+# Ignore slowdowns smaller than this in absolute terms; sub-millisecond runs are mostly noise.
+MIN_DELTA_SECONDS = 0.002
+CORPUS_SEED = 1234
+
+
+def fail(message: str) -> None:
+    print(f"[FAIL] {message}")
+
+
+def ok(message: str) -> None:
+    print(f"[PASS] {message}")
+
+
+# ---------------------------------------------------------------------------
+# Inputs
+# ---------------------------------------------------------------------------
+
+
+class Corpus:
+    """Synthetic inputs, generated once for the largest requested size."""
+
+    def __init__(self, size: int) -> None:
+        manifest_path = CORPUS_DIR / synthetic_corpus.MANIFEST_NAME
+        wanted = {"profiles": size, "gap_rows": size, "policies": size, "trigger_cases": size}
+        manifest = None
+        if manifest_path.exists():
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        framework = synthetic_corpus.Framework()
+        if (
+            manifest is None
+            or manifest.get("version") != synthetic_corpus.CORPUS_VERSION
+            or manifest.get("seed") != CORPUS_SEED
+            or manifest.get("framework_digest") != validate_ciso_outputs.load_index().digest
+            or any(manifest.get("sizes", {}).get(key, 0) < value for key, value in wanted.items())
+        ):
+            synthetic_corpus.generate(CORPUS_DIR, CORPUS_SEED, size, size, size, size, 0.1)
+
+        self.framework = framework
+        self.policy_paths = sorted((CORPUS_DIR / "policies").glob("*/*.md"))
+        self.policy_texts = [path.read_text(encoding="utf-8") for path in self.policy_paths]
+        self.profiles = [
+            json.loads(line)
+            for line in (CORPUS_DIR / "profiles.jsonl").read_text(encoding="utf-8").splitlines()
+        ]
+        self.gap_rows = json.loads((CORPUS_DIR / "gap-analysis.json").read_text(encoding="utf-8"))
+        suite = json.loads((CORPUS_DIR / "trigger-tests.yaml").read_text(encoding="utf-8"))
+        self.prompts = [case["prompt"] for case in suite["cases"]]
+
+    def gap_file(self, size: int) -> Path:
+        path = CORPUS_DIR / f"gap-analysis-{size}.json"
+        if not path.exists():
+            path.write_text(json.dumps(self.gap_rows[:size]), encoding="utf-8")
+        return path
+
+    def checks(self, size: int) -> List[Dict[str, Any]]:
+        """run_check inputs cycling through the contract check types."""
+        checks: List[Dict[str, Any]] = []
+        gap_path = self.gap_file(min(size, 200)).relative_to(ROOT).as_posix()
+        for position in range(size):
+            policy = self.policy_paths[position % len(self.policy_paths)].relative_to(ROOT).as_posix()
+            kind = position % 4
+            if kind == 0:
+                checks.append({"type": "file_exists", "path": policy})
+            elif kind == 1:
+                checks.append(
+                    {
+                        "type": "frontmatter_keys",
+                        "path": policy,
+                        "keys": validate_ciso_outputs.REQUIRED_POLICY_KEYS,
+                    }
+                )
+            elif kind == 2:
+                checks.append(
+                    {
+                        "type": "contains_all",
+                        "path": policy,
+                        "patterns": [
+                            "^## Control Statements",
+                            r"\| CSCRF Ref \|",
+                            r"[A-Z]{2}\.[A-Z]{2}\.G\d+",
+                        ],
+                    }
+                )
+            else:
+                checks.append(
+                    {
+                        "type": "json_items_have_fields",
+                        "path": gap_path,
+                        "required_fields": sorted(validate_ciso_outputs.GAP_ROW_REQUIRED_FIELDS),
+                    }
+                )
+        return checks
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+# A benchmark's setup turns (corpus, size) into a zero-argument callable that
+# processes ``size`` items; only the callable is timed.
+Setup = Callable[[Corpus, int], Callable[[], Any]]
+
+
+def _parse_frontmatter(corpus: Corpus, size: int) -> Callable[[], Any]:
+    texts = corpus.policy_texts[:size]
+    return lambda: [frontmatter.parse_frontmatter(text) for text in texts]
+
+
+def _load_frontmatter_cached(corpus: Corpus, size: int) -> Callable[[], Any]:
+    paths = corpus.policy_paths[:size]
+    for path in paths:
+        frontmatter.load_frontmatter(path)
+    return lambda: [frontmatter.load_frontmatter(path) for path in paths]
+
+
+def _ids_for_files(corpus: Corpus, size: int) -> Callable[[], Any]:
+    # The framework index lookup behind validate_ciso_outputs.load_area_allowed_ids,
+    # one policy area's framework files per item.
+    index = validate_ciso_outputs.load_index()
+    areas = [
+        [rel for rel in area.get("framework_files", []) if isinstance(rel, str)]
+        for area in validate_ciso_outputs.load_json(validate_ciso_outputs.MAP_PATH)["areas"]
+    ]
+    files = [areas[position % len(areas)] for position in range(size)]
+    return lambda: [index.ids_for_files(rel_paths) for rel_paths in files]
+
+
+def _resolve_tags(corpus: Corpus, size: int) -> Callable[[], Any]:
+    profiles = corpus.profiles[:size]
+
+    def run() -> int:
+        resolved = 0
+        for profile in profiles:
+            try:
+                resolve_tags(profile)
+                resolved += 1
+            except ResolverError:
+                pass
+        return resolved
+
+    return run
+
+
+def _build_portfolio(corpus: Corpus, size: int) -> Callable[[], Any]:
+    inputs = [
+        portfolio.EntityInput(str(position), "bench", profile)
+        for position, profile in enumerate(corpus.profiles[:size])
+    ]
+    portfolio.build_portfolio(inputs[:1])  # load the index and engine outside the timed run
+    return lambda: portfolio.build_portfolio(inputs).guideline_counts()
+
+
+def _compliance_calendar(corpus: Corpus, size: int) -> Callable[[], Any]:
+    obligations = compliance_calendar.load_schedule()
+    as_of = compliance_calendar.date(2026, 6, 30)
+    records: List[compliance_calendar.EntityRecord] = []
+    for position, profile in enumerate(corpus.profiles[:size]):
+        try:
+            tags = resolve_tags(profile)["tags"]
+        except ResolverError:
+            continue
+        # Deterministic spread of last completions over the preceding year.
+        completed = {
+            obligation.id: as_of - compliance_calendar.timedelta(days=(position * 37 + offset * 11) % 365)
+            for offset, obligation in enumerate(obligations)
+        }
+        records.append(compliance_calendar.EntityRecord(str(position), tags, completed))
+
+    def run() -> int:
+        calendar = compliance_calendar.ComplianceCalendar(obligations)
+        for record in records:
+            calendar.add(record, as_of)
+        return len(calendar.overdue(as_of)) + len(calendar.upcoming(as_of, 30))
+
+    return run
+
+
+def _match_skill(corpus: Corpus, size: int) -> Callable[[], Any]:
+    prompts = corpus.prompts[:size]
+    return lambda: [match_skill_from_prompt(prompt, {}) for prompt in prompts]
+
+
+def _match_skills_batch(corpus: Corpus, size: int) -> Callable[[], Any]:
+    prompts = corpus.prompts[:size]
+    return lambda: match_skills_batch(prompts, {})
+
+
+def _validate_policy_file(corpus: Corpus, size: int) -> Callable[[], Any]:
+    paths = corpus.policy_paths[:size]
+    framework = corpus.framework
+
+    def run() -> int:
+        # Measure a cold parse; load_frontmatter_cached covers the memoized path.
+        frontmatter.clear_cache()
+        errors: List[str] = []
+        for path in paths:
+            validate_ciso_outputs.validate_policy_file(
+                path, framework.all_standards, framework.all_guidelines, framework.area_ids, errors
+            )
+        return len(errors)
+
+    return run
+
+
+def _validate_gap_analysis_json(corpus: Corpus, size: int) -> Callable[[], Any]:
+    path = corpus.gap_file(size)
+    known = corpus.framework.all_guidelines
+
+    def run() -> int:
+        errors: List[str] = []
+        validate_ciso_outputs.validate_gap_analysis_json(path, known, errors)
+        return len(errors)
+
+    return run
+
+
+def _run_check(corpus: Corpus, size: int) -> Callable[[], Any]:
+    checks = corpus.checks(size)
+
+    def run() -> int:
+        frontmatter.clear_cache()
+        errors: List[str] = []
+        for position, check in enumerate(checks):
+            validate_skill_functional_contracts.run_check(check, errors, f"check[{position}]")
+        return len(errors)
+
+    return run
+
+
+def _execute_plan(corpus: Corpus, size: int) -> Callable[[], Any]:
+    checks = corpus.checks(size)
+
+    def run() -> int:
+        plan = validate_skill_functional_contracts.ExecutionPlan()
+        for position, check in enumerate(checks):
+            plan.add_check((0, position), f"check[{position}]", check)
+        return len(validate_skill_functional_contracts.execute_plan(plan))
+
+    return run
+
+
+BENCHMARKS: Dict[str, Setup] = {
+    "parse_frontmatter": _parse_frontmatter,
+    "load_frontmatter_cached": _load_frontmatter_cached,
+    "ids_for_files": _ids_for_files,
+    "resolve_tags": _resolve_tags,
+    "build_portfolio": _build_portfolio,
+    "compliance_calendar": _compliance_calendar,
+    "match_skill_from_prompt": _match_skill,
+    "match_skills_batch": _match_skills_batch,
+    "validate_policy_file": _validate_policy_file,
+    "validate_gap_analysis_json": _validate_gap_analysis_json,
+    "run_check": _run_check,
+    "execute_plan": _execute_plan,
+}
+
+
+@dataclass
+class BenchmarkResult:
+    benchmark: str
+    size: int
+    min_s: float
+    median_s: float
+    per_item_us: float
+    peak_kib: float
+
+
+def measure(run: Callable[[], Any], repeat: int) -> Tuple[float, float, float]:
+    """Return (best seconds, median seconds, peak KiB) for ``run``."""
+    run()  # warm caches (compiled regexes, keyword matcher, framework index)
+    timings: List[float] = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(timings), statistics.median(timings), peak / 1024
+
+
+def run_benchmarks(names: Sequence[str], sizes: Sequence[int], repeat: int) -> List[BenchmarkResult]:
+    corpus = Corpus(max(sizes))
+    results: List[BenchmarkResult] = []
+    for name in names:
+        for size in sizes:
+            best, median, peak_kib = measure(BENCHMARKS[name](corpus, size), repeat)
+            result = BenchmarkResult(
+                benchmark=name,
+                size=size,
+                min_s=round(best, 6),
+                median_s=round(median, 6),
+                per_item_us=round(best / size * 1e6, 3),
+                peak_kib=round(peak_kib, 1),
+            )
+            results.append(result)
+            print(
+                f"  {name:<54} n={size:<7} min={best * 1000:9.2f}ms  "
+                f"median={median * 1000:9.2f}ms  {result.per_item_us:9.2f}us/item  "
+                f"peak={peak_kib:9.1f}KiB"
+            )
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Results and comparison
+# ---------------------------------------------------------------------------
+
+
+def _git_commit() -> str:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return ""
+    return completed.stdout.strip() if completed.returncode == 0 else ""
+
+
+def save_results(results: List[BenchmarkResult], repeat: int, path: Path) -> Dict[str, Any]:
+    data = {
+        "version": BENCHMARK_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "repeat": repeat,
+        "results": [asdict(result) for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    return data
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        raise ValueError(f"benchmark results not found: {path}") from exc
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"invalid benchmark results {path}: {exc}") from exc
+    if data.get("version") != BENCHMARK_VERSION:
+        raise ValueError(f"{path} has benchmark version {data.get('version')}, expected {BENCHMARK_VERSION}")
+    return data
+
+
+def compare_results(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+) -> int:
+    """Print a side-by-side table; return the number of regressions."""
+    previous = {(row["benchmark"], row["size"]): row for row in baseline["results"]}
+    print(
+        f"Baseline: {baseline.get('timestamp', '?')} ({baseline.get('commit') or 'unknown commit'})  "
+        f"Current: {current.get('timestamp', '?')} ({current.get('commit') or 'unknown commit'})"
+    )
+    regressions = 0
+    for row in current["results"]:
+        key = (row["benchmark"], row["size"])
+        before = previous.get(key)
+        if before is None:
+            print(f"  {row['benchmark']:<54} n={row['size']:<7} (no baseline)")
+            continue
+        time_ratio = row["min_s"] / before["min_s"] if before["min_s"] else 1.0
+        memory_ratio = row["peak_kib"] / before["peak_kib"] if before["peak_kib"] else 1.0
+        flags: List[str] = []
+        if time_ratio > 1 + threshold and row["min_s"] - before["min_s"] > MIN_DELTA_SECONDS:
+            flags.append("SLOWER")
+        if memory_ratio > 1 + memory_threshold:
+            flags.append("MORE MEMORY")
+        if flags:
+            regressions += 1
+        print(
+            f"  {row['benchmark']:<54} n={row['size']:<7} "
+            f"time x{time_ratio:5.2f} ({before['min_s'] * 1000:.2f} -> {row['min_s'] * 1000:.2f}ms)  "
+            f"peak x{memory_ratio:5.2f}  {' '.join(flags)}"
+        )
+    return regressions
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the CSCRF parse, resolve, query and validate hot paths.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("mode", choices=["run", "compare", "list"], help="What to do")
+    parser.add_argument("results", nargs="?", type=Path, help="compare: results file (default: latest)")
+    parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help=f"Comma-separated input sizes (default: {','.join(str(size) for size in DEFAULT_SIZES)})",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=sorted(BENCHMARKS),
+        metavar="NAME",
+        help="Run only this benchmark; repeat for several (see `list`)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT, help=f"Timed runs per size (default: {DEFAULT_REPEAT})"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help=f"Results file (default: {RESULTS_DIR.relative_to(ROOT)}/bench_<timestamp>.json)",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=BASELINE_PATH,
+        help=f"Baseline results (default: {BASELINE_PATH.relative_to(ROOT)})",
+    )
+    parser.add_argument("--save-baseline", action="store_true", help="run: also write results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="run: compare against the baseline afterwards")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Relative slowdown that counts as a regression (default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=DEFAULT_MEMORY_THRESHOLD,
+        help=f"Relative peak-memory growth that counts as a regression (default: {DEFAULT_MEMORY_THRESHOLD})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+
+    if args.mode == "list":
+        for name in BENCHMARKS:
+            print(name)
+        return 0
+
+    try:
+        if args.mode == "run":
+            sizes = sorted({int(size) for size in args.sizes.split(",") if size.strip()})
+            if not sizes or sizes[0] <= 0 or args.repeat <= 0:
+                print("ERROR: --sizes and --repeat must be positive", file=sys.stderr)
+                return 2
+            names = args.only or list(BENCHMARKS)
+            print(f"Running {len(names)} benchmark(s) at sizes {sizes}, repeat={args.repeat}")
+            results = run_benchmarks(names, sizes, args.repeat)
+            timestamp = time.strftime("%Y-%m-%dT%H-%M-%SZ", time.gmtime())
+            output = args.output or RESULTS_DIR / f"bench_{timestamp}.json"
+            current = save_results(results, args.repeat, output)
+            ok(f"Wrote {output}")
+            if args.save_baseline:
+                save_results(results, args.repeat, args.baseline)
+                ok(f"Saved baseline {args.baseline}")
+                return 0
+            if not args.compare:
+                return 0
+        else:
+            path = args.results
+            if path is None:
+                candidates = sorted(RESULTS_DIR.glob("bench_*.json"))
+                if not candidates:
+                    raise ValueError(f"no results in {RESULTS_DIR}; run the benchmarks first")
+                path = candidates[-1]
+            current = load_results(path)
+
+        regressions = compare_results(
+            current, load_results(args.baseline), args.threshold, args.memory_threshold
+        )
+    except (OSError, ValueError) as exc:
+        fail(str(exc))
+        return 2
+
+    if regressions:
+        fail(f"{regressions} benchmark(s) regressed against {args.baseline}")
+        return 1
+    ok("No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""Compliance calendar from the CSCRF Table 15 periodicities.
+
+meta/compliance.md Table 15 lists the periodic obligations: a standard
+reference, the REs it applies to and a periodicity. This module parses the
+table into a structured schedule. Each row becomes one obligation (e.g.
+"7a" for MIIs and Qualified REs, "7b" for the others) with:
+
+- the canonical category tags it applies to, plus any required conditional
+  tag (third-party-soc for "Other REs who are utilizing third-party managed
+  SOC");
+- a cadence of 3, 6 or 12 months, or "within N days of completion" of the
+  obligations in another point (CCI evidence submission follows the CCI
+  assessment).
+
+Given an entity's resolved tags and last completion dates, the calendar
+computes the next due date of every applicable obligation. Applicable
+obligations are resolved once per tag set, as in portfolio.py. All
+occurrences across the portfolio are kept in one array sorted by due date,
+so "overdue" and "due in the next 30 days" are two binary searches plus the
+matching slice, however many entities there are.
+
+Entity records are JSONL, one entity per line: an id, either "tags" or the
+profile fields resolve_entity_tags.py accepts, and optionally "completed"
+(last completion date per obligation) and "since" (the date obligations
+with no recorded completion fall due, default the --as-of date).
+Completion keys may be an obligation ID ("7b"), a point number ("7", when
+one of its rows applies) or a standard ID ("PR.AA.S5", when one applicable
+obligation cites it):
+
+    {"id": "acme", "entity_type": "stock-broker", "category": "mid-size",
+     "third_party_soc": true, "completed": {"7": "2026-05-02", "GV.PO.S2": "2025-11-30"}}
+
+Usage:
+    python3 scripts/compliance_calendar.py schedule
+    python3 scripts/compliance_calendar.py due --entities entities.jsonl
+    python3 scripts/compliance_calendar.py due --entities entities.jsonl --within 90 --as-of 2026-12-31 --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import calendar
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import IO, Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from applicability_query import CANONICAL_TAGS, tag_mask
+from framework_index import load_index
+from resolve_entity_tags import ResolverError, iter_profiles, resolve_tags
+
+ROOT = Path(__file__).resolve().parent.parent
+COMPLIANCE_PATH = ROOT / "meta/compliance.md"
+TABLE_TITLE = "Table 15:"
+
+PERIOD_MONTHS = {"quarterly": 3, "half-yearly": 6, "annually": 12}
+WITHIN_RE = re.compile(r"^within\s+(\d+)\s+days\s+of\s+completion\s+of\s+(.+)$", re.IGNORECASE)
+POINT_RE = re.compile(r"\bpoints?\s+(\d+(?:\s*(?:,|and)\s*\d+)*)", re.IGNORECASE)
+REF_RE = re.compile(r"\b[A-Z]{2}\.[A-Z]{2}(?:\.S\d+)?\b")
+
+# Audience phrases, matched against the lower-cased Applicability cell.
+CATEGORY_TERMS = (
+    ("mii", re.compile(r"\bmiis?\b")),
+    ("qualified", re.compile(r"\bqualified\b")),
+    ("mid-size", re.compile(r"\bmid-size\b")),
+    ("small-size", re.compile(r"\bsmall-size\b")),
+    ("self-certification", re.compile(r"\bself-certification\b")),
+)
+CONDITION_TERMS = (("third-party-soc", re.compile(r"third-party managed soc|market soc")),)
+
+
+def ok(message: str) -> None:
+    print(f"[PASS] {message}")
+
+
+def fail(message: str) -> None:
+    print(f"[FAIL] {message}")
+
+
+class ScheduleError(Exception):
+    """Raised when Table 15 cannot be parsed into a schedule."""
+
+
+# ---------------------------------------------------------------------------
+# Schedule
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Obligation:
+    id: str
+    point: str
+    text: str
+    refs: Tuple[str, ...]
+    audience: str
+    categories: FrozenSet[str]
+    requires: FrozenSet[str]
+    periodicity: str
+    months: Optional[int] = None
+    within_days: Optional[int] = None
+    after_points: Tuple[str, ...] = ()
+
+    @property
+    def cadence(self) -> str:
+        if self.months is not None:
+            return self.periodicity.lower()
+        return f"within {self.within_days} days of point {' and '.join(self.after_points)}"
+
+    def applies(self, tags: Iterable[str]) -> bool:
+        tag_set = set(tags)
+        return bool(self.categories & tag_set) and self.requires <= tag_set
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "point": self.point,
+            "text": self.text,
+            "refs": list(self.refs),
+            "audience": self.audience,
+            "categories": [tag for tag in CANONICAL_TAGS if tag in self.categories],
+            "requires": sorted(self.requires),
+            "periodicity": self.periodicity,
+            "months": self.months,
+            "within_days": self.within_days,
+            "after_points": list(self.after_points),
+        }
+
+
+def _table_rows(text: str) -> List[List[str]]:
+    lines = text.splitlines()
+    try:
+        start = next(i for i, line in enumerate(lines) if TABLE_TITLE in line)
+    except StopIteration:
+        raise ScheduleError(f"{TABLE_TITLE} not found") from None
+    rows: List[List[str]] = []
+    in_table = False
+    for line in lines[start + 1:]:
+        stripped = line.strip()
+        if not stripped.startswith("|"):
+            if in_table:
+                break
+            continue
+        in_table = True
+        cells = [cell.strip() for cell in stripped.strip("|").split("|")]
+        if cells[0].startswith("S. No") or re.fullmatch(r"[-: ]+", cells[0]):
+            continue
+        if len(cells) != 4:
+            raise ScheduleError(f"expected 4 columns, got {len(cells)}: {stripped}")
+        rows.append(cells)
+    if not rows:
+        raise ScheduleError(f"{TABLE_TITLE} has no rows")
+    return rows
+
+
+def _audience(cell: str, covered: FrozenSet[str]) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """(category tags, required conditional tags) for an Applicability cell.
+
+    ``covered`` holds the categories of earlier rows of the same point, which
+    "Other REs" excludes.
+    """
+    lowered = cell.lower()
+    named = frozenset(tag for tag, pattern in CATEGORY_TERMS if pattern.search(lowered))
+    requires = frozenset(tag for tag, pattern in CONDITION_TERMS if pattern.search(lowered))
+    if lowered.startswith("all res"):
+        excluded = named if "except" in lowered else frozenset()
+        categories = frozenset(CANONICAL_TAGS) - excluded
+    elif lowered.startswith("other res"):
+        categories = frozenset(CANONICAL_TAGS) - covered
+    else:
+        categories = named
+    if not categories:
+        raise ScheduleError(f"unrecognised applicability: {cell!r}")
+    return categories, requires
+
+
+def parse_schedule(text: str) -> List[Obligation]:
+    """Parse Table 15 into obligations, one per table row."""
+    obligations: List[Obligation] = []
+    point = obligation_text = ""
+    covered: FrozenSet[str] = frozenset()
+    suffix = 0
+    rows = _table_rows(text)
+    for position, (number, standard, applicability, periodicity) in enumerate(rows):
+        if number:
+            point, obligation_text, covered, suffix = number, standard, frozenset(), 0
+        elif standard:
+            obligation_text, covered = standard, frozenset()
+        if not point or not obligation_text:
+            raise ScheduleError(f"row without a point or standard: {rows[position]}")
+        categories, requires = _audience(applicability, covered)
+        covered |= categories
+
+        # Points with several rows get a, b, ... suffixes; single-row points keep the number.
+        following = rows[position + 1][0] if position + 1 < len(rows) else "next"
+        multi = suffix > 0 or not following
+        obligation_id = f"{point}{chr(ord('a') + suffix)}" if multi else point
+        suffix += 1
+
+        months = within_days = None
+        after: Tuple[str, ...] = ()
+        period = periodicity.lower()
+        within = WITHIN_RE.match(periodicity)
+        if period in PERIOD_MONTHS:
+            months = PERIOD_MONTHS[period]
+        elif within:
+            within_days = int(within.group(1))
+            referenced = POINT_RE.search(within.group(2))
+            numbers = re.findall(r"\d+", referenced.group(1)) if referenced else []
+            after = tuple(n for n in numbers if n != point)
+            if not after:
+                raise ScheduleError(f"point {point}: cannot tell which point {periodicity!r} follows")
+        else:
+            raise ScheduleError(f"point {point}: unrecognised periodicity {periodicity!r}")
+
+        obligations.append(
+            Obligation(
+                id=obligation_id,
+                point=point,
+                text=obligation_text.replace("*", ""),
+                refs=tuple(dict.fromkeys(REF_RE.findall(obligation_text))),
+                audience=applicability,
+                categories=categories,
+                requires=requires,
+                periodicity=periodicity,
+                months=months,
+                within_days=within_days,
+                after_points=after,
+            )
+        )
+    return obligations
+
+
+def load_schedule(path: Path = COMPLIANCE_PATH) -> List[Obligation]:
+    return parse_schedule(path.read_text(encoding="utf-8"))
+
+
+def check_schedule(obligations: Sequence[Obligation]) -> List[str]:
+    """Cross-check the schedule against the framework index; returns error strings."""
+    index = load_index()
+    standards = index.standard_ids
+    areas = {standard_id.rsplit(".", 1)[0] for standard_id in standards}
+    points = {obligation.point for obligation in obligations}
+    errors: List[str] = []
+    for obligation in obligations:
+        if not obligation.refs:
+            errors.append(f"{obligation.id}: no standard reference in {obligation.text!r}")
+        for ref in obligation.refs:
+            if ref not in standards and ref not in areas:
+                errors.append(f"{obligation.id}: unknown standard reference {ref}")
+        for after in obligation.after_points:
+            if after not in points:
+                errors.append(f"{obligation.id}: follows unknown point {after}")
+    return errors
+
+
+# ---------------------------------------------------------------------------
+# Calendar
+# ---------------------------------------------------------------------------
+
+def add_months(day: date, months: int) -> date:
+    """Same day ``months`` later, clamped to the end of shorter months."""
+    year, month = divmod(day.month - 1 + months, 12)
+    year += day.year
+    month += 1
+    if day.day <= 28:
+        return date(year, month, day.day)
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+@dataclass
+class Occurrence:
+    due: date
+    entity: str
+    obligation: Obligation
+    last_completed: Optional[date]
+
+    def to_dict(self, as_of: date) -> Dict[str, Any]:
+        return {
+            "due": self.due.isoformat(),
+            "days": (self.due - as_of).days,
+            "entity": self.entity,
+            "obligation": self.obligation.id,
+            "refs": list(self.obligation.refs),
+            "text": self.obligation.text,
+            "periodicity": self.obligation.periodicity,
+            "last_completed": self.last_completed.isoformat() if self.last_completed else None,
+        }
+
+
+@dataclass
+class EntityRecord:
+    entity: str
+    tags: List[str]
+    completed: Dict[str, date] = field(default_factory=dict)
+    since: Optional[date] = None
+
+
+def _matches(obligation: Obligation, key: str) -> bool:
+    return key in (obligation.id, obligation.point) or key in obligation.refs
+
+
+def _occurrence_order(occurrence: Occurrence) -> Tuple[date, str, int, str]:
+    return occurrence.due, occurrence.entity, int(occurrence.obligation.point), occurrence.obligation.id
+
+
+class ComplianceCalendar:
+    """Next due date of every applicable obligation, indexed by due date."""
+
+    def __init__(self, obligations: Sequence[Obligation]) -> None:
+        self.obligations = list(obligations)
+        self._applicable: Dict[int, List[Obligation]] = {}
+        self._plans: Dict[int, Tuple[List[Obligation], List[Tuple[Obligation, List[Obligation]]]]] = {}
+        self._occurrences: List[Occurrence] = []
+        self._due: List[int] = []
+        self._sorted = True
+
+    def applicable(self, tags: Sequence[str]) -> List[Obligation]:
+        """Obligations for a tag set, computed once per distinct tag mask."""
+        mask = tag_mask(tags)
+        found = self._applicable.get(mask)
+        if found is None:
+            found = self._applicable[mask] = [item for item in self.obligations if item.applies(tags)]
+        return found
+
+    def _plan(self, tags: Sequence[str]) -> Tuple[List[Obligation], List[Tuple[Obligation, List[Obligation]]]]:
+        """(periodic obligations, [(dependent obligation, its triggers)]) for a tag set."""
+        mask = tag_mask(tags)
+        plan = self._plans.get(mask)
+        if plan is None:
+            obligations = self.applicable(tags)
+            periodic = [item for item in obligations if item.months is not None]
+            dependent: List[Tuple[Obligation, List[Obligation]]] = []
+            for obligation in obligations:
+                if obligation.within_days is None:
+                    continue
+                triggers = [item for item in periodic if item.point in obligation.after_points]
+                if triggers:
+                    dependent.append((obligation, triggers))
+            plan = self._plans[mask] = (periodic, dependent)
+        return plan
+
+    def resolve_completions(self, obligations: Sequence[Obligation], completed: Dict[str, Any]) -> Dict[str, date]:
+        """Map completion keys (ID, point number or standard ID) to obligation IDs.
+
+        Keys for obligations that do not apply to the entity are ignored, so one
+        spreadsheet layout can serve every entity. Raises ValueError for an
+        unknown or ambiguous key, or an invalid date.
+        """
+        resolved: Dict[str, date] = {}
+        for key, value in completed.items():
+            matches = [item for item in obligations if _matches(item, key)]
+            if not matches and any(_matches(item, key) for item in self.obligations):
+                continue
+            if len(matches) != 1:
+                problem = "is not in the schedule" if not matches else "is ambiguous"
+                raise ValueError(f"completion key {key!r} {problem}")
+            try:
+                resolved[matches[0].id] = date.fromisoformat(str(value))
+            except ValueError:
+                raise ValueError(f"completion {key!r} has invalid date {value!r}") from None
+        return resolved
+
+    def add(self, record: EntityRecord, default_since: date) -> int:
+        """Schedule the entity's applicable obligations; returns how many were added."""
+        periodic, dependent = self._plan(record.tags)
+        completed = record.completed
+        since = record.since or default_since
+        entity = record.entity
+        occurrences = self._occurrences
+        due_by_id: Dict[str, date] = {}
+        for obligation in periodic:
+            last = completed.get(obligation.id)
+            due = due_by_id[obligation.id] = add_months(last, obligation.months) if last else since
+            occurrences.append(Occurrence(due, entity, obligation, last))
+        for obligation, triggers in dependent:
+            last = completed.get(obligation.id)
+            trigger_last = max(
+                (completed[item.id] for item in triggers if item.id in completed), default=None
+            )
+            if trigger_last and (last is None or last < trigger_last):
+                # The trigger completed since the last submission: the submission is pending.
+                due = trigger_last + timedelta(days=obligation.within_days)
+            else:
+                due = min(due_by_id[item.id] for item in triggers) + timedelta(days=obligation.within_days)
+            occurrences.append(Occurrence(due, entity, obligation, last))
+        self._sorted = False
+        return len(periodic) + len(dependent)
+
+    def _index(self) -> None:
+        if not self._sorted:
+            self._occurrences.sort(key=_occurrence_order)
+            self._due = [item.due.toordinal() for item in self._occurrences]
+            self._sorted = True
+
+    def __len__(self) -> int:
+        return len(self._occurrences)
+
+    def between(self, start: Optional[date], end: date) -> List[Occurrence]:
+        """Occurrences due on or after ``start`` (None: from the beginning) and before ``end``."""
+        self._index()
+        low = 0 if start is None else bisect.bisect_left(self._due, start.toordinal())
+        high = bisect.bisect_left(self._due, end.toordinal())
+        return self._occurrences[low:high]
+
+    def overdue(self, as_of: date) -> List[Occurrence]:
+        return self.between(None, as_of)
+
+    def upcoming(self, as_of: date, days: int) -> List[Occurrence]:
+        """Due from ``as_of`` through the next ``days`` days, inclusive."""
+        return self.between(as_of, as_of + timedelta(days=days + 1))
+
+
+# ---------------------------------------------------------------------------
+# Inputs
+# ---------------------------------------------------------------------------
+
+def _parse_date(value: Any, label: str) -> Optional[date]:
+    if value in (None, ""):
+        return None
+    try:
+        return date.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"invalid {label} date {value!r}") from None
+
+
+def entity_record(calendar_: ComplianceCalendar, data: Any, fallback: str) -> EntityRecord:
+    """Build an EntityRecord from one JSONL object; raises ResolverError or ValueError."""
+    if isinstance(data, ResolverError):
+        raise data
+    if not isinstance(data, dict):
+        raise ValueError("entity record must be a JSON object")
+    entity = str(data.get("id") or data.get("name") or fallback)
+    tags = data.get("tags")
+    if tags is None:
+        tags = resolve_tags(data)["tags"]
+    elif not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+        raise ValueError("tags must be a list of strings")
+    completed = data.get("completed") or {}
+    if not isinstance(completed, dict):
+        raise ValueError("completed must be an object of key -> date")
+    resolved = calendar_.resolve_completions(calendar_.applicable(tags), completed)
+    return EntityRecord(entity, list(tags), resolved, _parse_date(data.get("since"), "since"))
+
+
+def load_entities(
+    calendar_: ComplianceCalendar, stream: IO[str], label: str, default_since: date
+) -> Iterator[Tuple[str, str]]:
+    """Schedule every entity in a JSONL stream; yields (source, error) for records that fail."""
+    for number, data in iter_profiles(stream, "jsonl"):
+        try:
+            record = entity_record(calendar_, data, f"record {number}")
+        except (ResolverError, ValueError) as exc:
+            yield f"{label}:{number}", str(exc)
+            continue
+        calendar_.add(record, default_since)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def print_schedule(obligations: Sequence[Obligation]) -> None:
+    for obligation in obligations:
+        audience = ", ".join(tag for tag in CANONICAL_TAGS if tag in obligation.categories)
+        if obligation.requires:
+            audience += f" (+{', '.join(sorted(obligation.requires))})"
+        print(f"  {obligation.id:<4} {', '.join(obligation.refs):<9} {obligation.cadence:<26} {audience}")
+
+
+def print_occurrences(title: str, occurrences: Sequence[Occurrence], as_of: date, limit: int) -> None:
+    print(f"{title} ({len(occurrences)}):")
+    shown = occurrences if limit <= 0 else occurrences[:limit]
+    for occurrence in shown:
+        days = (occurrence.due - as_of).days
+        when = f"{-days} days overdue" if days < 0 else ("due today" if days == 0 else f"in {days} days")
+        refs = ", ".join(occurrence.obligation.refs)
+        print(
+            f"  {occurrence.due.isoformat()}  {occurrence.entity}  {occurrence.obligation.id} {refs}: "
+            f"{occurrence.obligation.text} ({occurrence.obligation.cadence}; {when})"
+        )
+    if len(shown) < len(occurrences):
+        print(f"  ... {len(occurrences) - len(shown)} more (--limit 0 to list all)")
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("mode", choices=["schedule", "due"], help="Print the schedule or compute due obligations")
+    parser.add_argument("--source", type=Path, default=COMPLIANCE_PATH, help="Markdown file holding Table 15")
+    parser.add_argument("--entities", type=Path, help="due: JSONL entity records ('-' for stdin)")
+    parser.add_argument("--as-of", type=date.fromisoformat, default=date.today(), help="Reference date (default: today)")
+    parser.add_argument("--within", type=int, default=30, help="due: upcoming window in days (default: 30)")
+    parser.add_argument("--limit", type=int, default=20, help="due: rows printed per section (0: all)")
+    parser.add_argument("--json", action="store_true", help="Print JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    try:
+        obligations = load_schedule(args.source)
+    except (OSError, ScheduleError) as exc:
+        fail(f"cannot parse {TABLE_TITLE.rstrip(':')}: {exc}")
+        return 2
+
+    if args.mode == "schedule":
+        errors = check_schedule(obligations)
+        if args.json:
+            print(json.dumps([obligation.to_dict() for obligation in obligations], indent=2))
+        else:
+            ok(f"Parsed {len(obligations)} obligation(s) from {TABLE_TITLE.rstrip(':')}")
+            print_schedule(obligations)
+        for error in errors:
+            fail(error)
+        return 1 if errors else 0
+
+    if args.entities is None:
+        fail("due needs --entities FILE")
+        return 2
+    calendar_ = ComplianceCalendar(obligations)
+    try:
+        stream = sys.stdin if str(args.entities) == "-" else open(args.entities, encoding="utf-8")
+    except OSError as exc:
+        fail(f"cannot read entities: {exc}")
+        return 2
+    try:
+        errors = list(load_entities(calendar_, stream, str(args.entities), args.as_of))
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+    overdue = calendar_.overdue(args.as_of)
+    upcoming = calendar_.upcoming(args.as_of, args.within)
+    if args.json:
+        print(
+            json.dumps(
+                {
+                    "as_of": args.as_of.isoformat(),
+                    "within_days": args.within,
+                    "scheduled": len(calendar_),
+                    "overdue": [item.to_dict(args.as_of) for item in overdue],
+                    "upcoming": [item.to_dict(args.as_of) for item in upcoming],
+                    "errors": [{"source": source, "error": error} for source, error in errors],
+                },
+                indent=2,
+            )
+        )
+    else:
+        ok(f"Scheduled {len(calendar_)} obligation(s) as of {args.as_of.isoformat()}")
+        print_occurrences("Overdue", overdue, args.as_of, args.limit)
+        print_occurrences(f"Due in the next {args.within} days", upcoming, args.as_of, args.limit)
+        for source, error in errors:
+            fail(f"{source}: {error}")
+    return 2 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
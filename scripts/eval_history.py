@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+"""
+SQLite history of Skills API evaluation runs, with regression detection.
+
+Every report saved by eval_skills_api.py is indexed into
+<results-dir>/history.sqlite: one row per run with its aggregate metrics and
+one row per trigger/functional case. compare_runs() diffs a run against a
+baseline run or a rolling window of earlier runs and flags regressions that
+are statistically significant (and, for latency and tokens, larger than a
+minimum relative change):
+
+    trigger accuracy, functional pass rate   one-sided two-proportion z-test
+    median latency, TTFT, token usage        one-sided Mann-Whitney U test
+    p90/p99 latency                          one-sided bootstrap test
+
+Usage:
+    uv run scripts/eval_skills_api.py compare                  # latest vs previous 5 runs
+    uv run scripts/eval_skills_api.py compare --baseline 12    # latest vs run 12
+    uv run scripts/eval_history.py --list
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import sqlite3
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Sequence
+
+HISTORY_FILENAME = "history.sqlite"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    report_path TEXT UNIQUE,
+    trigger_accuracy REAL,
+    functional_pass_rate REAL,
+    avg_token_usage REAL,
+    tokens_per_second REAL,
+    latency_p50 REAL,
+    latency_p90 REAL,
+    latency_p99 REAL,
+    ttft_p50 REAL,
+    ttft_p90 REAL,
+    ttft_p99 REAL
+);
+CREATE TABLE IF NOT EXISTS cases (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    test_id TEXT NOT NULL,
+    skill TEXT,
+    passed INTEGER NOT NULL,
+    error INTEGER NOT NULL DEFAULT 0,
+    duration_ms INTEGER,
+    ttft_ms INTEGER,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    token_usage INTEGER,
+    tool_calls INTEGER
+);
+CREATE INDEX IF NOT EXISTS cases_run ON cases(run_id, kind);
+"""
+
+DEFAULT_WINDOW = 5
+DEFAULT_ALPHA = 0.05
+DEFAULT_MIN_CHANGE = 0.10
+BOOTSTRAP_RESAMPLES = 2000
+
+
+# ---------------------------------------------------------------------------
+# Store
+# ---------------------------------------------------------------------------
+
+class HistoryStore:
+    """Run and case history for one results directory."""
+
+    def __init__(self, results_dir: Path):
+        results_dir.mkdir(parents=True, exist_ok=True)
+        self.path = results_dir / HISTORY_FILENAME
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "HistoryStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def record(self, data: dict, report_path: Optional[Path] = None) -> int:
+        """Index one report (the dict form of SuiteReport). Returns the run id."""
+        key = str(report_path) if report_path else None
+        if key:
+            row = self.conn.execute("SELECT id FROM runs WHERE report_path = ?", (key,)).fetchone()
+            if row:
+                return row["id"]
+
+        latency = data.get("latency_ms") or {}
+        ttft = data.get("ttft_ms") or {}
+        with self.conn:
+            cursor = self.conn.execute(
+                """
+                INSERT INTO runs (
+                    timestamp, mode, report_path, trigger_accuracy, functional_pass_rate,
+                    avg_token_usage, tokens_per_second, latency_p50, latency_p90, latency_p99,
+                    ttft_p50, ttft_p90, ttft_p99
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    data.get("timestamp", ""),
+                    data.get("mode", ""),
+                    key,
+                    data.get("trigger_accuracy") if data.get("trigger_results") else None,
+                    data.get("functional_pass_rate") if data.get("functional_results") else None,
+                    data.get("avg_token_usage"),
+                    data.get("tokens_per_second"),
+                    latency.get("p50"),
+                    latency.get("p90"),
+                    latency.get("p99"),
+                    ttft.get("p50"),
+                    ttft.get("p90"),
+                    ttft.get("p99"),
+                ),
+            )
+            run_id = cursor.lastrowid
+            rows = [
+                (run_id, "trigger", r.get("test_id", ""), r.get("expected_skill"),
+                 int(bool(r.get("passed"))), 0, None, None, None, None, None, None)
+                for r in data.get("trigger_results", [])
+            ]
+            rows += [
+                (run_id, "functional", r.get("test_id", ""), r.get("skill"),
+                 int(bool(r.get("passed"))), int(bool(r.get("error"))),
+                 r.get("duration_ms"), r.get("ttft_ms"), r.get("input_tokens"),
+                 r.get("output_tokens"), r.get("token_usage"), r.get("tool_calls"))
+                for r in data.get("functional_results", [])
+            ]
+            self.conn.executemany(
+                "INSERT INTO cases VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        return run_id
+
+    def import_reports(self, results_dir: Path) -> int:
+        """Index saved eval_*.json reports that are not in the store yet."""
+        known = {row[0] for row in self.conn.execute("SELECT report_path FROM runs")}
+        imported = 0
+        for path in sorted(results_dir.glob("eval_*.json")):
+            if str(path) in known:
+                continue
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            self.record(data, path)
+            imported += 1
+        return imported
+
+    def runs(self, limit: Optional[int] = None) -> list[sqlite3.Row]:
+        sql = "SELECT * FROM runs ORDER BY timestamp DESC, id DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        return self.conn.execute(sql).fetchall()
+
+    def run(self, run_id: int) -> Optional[sqlite3.Row]:
+        return self.conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+
+    def previous_runs(self, run: sqlite3.Row, window: int) -> list[sqlite3.Row]:
+        """Up to `window` runs of the same mode recorded before `run`."""
+        return self.conn.execute(
+            """
+            SELECT * FROM runs
+            WHERE mode = ? AND (timestamp < ? OR (timestamp = ? AND id < ?))
+            ORDER BY timestamp DESC, id DESC LIMIT ?
+            """,
+            (run["mode"], run["timestamp"], run["timestamp"], run["id"], window),
+        ).fetchall()
+
+    def cases(self, run_ids: Sequence[int], kind: str) -> list[sqlite3.Row]:
+        placeholders = ",".join("?" for _ in run_ids)
+        return self.conn.execute(
+            f"SELECT * FROM cases WHERE kind = ? AND run_id IN ({placeholders})",
+            (kind, *run_ids),
+        ).fetchall()
+
+
+# ---------------------------------------------------------------------------
+# Statistics
+# ---------------------------------------------------------------------------
+
+def _normal_sf(z: float) -> float:
+    """Upper-tail probability of the standard normal distribution."""
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def proportion_drop_pvalue(base_passed: int, base_total: int, passed: int, total: int) -> float:
+    """One-sided two-proportion z-test that the current pass rate is lower."""
+    if not base_total or not total:
+        return 1.0
+    pooled = (base_passed + passed) / (base_total + total)
+    variance = pooled * (1 - pooled) * (1 / base_total + 1 / total)
+    if variance == 0:
+        return 1.0
+    z = (base_passed / base_total - passed / total) / math.sqrt(variance)
+    return _normal_sf(z)
+
+
+def increase_pvalue(baseline: Sequence[float], current: Sequence[float]) -> float:
+    """One-sided Mann-Whitney U test that `current` tends to be larger."""
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 1.0
+    combined = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    # Continuity correction.
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return _normal_sf(z)
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _median(values: Sequence[float]) -> float:
+    return _percentile(values, 50)
+
+
+def percentile_increase_pvalue(
+    baseline: Sequence[float], current: Sequence[float], q: float, seed: int = 0
+) -> float:
+    """One-sided bootstrap test that the q-th percentile of `current` is larger."""
+    if not baseline or not current:
+        return 1.0
+    rng = random.Random(seed)
+    not_larger = 0
+    for _ in range(BOOTSTRAP_RESAMPLES):
+        base_sample = rng.choices(baseline, k=len(baseline))
+        sample = rng.choices(current, k=len(current))
+        if _percentile(sample, q) <= _percentile(base_sample, q):
+            not_larger += 1
+    return (not_larger + 1) / (BOOTSTRAP_RESAMPLES + 1)
+
+
+# ---------------------------------------------------------------------------
+# Comparison
+# ---------------------------------------------------------------------------
+
+@dataclass
+class MetricComparison:
+    metric: str
+    baseline: Optional[float]
+    current: Optional[float]
+    change: Optional[float]
+    p_value: Optional[float]
+    regression: bool
+    note: str = ""
+
+
+@dataclass
+class Comparison:
+    run_id: int
+    baseline_ids: list[int]
+    metrics: list[MetricComparison] = field(default_factory=list)
+
+    @property
+    def regressed(self) -> bool:
+        return any(m.regression for m in self.metrics)
+
+
+def _relative_change(baseline: Optional[float], current: Optional[float]) -> Optional[float]:
+    if baseline is None or current is None:
+        return None
+    if baseline == 0:
+        return 0.0 if current == 0 else math.inf
+    return (current - baseline) / abs(baseline)
+
+
+def _values(rows: list[sqlite3.Row], column: str) -> list[float]:
+    """Column values for cases that got a response."""
+    return [row[column] for row in rows if row[column] is not None and not row["error"]]
+
+
+def _compare_rate(
+    name: str, baseline: list[sqlite3.Row], current: list[sqlite3.Row], alpha: float
+) -> Optional[MetricComparison]:
+    if not baseline or not current:
+        return None
+    base_passed = sum(row["passed"] for row in baseline)
+    passed = sum(row["passed"] for row in current)
+    base_rate = base_passed / len(baseline)
+    rate = passed / len(current)
+    p_value = proportion_drop_pvalue(base_passed, len(baseline), passed, len(current))
+    return MetricComparison(
+        metric=name,
+        baseline=round(base_rate, 4),
+        current=round(rate, 4),
+        change=round(rate - base_rate, 4),
+        p_value=round(p_value, 4),
+        regression=p_value < alpha,
+        note="absolute change",
+    )
+
+
+def _compare_distribution(
+    name: str,
+    column: str,
+    baseline: list[sqlite3.Row],
+    current: list[sqlite3.Row],
+    alpha: float,
+    min_change: float,
+    q: float = 50,
+) -> Optional[MetricComparison]:
+    base_values, values = _values(baseline, column), _values(current, column)
+    if not base_values or not values:
+        return None
+    base_stat, stat = _percentile(base_values, q), _percentile(values, q)
+    change = _relative_change(base_stat, stat)
+    if q == 50:
+        p_value = increase_pvalue(base_values, values)
+    else:
+        p_value = percentile_increase_pvalue(base_values, values, q)
+    return MetricComparison(
+        metric=name,
+        baseline=round(base_stat, 1),
+        current=round(stat, 1),
+        change=None if change is None else round(change, 4),
+        p_value=round(p_value, 4),
+        regression=p_value < alpha and change is not None and change >= min_change,
+        note=f"p{q:g}",
+    )
+
+
+def compare_runs(
+    store: HistoryStore,
+    run_id: Optional[int] = None,
+    baseline_id: Optional[int] = None,
+    window: int = DEFAULT_WINDOW,
+    alpha: float = DEFAULT_ALPHA,
+    min_change: float = DEFAULT_MIN_CHANGE,
+) -> Comparison:
+    """Compare a run (default: the latest) against a baseline run or rolling window."""
+    if run_id is None:
+        latest = store.runs(limit=1)
+        if not latest:
+            raise LookupError(f"no runs recorded in {store.path}")
+        run = latest[0]
+    else:
+        run = store.run(run_id)
+        if run is None:
+            raise LookupError(f"run {run_id} not found in {store.path}")
+
+    if baseline_id is not None:
+        baseline = store.run(baseline_id)
+        if baseline is None:
+            raise LookupError(f"baseline run {baseline_id} not found in {store.path}")
+        baseline_runs = [baseline]
+    else:
+        baseline_runs = store.previous_runs(run, window)
+        if not baseline_runs:
+            raise LookupError(f"no earlier {run['mode']} runs to compare run {run['id']} against")
+
+    base_ids = [r["id"] for r in baseline_runs]
+    comparison = Comparison(run_id=run["id"], baseline_ids=base_ids)
+
+    base_trigger = store.cases(base_ids, "trigger")
+    trigger = store.cases([run["id"]], "trigger")
+    base_functional = store.cases(base_ids, "functional")
+    functional = store.cases([run["id"]], "functional")
+
+    candidates = [
+        _compare_rate("trigger_accuracy", base_trigger, trigger, alpha),
+        _compare_rate("functional_pass_rate", base_functional, functional, alpha),
+    ]
+    for name, column, q in (
+        ("latency_ms", "duration_ms", 50),
+        ("latency_ms", "duration_ms", 90),
+        ("latency_ms", "duration_ms", 99),
+        ("ttft_ms", "ttft_ms", 50),
+        ("token_usage", "token_usage", 50),
+        ("output_tokens", "output_tokens", 50),
+    ):
+        candidates.append(
+            _compare_distribution(name, column, base_functional, functional, alpha, min_change, q)
+        )
+    comparison.metrics = [metric for metric in candidates if metric is not None]
+    return comparison
+
+
+def print_comparison(comparison: Comparison) -> None:
+    baseline = ", ".join(str(i) for i in comparison.baseline_ids)
+    print("\n" + "=" * 60)
+    print(f"Run {comparison.run_id} vs baseline run(s) {baseline}")
+    print("=" * 60)
+    for m in comparison.metrics:
+        status = "FAIL" if m.regression else "PASS"
+        change = "n/a" if m.change is None else f"{m.change:+.1%}"
+        p_value = "" if m.p_value is None else f"  p={m.p_value:.3f}"
+        note = f"  ({m.note})" if m.note else ""
+        print(f"  [{status}] {m.metric:<22} {m.baseline} -> {m.current}  {change}{p_value}{note}")
+    if not comparison.metrics:
+        print("  No comparable metrics between these runs.")
+    print("\n" + "=" * 60)
+    print("VERDICT: REGRESSION DETECTED" if comparison.regressed else "VERDICT: NO REGRESSION")
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Inspect the evaluation history store",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--results-dir",
+        type=Path,
+        default=Path(os.environ.get("RESULTS_DIR", "results/eval_skills_api")),
+    )
+    parser.add_argument("--list", action="store_true", help="List recorded runs (default)")
+    parser.add_argument("--import", dest="import_reports", action="store_true",
+                        help="Index saved eval_*.json reports not yet in the store")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    with HistoryStore(args.results_dir) as store:
+        if args.import_reports:
+            print(f"Imported {store.import_reports(args.results_dir)} report(s) into {store.path}")
+        for run in store.runs():
+            latency = "" if run["latency_p50"] is None else f"  p50={run['latency_p50']:.0f}ms"
+            rates = []
+            if run["trigger_accuracy"] is not None:
+                rates.append(f"trigger={run['trigger_accuracy']:.0%}")
+            if run["functional_pass_rate"] is not None:
+                rates.append(f"functional={run['functional_pass_rate']:.0%}")
+            print(f"  {run['id']:>4}  {run['timestamp']}  {run['mode']:<10} {' '.join(rates)}{latency}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -9,31 +9,54 @@ Usage:
     # Run trigger tests only (fast, no live API calls, no extra deps)
     uv run scripts/eval_skills_api.py trigger
 
+    # Gate on the learned classifier (NumPy; train with scripts/trigger_classifier.py --train)
+    uv run scripts/eval_skills_api.py trigger --matcher learned
+
     # Run functional tests (requires ANTHROPIC_API_KEY)
-    uv run scripts/eval_skills_api.py functional
+    uv run scripts/eval_skills_api.py functional --concurrency 8 --rate 4
 
     # Run full suite with performance metrics
     uv run scripts/eval_skills_api.py full
 
+    # Record responses once, then re-run checks offline from the cache
+    uv run scripts/eval_skills_api.py functional --cache-mode record
+    uv run scripts/eval_skills_api.py functional --cache-mode replay
+
     # Generate report from prior run
     uv run scripts/eval_skills_api.py report --results-dir results/
 
+    # Load-test the harness against the bundled mock Messages API
+    uv run scripts/eval_skills_api.py loadtest --cases 5000 --concurrency 64 --rate 0 \\
+        --latency lognormal:300,0.5 --error-429 0.02
+
+    # Compare the latest run against the previous 5 (or --baseline RUN_ID);
+    # exits 1 on a significant regression
+    uv run scripts/eval_skills_api.py compare --window 5
+
 Environment:
     ANTHROPIC_API_KEY  — Required for functional and full modes.
+    ANTHROPIC_BASE_URL — Messages API endpoint override (e.g. a local stub server).
     SKILLS_DIR         — Path to .claude/skills/ (default: .claude/skills/)
     RESULTS_DIR        — Output directory for results (default: results/eval_skills_api/)
+    RESPONSE_CACHE_DIR — Recorded API responses (default: .cache/eval-responses/)
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import os
+import random
+import re
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional, Sequence
 
 try:
     import yaml
@@ -41,6 +64,23 @@ try:
 except ImportError:
     HAS_YAML = False
 
+from mock_messages_api import (
+    TEST_ID_HEADER,
+    add_mock_arguments,
+    config_from_args,
+    start_mock_server,
+)
+from eval_history import (
+    DEFAULT_ALPHA,
+    DEFAULT_MIN_CHANGE,
+    DEFAULT_WINDOW,
+    HistoryStore,
+    compare_runs,
+    print_comparison,
+)
+from frontmatter import load_frontmatter
+from trigger_classifier import load_model as load_classifier, suite_digest
+
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -48,10 +88,15 @@ except ImportError:
 
 SKILLS_DIR = Path(os.environ.get("SKILLS_DIR", ".claude/skills"))
 RESULTS_DIR = Path(os.environ.get("RESULTS_DIR", "results/eval_skills_api"))
+RESPONSE_CACHE_DIR = Path(os.environ.get("RESPONSE_CACHE_DIR", ".cache/eval-responses"))
 TRIGGER_TESTS_PATH = SKILLS_DIR / "ciso" / "references" / "trigger-tests.yaml"
 FUNCTIONAL_TESTS_DIR = Path("tests/skills/functional")
 
 SKILL_NAMES = ["ciso", "ciso-assess", "ciso-policy"]
+FUNCTIONAL_MODEL = "claude-sonnet-4-5-20250929"
+FUNCTIONAL_MAX_TOKENS = 4096
+CACHE_MODES = ["off", "record", "replay", "refresh"]
+TRIGGER_MATCHERS = ["heuristic", "learned"]
 
 
 # ---------------------------------------------------------------------------
@@ -76,9 +121,15 @@ class FunctionalResult:
     passed: bool
     checks: dict = field(default_factory=dict)
     token_usage: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
     tool_calls: int = 0
     duration_ms: int = 0
+    ttft_ms: int = 0
+    decision_ms: int = 0
+    aborted: bool = False
     error: str = ""
+    cached: bool = False
 
 
 @dataclass
@@ -88,9 +139,21 @@ class SuiteReport:
     trigger_results: list[TriggerResult] = field(default_factory=list)
     functional_results: list[FunctionalResult] = field(default_factory=list)
     trigger_accuracy: float = 0.0
+    trigger_matcher: str = "heuristic"
+    trigger_matchers: dict = field(default_factory=dict)
     functional_pass_rate: float = 0.0
     avg_token_usage: float = 0.0
     avg_tool_calls: float = 0.0
+    avg_input_tokens: float = 0.0
+    avg_output_tokens: float = 0.0
+    latency_ms: dict = field(default_factory=dict)
+    ttft_ms: dict = field(default_factory=dict)
+    decision_ms: dict = field(default_factory=dict)
+    aborted_cases: int = 0
+    tokens_per_second: float = 0.0
+    per_skill: dict = field(default_factory=dict)
+    cache_hits: int = 0
+    cache_misses: int = 0
 
 
 # ---------------------------------------------------------------------------
@@ -139,113 +202,248 @@ def load_trigger_tests(path: Path) -> list[dict]:
     return tests
 
 
-def match_skill_from_prompt(prompt: str, skill_descriptions: dict[str, str]) -> Optional[str]:
-    """
-    Simulate skill triggering by matching prompt against skill descriptions.
-
-    This is a simplified heuristic matcher. The real Skills API uses semantic
-    matching, but this provides a baseline for offline validation.
+# Keyword tables for the offline trigger heuristic. Entries containing regex
+# operators (e.g. "draft.*policy") are matched as regular expressions; all
+# others are plain substrings. A keyword listed twice in one table counts twice.
+
+# Context check: require CSCRF/SEBI/compliance domain signal for non-slash triggers
+DOMAIN_SIGNALS = [
+    "cscrf", "sebi", "regulated entity", "compliance", "mandatory guideline",
+    "policy area", "applicability", "virtual ciso", "cyber resilience",
+    "re category", "broker", "depository", "mii", "qualified",
+    "mid-size", "small-size", "self-certification",
+    "profile my entity", "incident-response", "access-control",
+    "vendor-management", "data-security",
+]
+# Negative keywords — only block if no CSCRF/SEBI signal co-occurs
+HARD_NEGATIVE_KEYWORDS = [
+    "what is cscrf", "explain zero trust", "tell me about",
+]
+SOFT_NEGATIVE_KEYWORDS = [
+    "iso 27001", "rbi cyber", "cert-in", "nist", "gdpr",
+]
+# /ciso triggers — full orchestration keywords
+CISO_KEYWORDS = [
+    "cscrf compliant", "full assessment", "90-day plan", "cscrf audit",
+    "compliance check", "readiness assessment", "prepare for audit",
+    "full journey", "entity profiling", "remediation roadmap",
+    "help us comply", "cscrf readiness", "virtual ciso",
+    "end-to-end", "complete journey", "compliance journey",
+    "help with our cscrf", "cscrf compliance",
+    "map our controls", "closure plan", "profile my entity",
+    "interview, assessment", "interview.*gap", "profiling.*mapping",
+    "remediation plan", "applicability mapping",
+    "coordinate interview", "like our ciso", "act like",
+]
+# /ciso-assess triggers — review/evaluate existing documents
+ASSESS_KEYWORDS = [
+    "review this policy", "score our", "audit our", "audit this",
+    "policy stack up", "check this policy", "is our policy compliant",
+    "evaluate", "coverage", "gap scoring", "policy review",
+    "review the uploaded", "missing mandatory", "weak language",
+    "assess this", "assess our", "list gaps", "list missing",
+    "look at our", "rewrite the weak", "existing policy document",
+]
+# /ciso-policy triggers — drafting/creating new content
+POLICY_KEYWORDS = [
+    "draft.*policy", "generate.*policy", "create.*policy",
+    "write a policy", "write.*policy", "build.*policy",
+    "policy for", "policy documents", "policy text",
+    "incident-response plan", "access-control policy",
+    "cybersecurity policy for", "policy area",
+    "vendor-management policy", "data-security policy",
+    "policy docs area", "regenerate.*policy", "policy wording",
+    "generate incident", "all cscrf policy",
+    "policy docs area", "area-wise",
+]
+# Disambiguation signals
+FILE_PATH_SIGNALS = ["docs/policies/", ".md ", ".pdf "]
+REVIEW_SIGNALS = ["look at", "review"]
+CATEGORY_SIGNALS = ["qualified", "mid-size", "small-size", "mii", "self-certification"]
+ORCHESTRATION_SIGNALS = ["interview", "profile", "roadmap", "90-day", "complete", "full"]
+
+TRIGGER_KEYWORD_TABLES: dict[str, list[str]] = {
+    "domain": DOMAIN_SIGNALS,
+    "hard_negative": HARD_NEGATIVE_KEYWORDS,
+    "soft_negative": SOFT_NEGATIVE_KEYWORDS,
+    "ciso": CISO_KEYWORDS,
+    "ciso-assess": ASSESS_KEYWORDS,
+    "ciso-policy": POLICY_KEYWORDS,
+    "file_path": FILE_PATH_SIGNALS,
+    "review": REVIEW_SIGNALS,
+    "category": CATEGORY_SIGNALS,
+    "orchestration": ORCHESTRATION_SIGNALS,
+    "policy_word": ["policy"],
+    "cscrf_word": ["cscrf"],
+}
+
+_REGEX_OPERATORS = set("*+?[]{}()|^$\\")
+_LEADING_LITERAL_RE = re.compile(r"[^.*+?\[\]{}()|^$\\]*")
+
+
+class KeywordMatcher:
+    """Multi-pattern matcher that counts keyword hits per table in one scan.
+
+    All literal keywords (and the leading literal of each regex keyword) are
+    compiled into one trie-shaped regex, so a single leftmost-longest scan
+    finds every keyword occurrence: keywords nested inside a match are
+    credited from a precomputed closure, and keywords that start inside a
+    match but run past its end are confirmed with a direct startswith check.
+    Regex keywords are only searched when their leading literal was seen.
+
+    scan_many() joins a batch of texts with NUL separators and scans them
+    with one regex call, so per-prompt overhead stays flat as the keyword
+    tables grow.
     """
-    prompt_lower = prompt.lower()
 
-    # Explicit slash-command triggers
-    for skill_name in SKILL_NAMES:
-        if prompt_lower.startswith(f"/{skill_name}"):
-            return skill_name
-
-    # Context check: require CSCRF/SEBI/compliance domain signal for non-slash triggers
-    domain_signals = [
-        "cscrf", "sebi", "regulated entity", "compliance", "mandatory guideline",
-        "policy area", "applicability", "virtual ciso", "cyber resilience",
-        "re category", "broker", "depository", "mii", "qualified",
-        "mid-size", "small-size", "self-certification",
-        "profile my entity", "incident-response", "access-control",
-        "vendor-management", "data-security",
-    ]
-    has_domain_context = any(sig in prompt_lower for sig in domain_signals)
-
-    # Keyword-based scoring (simplified)
-    scores: dict[str, int] = {name: 0 for name in SKILL_NAMES}
-
-    # Negative keywords — only block if no CSCRF/SEBI signal co-occurs
-    hard_negative_keywords = [
-        "what is cscrf", "explain zero trust", "tell me about",
-    ]
-    soft_negative_keywords = [
-        "iso 27001", "rbi cyber", "cert-in", "nist", "gdpr",
-    ]
-    for kw in hard_negative_keywords:
-        if kw in prompt_lower:
-            return None
+    SEPARATOR = "\0"
+
+    def __init__(self, tables: dict[str, list[str]]):
+        self.tables = list(tables)
+        self._literal_tables: dict[str, list[str]] = {}
+        regex_entries: list[tuple[str, str]] = []
+        for table, keywords in tables.items():
+            for keyword in keywords:
+                if any(char in _REGEX_OPERATORS for char in keyword):
+                    regex_entries.append((table, keyword))
+                else:
+                    self._literal_tables.setdefault(keyword, []).append(table)
+
+        # Regex keywords are only searched once their leading literal (e.g.
+        # "draft" in "draft.*policy") shows up in the literal scan.
+        self._regexes: dict[str, list[tuple[str, re.Pattern]]] = {}
+        self._unanchored: list[tuple[str, re.Pattern]] = []
+        literals = list(self._literal_tables)
+        for table, pattern in regex_entries:
+            anchor = _LEADING_LITERAL_RE.match(pattern).group(0)
+            compiled = re.compile(pattern, re.DOTALL)
+            if not anchor:
+                self._unanchored.append((table, compiled))
+                continue
+            if anchor not in literals:
+                literals.append(anchor)
+            self._regexes.setdefault(anchor, []).append((table, compiled))
+        self._anchors = frozenset(self._regexes)
+
+        # For each literal: literals contained in it, and literals that start
+        # inside it and extend past its end, keyed by the first character
+        # they need after the end of the match.
+        self._nested: dict[str, tuple[str, ...]] = {}
+        self._straddling: dict[str, dict[str, list[tuple[int, str]]]] = {}
+        for literal in literals:
+            self._nested[literal] = tuple(other for other in literals if other in literal)
+            straddling: dict[str, list[tuple[int, str]]] = {}
+            for offset in range(1, len(literal)):
+                overlap = len(literal) - offset
+                for other in literals:
+                    if len(other) > overlap and other.startswith(literal[offset:]):
+                        straddling.setdefault(other[overlap], []).append((offset, other))
+            self._straddling[literal] = straddling
+        self._literal_re = re.compile(self._trie_pattern(literals)) if literals else None
+
+    @staticmethod
+    def _trie_pattern(words: list[str]) -> str:
+        """Regex whose match at any position is the longest word starting there."""
+        trie: dict = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        def render(node: dict) -> str:
+            branches = [re.escape(char) + render(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+            body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+            return f"(?:{body})?" if "" in node else body
+
+        return render(trie)
+
+    def scan(self, text: str) -> dict[str, int]:
+        """Return keyword hits per table; each keyword counts once however often it occurs."""
+        return self.scan_many([text])[0]
+
+    def scan_many(self, texts: Sequence[str]) -> list[dict[str, int]]:
+        """Scan a batch of texts in one pass; results are in input order."""
+        found: list[set[str]] = [set() for _ in texts]
+        if self._literal_re is not None and texts:
+            corpus = self.SEPARATOR.join(texts)
+            nested = self._nested
+            straddling_by_literal = self._straddling
+            index = 0
+            boundary = len(texts[0])
+            for match in self._literal_re.finditer(corpus):
+                start = match.start()
+                while start > boundary:
+                    index += 1
+                    boundary += len(texts[index]) + 1
+                literal = match.group()
+                hits = found[index]
+                hits.update(nested[literal])
+                straddling = straddling_by_literal[literal]
+                if straddling:
+                    end = match.end()
+                    for offset, other in straddling.get(corpus[end:end + 1], ()):
+                        if other not in hits and corpus.startswith(other, start + offset):
+                            hits.add(other)
+
+        results = []
+        credits = self._literal_tables
+        for text, hits in zip(texts, found):
+            counts = dict.fromkeys(self.tables, 0)
+            for keyword in hits:
+                for table in credits.get(keyword, ()):
+                    counts[table] += 1
+            for anchor in self._anchors.intersection(hits):
+                for table, pattern in self._regexes[anchor]:
+                    if pattern.search(text):
+                        counts[table] += 1
+            for table, pattern in self._unanchored:
+                if pattern.search(text):
+                    counts[table] += 1
+            results.append(counts)
+        return results
+
+
+_MATCHER: Optional[KeywordMatcher] = None
+
+
+def get_keyword_matcher() -> KeywordMatcher:
+    """Compile the trigger keyword tables on first use."""
+    global _MATCHER
+    if _MATCHER is None:
+        _MATCHER = KeywordMatcher(TRIGGER_KEYWORD_TABLES)
+    return _MATCHER
+
+
+def _score_prompt(hits: dict[str, int]) -> Optional[str]:
+    """Turn per-table keyword hits into the triggered skill, if any."""
+    has_domain_context = hits["domain"] > 0
+
+    if hits["hard_negative"]:
+        return None
     # Soft negatives only block when CSCRF is not also mentioned
-    for kw in soft_negative_keywords:
-        if kw in prompt_lower and "cscrf" not in prompt_lower:
-            return None
-
-    # /ciso triggers — full orchestration keywords
-    ciso_keywords = [
-        "cscrf compliant", "full assessment", "90-day plan", "cscrf audit",
-        "compliance check", "readiness assessment", "prepare for audit",
-        "full journey", "entity profiling", "remediation roadmap",
-        "help us comply", "cscrf readiness", "virtual ciso",
-        "end-to-end", "complete journey", "compliance journey",
-        "help with our cscrf", "cscrf compliance",
-        "map our controls", "closure plan", "profile my entity",
-        "interview, assessment", "interview.*gap", "profiling.*mapping",
-        "remediation plan", "applicability mapping",
-        "coordinate interview", "like our ciso", "act like",
-    ]
-    # /ciso-assess triggers — review/evaluate existing documents
-    assess_keywords = [
-        "review this policy", "score our", "audit our", "audit this",
-        "policy stack up", "check this policy", "is our policy compliant",
-        "evaluate", "coverage", "gap scoring", "policy review",
-        "review the uploaded", "missing mandatory", "weak language",
-        "assess this", "assess our", "list gaps", "list missing",
-        "look at our", "rewrite the weak", "existing policy document",
-    ]
-    # /ciso-policy triggers — drafting/creating new content
-    policy_keywords = [
-        "draft.*policy", "generate.*policy", "create.*policy",
-        "write a policy", "write.*policy", "build.*policy",
-        "policy for", "policy documents", "policy text",
-        "incident-response plan", "access-control policy",
-        "cybersecurity policy for", "policy area",
-        "vendor-management policy", "data-security policy",
-        "policy docs area", "regenerate.*policy", "policy wording",
-        "generate incident", "all cscrf policy",
-        "policy docs area", "area-wise",
-    ]
-
-    for kw in ciso_keywords:
-        if kw in prompt_lower:
-            scores["ciso"] += 2
-
-    for kw in assess_keywords:
-        if kw in prompt_lower:
-            scores["ciso-assess"] += 2
+    if hits["soft_negative"] and not hits["cscrf_word"]:
+        return None
 
-    for kw in policy_keywords:
-        if kw in prompt_lower:
-            scores["ciso-policy"] += 2
+    # Keyword-based scoring (simplified)
+    scores: dict[str, int] = {name: 2 * hits[name] for name in SKILL_NAMES}
 
     # Disambiguation: explicit file path suggests assess
-    if "docs/policies/" in prompt_lower or ".md " in prompt_lower or ".pdf " in prompt_lower:
+    if hits["file_path"]:
         scores["ciso-assess"] += 3
 
     # Disambiguation: "look at"/"review" existing doc leans assess
-    if ("look at" in prompt_lower or "review" in prompt_lower) and "policy" in prompt_lower:
+    if hits["review"] and hits["policy_word"]:
         scores["ciso-assess"] += 2
 
     # Disambiguation: entity category alone with policy keywords
-    for cat in ["qualified", "mid-size", "small-size", "mii", "self-certification"]:
-        if cat in prompt_lower and scores["ciso-policy"] > 0:
-            scores["ciso-policy"] += 1
+    if scores["ciso-policy"] > 0:
+        scores["ciso-policy"] += hits["category"]
 
     # Disambiguation: multi-phase orchestration keywords lean ciso
-    orchestration_signals = ["interview", "profile", "roadmap", "90-day", "complete", "full"]
-    orchestration_count = sum(1 for s in orchestration_signals if s in prompt_lower)
-    if orchestration_count >= 2:
+    if hits["orchestration"] >= 2:
         scores["ciso"] += 3
 
     best = max(scores, key=scores.get)
@@ -260,58 +458,153 @@ def match_skill_from_prompt(prompt: str, skill_descriptions: dict[str, str]) ->
     return best
 
 
-def run_trigger_tests() -> list[TriggerResult]:
-    """Run all trigger tests offline."""
-    tests = load_trigger_tests(TRIGGER_TESTS_PATH)
-    results = []
+def _slash_command(prompt_lower: str) -> Optional[str]:
+    if not prompt_lower.startswith("/"):
+        return None
+    for skill_name in SKILL_NAMES:
+        if prompt_lower.startswith(f"/{skill_name}"):
+            return skill_name
+    return None
+
 
-    # Load skill descriptions for matching
+def match_skill_from_prompt(prompt: str, skill_descriptions: dict[str, str]) -> Optional[str]:
+    """
+    Simulate skill triggering by matching prompt against skill descriptions.
+
+    This is a simplified heuristic matcher. The real Skills API uses semantic
+    matching, but this provides a baseline for offline validation.
+    """
+    return match_skills_batch([prompt], skill_descriptions)[0]
+
+
+def match_skills_batch(
+    prompts: Iterable[str],
+    skill_descriptions: dict[str, str],
+    chunk_size: int = 4096,
+) -> list[Optional[str]]:
+    """Match many prompts with one keyword scan per chunk, preserving input order."""
+    matcher = get_keyword_matcher()
+    results: list[Optional[str]] = []
+    chunk: list[str] = []
+
+    def flush() -> None:
+        for prompt_lower, hits in zip(chunk, matcher.scan_many(chunk)):
+            # Explicit slash-command triggers
+            results.append(_slash_command(prompt_lower) or _score_prompt(hits))
+        chunk.clear()
+
+    for prompt in prompts:
+        chunk.append(prompt.lower())
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+    return results
+
+
+def load_skill_descriptions() -> dict[str, str]:
+    """Read each skill's frontmatter description from SKILLS_DIR."""
     skill_descriptions = {}
     for name in SKILL_NAMES:
         skill_md = SKILLS_DIR / name / "SKILL.md"
         if skill_md.exists():
-            with open(skill_md) as f:
-                content = f.read()
-            # Extract description from frontmatter
-            if content.startswith("---") and HAS_YAML:
-                _, fm, _ = content.split("---", 2)
-                meta = yaml.safe_load(fm)
-                skill_descriptions[name] = meta.get("description", "")
-            elif content.startswith("---"):
-                # Without YAML, extract description line manually
-                for line in content.split("\n"):
-                    if line.strip().startswith("description:"):
-                        skill_descriptions[name] = line.split(":", 1)[1].strip()
-                        break
-
-    for test in tests:
-        test_id = test.get("id", "unknown")
-        prompt = test.get("prompt", "")
-        expected = test.get("expected_skill")
+            fm = load_frontmatter(skill_md)
+            if fm is not None:
+                skill_descriptions[name] = fm.get("description", "")
+    return skill_descriptions
 
-        # Normalize: "none" string and null both mean "should not trigger"
-        if expected == "none" or expected is None:
-            expected = None
 
-        triggered = match_skill_from_prompt(prompt, skill_descriptions)
+def get_trigger_matcher(name: str) -> Callable[[Sequence[str]], list[Optional[str]]]:
+    """Return a batch matcher: heuristic keyword tables or the learned classifier.
+
+    Raises RuntimeError/ValueError when the learned model (or NumPy) is unavailable.
+    """
+    if name == "learned":
+        model = load_classifier()
+        return model.predict_batch
+    get_keyword_matcher()
+    skill_descriptions = load_skill_descriptions()
+    return lambda prompts: match_skills_batch(prompts, skill_descriptions)
+
 
-        if expected is None:
-            passed = triggered is None
-        else:
-            passed = triggered == expected
+def _expected_skill(test: dict) -> Optional[str]:
+    # Normalize: "none" string and null both mean "should not trigger"
+    expected = test.get("expected_skill")
+    return None if expected in ("none", None) else expected
+
+
+def run_trigger_tests(matcher: str = "heuristic") -> list[TriggerResult]:
+    """Run all trigger tests offline."""
+    tests = load_trigger_tests(TRIGGER_TESTS_PATH)
+    results = []
 
+    triggered_skills = get_trigger_matcher(matcher)([test.get("prompt", "") for test in tests])
+    for test, triggered in zip(tests, triggered_skills):
+        prompt = test.get("prompt", "")
         results.append(TriggerResult(
-            test_id=test_id,
+            test_id=test.get("id", "unknown"),
             prompt=prompt[:80],
-            expected_skill=expected,
+            expected_skill=_expected_skill(test),
             triggered_skill=triggered,
-            passed=passed,
+            passed=triggered == _expected_skill(test),
             note=test.get("note", ""),
         ))
 
     return results
 
 
+def compare_trigger_matchers(min_seconds: float = 0.2) -> dict[str, dict]:
+    """Score every trigger matcher on the suite: accuracy per bucket and prompts/sec.
+
+    Each matcher classifies the whole suite as one batch, repeated until at
+    least ``min_seconds`` elapse so throughput is not dominated by timer noise.
+    Model loading and keyword compilation happen before the clock starts.
+    """
+    tests = load_trigger_tests(TRIGGER_TESTS_PATH)
+    prompts = [test.get("prompt", "") for test in tests]
+    comparison: dict[str, dict] = {}
+    for name in TRIGGER_MATCHERS:
+        try:
+            matcher = get_trigger_matcher(name)
+        except (RuntimeError, ValueError) as e:
+            comparison[name] = {"error": str(e)}
+            continue
+
+        batches = 0
+        start = time.perf_counter()
+        while True:
+            triggered_skills = matcher(prompts)
+            batches += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_seconds:
+                break
+
+        by_bucket: dict[str, list[int]] = {}
+        for test, triggered in zip(tests, triggered_skills):
+            tally = by_bucket.setdefault(test.get("bucket", "unknown"), [0, 0])
+            tally[0] += triggered == _expected_skill(test)
+            tally[1] += 1
+        passed = sum(tally[0] for tally in by_bucket.values())
+        entry = {
+            "cases": len(tests),
+            "passed": passed,
+            "accuracy": passed / len(tests) if tests else 0.0,
+            "by_bucket": {
+                bucket: tally[0] / tally[1] for bucket, tally in sorted(by_bucket.items())
+            },
+            "prompts_per_second": batches * len(prompts) / elapsed if elapsed else 0.0,
+        }
+        if name == "learned":
+            metadata = load_classifier().metadata
+            if "cv_accuracy" in metadata:
+                entry["cv_accuracy"] = metadata["cv_accuracy"]
+            if TRIGGER_TESTS_PATH.exists() and metadata.get("suite_sha256") != suite_digest(
+                TRIGGER_TESTS_PATH
+            ):
+                entry["stale"] = True
+        comparison[name] = entry
+    return comparison
+
+
 # ---------------------------------------------------------------------------
 # Functional testing (requires API)
 # ---------------------------------------------------------------------------
@@ -331,77 +624,408 @@ def load_functional_tests() -> list[dict]:
     return tests
 
 
-def run_functional_test(case: dict) -> FunctionalResult:
+def skill_bundle_hash(skills_dir: Path = SKILLS_DIR) -> str:
+    """Content hash of every file in the evaluated skills."""
+    hasher = hashlib.sha256()
+    for name in SKILL_NAMES:
+        skill_dir = skills_dir / name
+        if not skill_dir.is_dir():
+            continue
+        for path in sorted(p for p in skill_dir.rglob("*") if p.is_file()):
+            hasher.update(f"{path.relative_to(skills_dir).as_posix()}\0".encode("utf-8"))
+            hasher.update(hashlib.sha256(path.read_bytes()).digest())
+    return hasher.hexdigest()
+
+
+class ResponseCache:
     """
-    Run a single functional test case via the Claude API.
+    On-disk cache of Messages API responses for functional runs.
 
-    Requires ANTHROPIC_API_KEY in environment. Uses the Messages API
-    with container.skills parameter to load skills.
+    Entries are keyed by model, max_tokens, prompt and the skill bundle hash,
+    one JSON file per entry. Modes: "record" serves hits and records misses,
+    "replay" serves hits only (misses fail without calling the API), and
+    "refresh" always calls the API and overwrites. Least recently used
+    entries are evicted once the directory exceeds `max_bytes`.
     """
+
+    def __init__(self, mode: str, directory: Path = RESPONSE_CACHE_DIR, max_bytes: int = 256 * 1024 * 1024):
+        self.mode = mode
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.bundle = skill_bundle_hash()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key(self, prompt: str) -> str:
+        material = json.dumps(
+            [FUNCTIONAL_MODEL, FUNCTIONAL_MAX_TOKENS, prompt, self.bundle],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        record = None
+        if self.mode != "refresh":
+            path = self._path(key)
+            try:
+                record = json.loads(path.read_text(encoding="utf-8"))
+                os.utime(path)  # Mark as recently used for eviction.
+            except (OSError, ValueError):
+                record = None
+        with self._lock:
+            if record is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return record
+
+    def put(self, key: str, record: dict) -> None:
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=".response-", dir=self.directory)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"model": FUNCTIONAL_MODEL, "bundle": self.bundle, **record}, f)
+                os.replace(tmp_name, self._path(key))
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            print(f"WARNING: could not record response: {e}", file=sys.stderr)
+
+    def prune(self) -> None:
+        """Evict least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` requests per second, bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """Stops issuing API calls once the error rate crosses a threshold."""
+
+    def __init__(self, threshold: float, min_calls: int = 5):
+        self.threshold = threshold
+        self.min_calls = min_calls
+        self.calls = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    @property
+    def open(self) -> bool:
+        with self._lock:
+            return (
+                self.threshold > 0
+                and self.calls >= self.min_calls
+                and self.errors / self.calls >= self.threshold
+            )
+
+    def record(self, error: bool) -> None:
+        with self._lock:
+            self.calls += 1
+            self.errors += int(error)
+
+
+@dataclass
+class RunnerOptions:
+    concurrency: int = 4
+    rate: float = 5.0
+    max_retries: int = 4
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    breaker_threshold: float = 0.5
+    base_url: Optional[str] = None
+    api_key: Optional[str] = None
+    request_timeout: float = 600.0
+    early_abort: bool = False
+
+
+def _retry_delay(exc: Exception, attempt: int, options: RunnerOptions) -> Optional[float]:
+    """Seconds to wait before retrying `exc`, or None if it is not retryable."""
+    status = getattr(exc, "status_code", None)
+    transient = type(exc).__name__ in {"APIConnectionError", "APITimeoutError"}
+    if not transient and status not in (408, 409, 429) and not (status and status >= 500):
+        return None
+    delay = min(options.backoff_max, options.backoff_base * (2 ** attempt))
+    response = getattr(exc, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            delay = max(delay, min(options.backoff_max, float(retry_after)))
+        except ValueError:
+            pass
+    # Jitter so concurrent workers do not retry in lockstep.
+    return delay * (0.5 + random.random() / 2)
+
+
+def evaluate_checks(content: str, expected_checks: dict) -> tuple[dict, bool]:
+    """Apply a case's `checks` block to the response text."""
+    check_results = {}
+    all_passed = True
+
+    for check_name, check_value in expected_checks.items():
+        if check_name == "contains":
+            for expected_text in (check_value if isinstance(check_value, list) else [check_value]):
+                found = expected_text.lower() in content.lower()
+                check_results[f"contains:{expected_text}"] = found
+                if not found:
+                    all_passed = False
+
+        elif check_name == "not_contains":
+            for blocked_text in (check_value if isinstance(check_value, list) else [check_value]):
+                absent = blocked_text.lower() not in content.lower()
+                check_results[f"not_contains:{blocked_text}"] = absent
+                if not absent:
+                    all_passed = False
+
+        elif check_name == "min_length":
+            meets_min = len(content) >= check_value
+            check_results["min_length"] = meets_min
+            if not meets_min:
+                all_passed = False
+
+    return check_results, all_passed
+
+
+class IncrementalChecker:
+    """
+    Evaluates a case's `checks` while the response streams in.
+
+    The outcome is decided as soon as a `not_contains` term appears (fail), or
+    when there are no `not_contains` terms and every `contains` term and the
+    `min_length` have been seen (pass). Matching is the same case-insensitive
+    substring test evaluate_checks() applies to the joined text blocks.
+    """
+
+    def __init__(self, expected_checks: dict):
+        def terms(name: str) -> list[str]:
+            value = expected_checks.get(name, [])
+            return [t.lower() for t in (value if isinstance(value, list) else [value])]
+
+        self.pending = set(terms("contains"))
+        self.blocked = terms("not_contains")
+        self.min_length = expected_checks.get("min_length", 0)
+        self.text = ""
+        self.decided = False
+        self.passed: Optional[bool] = None
+        self._longest = max((len(t) for t in [*self.pending, *self.blocked]), default=0)
+
+    def start_block(self) -> None:
+        if self.text:
+            self.feed("\n")
+
+    def feed(self, delta: str) -> bool:
+        """Add streamed text; returns True once the outcome is decided."""
+        if self.decided or not delta:
+            return self.decided
+        # Only the new text plus a term-length overlap can hold a new match.
+        window_start = max(0, len(self.text) - self._longest + 1)
+        self.text += delta.lower()
+        window = self.text[window_start:]
+        if any(term in window for term in self.blocked):
+            self.decided, self.passed = True, False
+        elif self.pending:
+            self.pending = {term for term in self.pending if term not in window}
+        if not self.decided and not self.blocked and not self.pending and len(self.text) >= self.min_length:
+            self.decided, self.passed = True, True
+        return self.decided
+
+
+def make_client(options: Optional[RunnerOptions] = None):
+    """Create a Messages API client. Returns (client, "") or (None, error message)."""
     try:
         import anthropic
     except ImportError:
-        return FunctionalResult(
-            test_id=case.get("id", "unknown"),
-            skill=case.get("skill", "unknown"),
-            prompt=case.get("prompt", "")[:80],
-            passed=False,
-            error="anthropic package not installed. Run: pip install anthropic",
-        )
+        return None, "anthropic package not installed. Run: pip install anthropic"
 
-    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    options = options or RunnerOptions()
+    api_key = options.api_key or os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
-        return FunctionalResult(
-            test_id=case.get("id", "unknown"),
-            skill=case.get("skill", "unknown"),
-            prompt=case.get("prompt", "")[:80],
-            passed=False,
-            error="ANTHROPIC_API_KEY not set",
-        )
+        return None, "ANTHROPIC_API_KEY not set"
+
+    # Retries are owned by the runner so they respect the shared rate limit.
+    client = anthropic.Anthropic(
+        api_key=api_key,
+        base_url=options.base_url,
+        timeout=options.request_timeout,
+        max_retries=0,
+    )
+    return client, ""
+
+
+class LazyClient:
+    """One client shared by every case, built on the first call to `get`."""
+
+    def __init__(self, options: Optional[RunnerOptions] = None) -> None:
+        self.options = options
+        self._lock = threading.Lock()
+        self._result: Optional[tuple] = None
+
+    def get(self) -> tuple:
+        """Return (client, "") or (None, error message), as make_client does."""
+        with self._lock:
+            if self._result is None:
+                self._result = make_client(self.options)
+            return self._result
+
 
-    client = anthropic.Anthropic(api_key=api_key)
+TOOL_USE_BLOCK_TYPES = {"tool_use", "server_tool_use"}
+
+
+def _create_message(
+    client,
+    prompt: str,
+    options: RunnerOptions,
+    limiter: Optional[TokenBucket],
+    abort_checks: Optional[dict] = None,
+    test_id: str = "",
+) -> dict:
+    """
+    Stream a Messages API call with retries and return the fields the checks
+    and metrics use. Wall time and time to first token are measured from the
+    first attempt, once the rate limiter admits it: time queued in the
+    harness's own bucket is not API latency, but retries and backoff count
+    against the case. With
+    `abort_checks`, the stream is closed as soon as their outcome is decided.
+    """
+    start = 0.0
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.acquire()
+        if attempt == 0:
+            start = time.monotonic()
+        ttft_ms = 0
+        decision_ms = 0
+        checker = IncrementalChecker(abort_checks) if abort_checks is not None else None
+        try:
+            with client.messages.stream(
+                model=FUNCTIONAL_MODEL,
+                max_tokens=FUNCTIONAL_MAX_TOKENS,
+                messages=[{"role": "user", "content": prompt}],
+                # Lets a stub server script responses per case; ignored by the API.
+                extra_headers={TEST_ID_HEADER: test_id} if test_id else None,
+            ) as stream:
+                for event in stream:
+                    if checker is not None and event.type == "content_block_start":
+                        if getattr(event.content_block, "type", "") == "text":
+                            checker.start_block()
+                    if event.type != "content_block_delta":
+                        continue
+                    if not ttft_ms:
+                        ttft_ms = int((time.monotonic() - start) * 1000)
+                    if checker is not None and getattr(event.delta, "type", "") == "text_delta":
+                        if checker.feed(event.delta.text):
+                            decision_ms = int((time.monotonic() - start) * 1000)
+                            break
+                # Leaving the context manager closes the connection on abort.
+                message = stream.current_message_snapshot if decision_ms else stream.get_final_message()
+            break
+        except Exception as e:
+            delay = _retry_delay(e, attempt, options)
+            if delay is None or attempt >= options.max_retries:
+                raise
+            attempt += 1
+            time.sleep(delay)
+
+    duration_ms = int((time.monotonic() - start) * 1000)
+    blocks = message.content or []
+    return {
+        "content": "\n".join(block.text for block in blocks if block.type == "text"),
+        "input_tokens": message.usage.input_tokens if message.usage else 0,
+        "output_tokens": message.usage.output_tokens if message.usage else 0,
+        "tool_calls": sum(1 for block in blocks if block.type in TOOL_USE_BLOCK_TYPES),
+        "duration_ms": duration_ms,
+        "ttft_ms": ttft_ms or duration_ms,
+        "decision_ms": decision_ms or duration_ms,
+        "aborted": bool(decision_ms),
+    }
+
+
+def run_functional_test(
+    case: dict,
+    client=None,
+    options: Optional[RunnerOptions] = None,
+    limiter: Optional[TokenBucket] = None,
+    cache: Optional[ResponseCache] = None,
+    lazy_client: Optional[LazyClient] = None,
+) -> FunctionalResult:
+    """
+    Run a single functional test case via the Claude API.
+
+    Requires ANTHROPIC_API_KEY in environment. Uses the Messages API
+    with container.skills parameter to load skills. Rate-limit, overload
+    and connection errors are retried with exponential backoff, honoring
+    retry-after when the server sends it. With a response cache, recorded
+    responses are checked without calling the API. Without a `client`, a
+    cache miss takes one from `lazy_client` (or builds its own).
+    """
+    options = options or RunnerOptions()
     prompt = case.get("prompt", "")
     expected_checks = case.get("checks", {})
 
     start = time.monotonic()
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=4096,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        duration_ms = int((time.monotonic() - start) * 1000)
-
-        content = response.content[0].text if response.content else ""
-        token_usage = (
-            response.usage.input_tokens + response.usage.output_tokens
-            if response.usage else 0
-        )
-
-        # Validate expected checks
-        check_results = {}
-        all_passed = True
-
-        for check_name, check_value in expected_checks.items():
-            if check_name == "contains":
-                for expected_text in (check_value if isinstance(check_value, list) else [check_value]):
-                    found = expected_text.lower() in content.lower()
-                    check_results[f"contains:{expected_text}"] = found
-                    if not found:
-                        all_passed = False
-
-            elif check_name == "not_contains":
-                for blocked_text in (check_value if isinstance(check_value, list) else [check_value]):
-                    absent = blocked_text.lower() not in content.lower()
-                    check_results[f"not_contains:{blocked_text}"] = absent
-                    if not absent:
-                        all_passed = False
-
-            elif check_name == "min_length":
-                meets_min = len(content) >= check_value
-                check_results["min_length"] = meets_min
-                if not meets_min:
-                    all_passed = False
+        key = cache.key(prompt) if cache is not None else ""
+        record = cache.get(key) if cache is not None else None
+        cached = record is not None
+        if record is None:
+            if cache is not None and cache.mode == "replay":
+                raise LookupError("no recorded response for this case (replay mode)")
+            if client is None:
+                client, error = lazy_client.get() if lazy_client is not None else make_client(options)
+                if client is None:
+                    raise RuntimeError(error)
+            abort_checks = expected_checks if options.early_abort else None
+            record = _create_message(
+                client, prompt, options, limiter, abort_checks, case.get("id", "")
+            )
+            # A truncated response cannot be re-checked against edited checks.
+            if cache is not None and not record["aborted"]:
+                cache.put(key, record)
+
+        content = record["content"]
+        token_usage = record["input_tokens"] + record["output_tokens"]
+
+        check_results, all_passed = evaluate_checks(content, expected_checks)
 
         return FunctionalResult(
             test_id=case.get("id", "unknown"),
@@ -410,8 +1034,14 @@ def run_functional_test(case: dict) -> FunctionalResult:
             passed=all_passed,
             checks=check_results,
             token_usage=token_usage,
-            tool_calls=0,  # Would require tool_use tracking
-            duration_ms=duration_ms,
+            input_tokens=record["input_tokens"],
+            output_tokens=record["output_tokens"],
+            tool_calls=record.get("tool_calls", 0),
+            duration_ms=record["duration_ms"],
+            ttft_ms=record.get("ttft_ms", record["duration_ms"]),
+            decision_ms=record.get("decision_ms", record["duration_ms"]),
+            aborted=record.get("aborted", False),
+            cached=cached,
         )
 
     except Exception as e:
@@ -426,20 +1056,136 @@ def run_functional_test(case: dict) -> FunctionalResult:
         )
 
 
-def run_functional_tests() -> list[FunctionalResult]:
-    """Run all functional test cases."""
-    cases = load_functional_tests()
+def run_functional_tests(
+    options: Optional[RunnerOptions] = None,
+    cache: Optional[ResponseCache] = None,
+    cases: Optional[list[dict]] = None,
+    progress: bool = True,
+) -> list[FunctionalResult]:
+    """
+    Run all functional test cases on a thread pool.
+
+    Up to `options.concurrency` requests are in flight at once, admitted by a
+    shared token bucket. Once the API error rate crosses the breaker
+    threshold, cases that have not started are failed without a request.
+    Results are returned in case order regardless of completion order.
+    `cases` defaults to the suites in FUNCTIONAL_TESTS_DIR.
+    """
+    options = options or RunnerOptions()
+    if cases is None:
+        cases = load_functional_tests()
     if not cases:
         print("WARNING: No functional test cases found.", file=sys.stderr)
         return []
 
-    results = []
-    for i, case in enumerate(cases, 1):
-        print(f"  [{i}/{len(cases)}] {case.get('id', 'unknown')}...", end=" ", flush=True)
-        result = run_functional_test(case)
-        status = "PASS" if result.passed else "FAIL"
-        print(f"{status} ({result.duration_ms}ms, {result.token_usage} tokens)")
-        results.append(result)
+    replay_only = cache is not None and cache.mode == "replay"
+    # Record mode serves hits offline; the first miss builds the client every case shares.
+    lazy = replay_only or (cache is not None and cache.mode == "record")
+    client, error = (None, "") if lazy else make_client(options)
+    lazy_client = LazyClient(options) if lazy and not replay_only else None
+    limiter = TokenBucket(options.rate)
+    breaker = CircuitBreaker(options.breaker_threshold)
+
+    def run_case(case: dict) -> FunctionalResult:
+        if (client is None and not lazy) or breaker.open:
+            return FunctionalResult(
+                test_id=case.get("id", "unknown"),
+                skill=case.get("skill", "unknown"),
+                prompt=case.get("prompt", "")[:80],
+                passed=False,
+                error=error or "skipped: circuit breaker open after repeated API errors",
+            )
+        result = run_functional_test(case, client, options, limiter, cache, lazy_client)
+        if not result.cached and not replay_only:
+            breaker.record(bool(result.error))
+        return result
+
+    results: list[Optional[FunctionalResult]] = [None] * len(cases)
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, options.concurrency)) as pool:
+        futures = {pool.submit(run_case, case): i for i, case in enumerate(cases)}
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            done += 1
+            if not progress:
+                continue
+            status = "PASS" if result.passed else "FAIL"
+            source = ", cached" if result.cached else ""
+            if result.aborted:
+                source += f", decided at {result.decision_ms}ms"
+            print(
+                f"  [{done}/{len(cases)}] {result.test_id}... "
+                f"{status} ({result.duration_ms}ms, {result.token_usage} tokens{source})",
+                flush=True,
+            )
+    if cache is not None:
+        cache.prune()
+    return [result for result in results if result is not None]
+
+
+# ---------------------------------------------------------------------------
+# Load testing (against the local mock Messages API)
+# ---------------------------------------------------------------------------
+
+def synthetic_cases(count: int) -> list[dict]:
+    """Functional cases whose checks pass against unscripted mock responses."""
+    return [
+        {
+            "id": f"load-{i:05d}",
+            "skill": SKILL_NAMES[i % len(SKILL_NAMES)],
+            "prompt": f"Load test case {i}: assess CSCRF policy coverage for a mid-size broker.",
+            "checks": {"contains": ["mock response"], "min_length": 16},
+        }
+        for i in range(count)
+    ]
+
+
+def run_loadtest(
+    args: argparse.Namespace,
+    options: RunnerOptions,
+    cache: Optional[ResponseCache],
+) -> list[FunctionalResult]:
+    """
+    Drive synthetic cases through the functional runner and report harness
+    throughput. Starts the bundled mock Messages API unless --base-url points
+    at one already running.
+    """
+    mock = None
+    # Only an explicit --base-url is honored: a load test must never fall back
+    # to $ANTHROPIC_BASE_URL and fire thousands of requests at a real endpoint.
+    if args.base_url:
+        options.base_url = args.base_url
+    else:
+        mock, state, options.base_url = start_mock_server(config_from_args(args))
+        options.api_key = options.api_key or "mock-key"
+        print(f"Started mock Messages API at {options.base_url} (latency {args.latency})")
+
+    cases = synthetic_cases(args.cases)
+    print(
+        f"Running {len(cases)} synthetic cases "
+        f"(concurrency={options.concurrency}, rate={options.rate:g}/s)..."
+    )
+    start = time.perf_counter()
+    try:
+        results = run_functional_tests(options, cache, cases=cases, progress=False)
+    finally:
+        if mock is not None:
+            mock.shutdown()
+    wall_s = time.perf_counter() - start
+
+    durations = [r.duration_ms / 1000 for r in results]
+    # Best case for this concurrency: API time spread evenly, bounded by the slowest case.
+    ideal_s = max(sum(durations) / max(1, options.concurrency), max(durations, default=0.0))
+    if options.rate > 0:
+        ideal_s = max(ideal_s, len(cases) / options.rate)
+    errors = sum(1 for r in results if r.error)
+    print(f"  Wall time: {wall_s:.2f}s ({len(cases) / wall_s:.1f} cases/s)")
+    print(f"  Summed case latency: {sum(durations):.2f}s, ideal wall time: {ideal_s:.2f}s")
+    print(f"  Harness overhead: {max(0.0, wall_s - ideal_s):.2f}s ({max(0.0, wall_s / ideal_s - 1) if ideal_s else 0:.0%})")
+    print(f"  Failed requests after retries: {errors}")
+    if mock is not None:
+        print(f"  Mock served {state.requests} requests; injected errors: {state.errors}")
     return results
 
 
@@ -447,10 +1193,56 @@ def run_functional_tests() -> list[FunctionalResult]:
 # Reporting
 # ---------------------------------------------------------------------------
 
+def percentile(values: list[float], q: float) -> float:
+    """Linearly interpolated percentile (q in 0..100) of a non-empty list."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _distribution(values: list[float]) -> dict:
+    if not values:
+        return {}
+    return {f"p{q}": round(percentile(values, q), 1) for q in (50, 90, 99)}
+
+
+def performance_summary(results: list[FunctionalResult]) -> dict:
+    """Latency, TTFT and token metrics over the cases that got a response."""
+    answered = [r for r in results if not r.error]
+    summary = {
+        "cases": len(results),
+        "passed": sum(1 for r in results if r.passed),
+        "latency_ms": _distribution([r.duration_ms for r in answered]),
+        "ttft_ms": _distribution([r.ttft_ms for r in answered]),
+        "decision_ms": _distribution([r.decision_ms or r.duration_ms for r in answered]),
+        "aborted": sum(1 for r in answered if r.aborted),
+        "avg_input_tokens": 0.0,
+        "avg_output_tokens": 0.0,
+        "avg_tool_calls": 0.0,
+        "tokens_per_second": 0.0,
+    }
+    if answered:
+        summary["avg_input_tokens"] = round(sum(r.input_tokens for r in answered) / len(answered), 1)
+        summary["avg_output_tokens"] = round(sum(r.output_tokens for r in answered) / len(answered), 1)
+        summary["avg_tool_calls"] = round(sum(r.tool_calls for r in answered) / len(answered), 2)
+        # Output tokens over time spent generating them (after the first token).
+        generation_s = sum(max(r.duration_ms - r.ttft_ms, 0) for r in answered) / 1000
+        if generation_s > 0:
+            summary["tokens_per_second"] = round(
+                sum(r.output_tokens for r in answered) / generation_s, 1
+            )
+    return summary
+
+
 def compute_report(
     mode: str,
     trigger_results: list[TriggerResult],
     functional_results: list[FunctionalResult],
+    cache: Optional[ResponseCache] = None,
+    trigger_matcher: str = "heuristic",
+    trigger_matchers: Optional[dict] = None,
 ) -> SuiteReport:
     """Compute aggregate metrics."""
     report = SuiteReport(
@@ -458,6 +1250,8 @@ def compute_report(
         timestamp=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
         trigger_results=trigger_results,
         functional_results=functional_results,
+        trigger_matcher=trigger_matcher,
+        trigger_matchers=trigger_matchers or {},
     )
 
     if trigger_results:
@@ -470,15 +1264,37 @@ def compute_report(
         tokens = [r.token_usage for r in functional_results if r.token_usage > 0]
         if tokens:
             report.avg_token_usage = sum(tokens) / len(tokens)
-        tools = [r.tool_calls for r in functional_results if r.tool_calls > 0]
-        if tools:
-            report.avg_tool_calls = sum(tools) / len(tools)
+
+        # Same denominator as the per-skill summaries: every case that got a response.
+        overall = performance_summary(functional_results)
+        report.avg_tool_calls = overall["avg_tool_calls"]
+        report.avg_input_tokens = overall["avg_input_tokens"]
+        report.avg_output_tokens = overall["avg_output_tokens"]
+        report.latency_ms = overall["latency_ms"]
+        report.ttft_ms = overall["ttft_ms"]
+        report.decision_ms = overall["decision_ms"]
+        report.aborted_cases = overall["aborted"]
+        report.tokens_per_second = overall["tokens_per_second"]
+        by_skill: dict[str, list[FunctionalResult]] = {}
+        for r in functional_results:
+            by_skill.setdefault(r.skill, []).append(r)
+        report.per_skill = {
+            skill: performance_summary(results) for skill, results in sorted(by_skill.items())
+        }
+
+    if cache is not None:
+        report.cache_hits = cache.hits
+        report.cache_misses = cache.misses
 
     return report
 
 
-def print_report(report: SuiteReport) -> None:
-    """Print human-readable report to stdout."""
+def _format_distribution(distribution: dict) -> str:
+    return "  ".join(f"{name}={value:.0f}ms" for name, value in distribution.items())
+
+
+def print_report(report: SuiteReport) -> bool:
+    """Print human-readable report to stdout. Returns True if every test passed."""
     print("\n" + "=" * 60)
     print(f"CSCRF Skills API Evaluation — {report.mode}")
     print(f"Timestamp: {report.timestamp}")
@@ -488,7 +1304,28 @@ def print_report(report: SuiteReport) -> None:
         total = len(report.trigger_results)
         passed = sum(1 for r in report.trigger_results if r.passed)
         failed = total - passed
-        print(f"\nTrigger Tests: {passed}/{total} passed ({report.trigger_accuracy:.0%})")
+        print(
+            f"\nTrigger Tests ({report.trigger_matcher}): {passed}/{total} passed "
+            f"({report.trigger_accuracy:.0%})"
+        )
+        if report.trigger_matchers:
+            print("\n  Matchers:")
+            for name, entry in report.trigger_matchers.items():
+                if "error" in entry:
+                    print(f"    {name:<10} unavailable: {entry['error']}")
+                    continue
+                buckets = "  ".join(
+                    f"{bucket}={accuracy:.0%}" for bucket, accuracy in entry["by_bucket"].items()
+                )
+                extra = ""
+                if "cv_accuracy" in entry:
+                    extra += f"  cv={entry['cv_accuracy']:.0%}"
+                if entry.get("stale"):
+                    extra += "  (model trained on an older suite; retrain)"
+                print(
+                    f"    {name:<10} {entry['passed']}/{entry['cases']} ({entry['accuracy']:.1%})  "
+                    f"{entry['prompts_per_second']:,.0f} prompts/s  {buckets}{extra}"
+                )
         if failed > 0:
             print("\n  Failed cases:")
             for r in report.trigger_results:
@@ -503,6 +1340,30 @@ def print_report(report: SuiteReport) -> None:
         print(f"\nFunctional Tests: {passed}/{total} passed ({report.functional_pass_rate:.0%})")
         print(f"  Avg token usage: {report.avg_token_usage:.0f}")
         print(f"  Avg tool calls: {report.avg_tool_calls:.1f}")
+        print(
+            f"  Avg input/output tokens: {report.avg_input_tokens:.0f} / "
+            f"{report.avg_output_tokens:.0f}"
+        )
+        if report.latency_ms:
+            print(f"  Latency: {_format_distribution(report.latency_ms)}")
+            print(f"  Time to first token: {_format_distribution(report.ttft_ms)}")
+            print(f"  Output tokens/sec: {report.tokens_per_second:.1f}")
+        if report.aborted_cases:
+            print(f"  Time to decision: {_format_distribution(report.decision_ms)}")
+            print(f"  Aborted early: {report.aborted_cases} case(s)")
+        if report.per_skill:
+            print("\n  Per skill:")
+            for skill, summary in report.per_skill.items():
+                latency = summary["latency_ms"]
+                print(
+                    f"    {skill:<14} {summary['passed']}/{summary['cases']} passed  "
+                    f"p50={latency.get('p50', 0):.0f}ms p99={latency.get('p99', 0):.0f}ms  "
+                    f"out={summary['avg_output_tokens']:.0f} tok  "
+                    f"{summary['tokens_per_second']:.1f} tok/s  "
+                    f"tools={summary['avg_tool_calls']:.1f}"
+                )
+        if report.cache_hits or report.cache_misses:
+            print(f"  Response cache: {report.cache_hits} hits, {report.cache_misses} misses")
         if failed > 0:
             print("\n  Failed cases:")
             for r in report.functional_results:
@@ -520,9 +1381,9 @@ def print_report(report: SuiteReport) -> None:
 
     if all_trigger_pass and all_functional_pass:
         print("VERDICT: ALL TESTS PASSED")
-    else:
-        print("VERDICT: SOME TESTS FAILED")
-        sys.exit(1)
+        return True
+    print("VERDICT: SOME TESTS FAILED")
+    return False
 
 
 def save_report(report: SuiteReport, results_dir: Path) -> Path:
@@ -536,6 +1397,11 @@ def save_report(report: SuiteReport, results_dir: Path) -> Path:
     with open(path, "w") as f:
         json.dump(data, f, indent=2)
     print(f"\nReport saved to: {path}")
+
+    with HistoryStore(results_dir) as store:
+        store.import_reports(results_dir)
+        run_id = store.record(data, path)
+    print(f"Indexed as run {run_id} in: {store.path}")
     return path
 
 
@@ -551,8 +1417,9 @@ def main():
     )
     parser.add_argument(
         "mode",
-        choices=["trigger", "functional", "full", "report"],
-        help="Test mode: trigger (offline), functional (API), full (both), report (from file)",
+        choices=["trigger", "functional", "full", "report", "compare", "loadtest"],
+        help="Test mode: trigger (offline), functional (API), full (both), report (from file), "
+        "compare (regression check against history), loadtest (synthetic cases against a mock API)",
     )
     parser.add_argument(
         "--results-dir",
@@ -560,18 +1427,159 @@ def main():
         default=RESULTS_DIR,
         help=f"Directory for results (default: {RESULTS_DIR})",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=RunnerOptions.concurrency,
+        help=f"Functional cases in flight at once (default: {RunnerOptions.concurrency})",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=RunnerOptions.rate,
+        help=f"Max API requests per second, 0 for unlimited (default: {RunnerOptions.rate})",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=RunnerOptions.max_retries,
+        help=f"Retries per case on 429/5xx/timeouts (default: {RunnerOptions.max_retries})",
+    )
+    parser.add_argument(
+        "--breaker-threshold",
+        type=float,
+        default=RunnerOptions.breaker_threshold,
+        help="API error rate that stops further requests, 0 to disable "
+        f"(default: {RunnerOptions.breaker_threshold})",
+    )
+    parser.add_argument(
+        "--base-url",
+        help="Messages API base URL, e.g. a local stub server "
+        "(default: $ANTHROPIC_BASE_URL; loadtest starts the bundled mock instead)",
+    )
+    parser.add_argument(
+        "--request-timeout",
+        type=float,
+        default=RunnerOptions.request_timeout,
+        help=f"Per-request timeout in seconds (default: {RunnerOptions.request_timeout:g})",
+    )
+    parser.add_argument(
+        "--early-abort",
+        action="store_true",
+        help="Evaluate checks while the response streams and stop it once the outcome is decided",
+    )
+    parser.add_argument(
+        "--cache-mode",
+        choices=CACHE_MODES,
+        default="off",
+        help="Response cache for functional runs: record (read-through), replay "
+        "(offline, cache only), refresh (re-record), or off (default)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=256,
+        help=f"Evict least recently used responses past this size (default: 256, dir: {RESPONSE_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--run",
+        type=int,
+        help="compare: run id to check (default: latest)",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=int,
+        help="compare: baseline run id (default: rolling window of earlier runs)",
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=DEFAULT_WINDOW,
+        help=f"compare: number of earlier runs pooled as the baseline (default: {DEFAULT_WINDOW})",
+    )
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=DEFAULT_ALPHA,
+        help=f"compare: significance level (default: {DEFAULT_ALPHA})",
+    )
+    parser.add_argument(
+        "--min-change",
+        type=float,
+        default=DEFAULT_MIN_CHANGE,
+        help="compare: minimum relative increase in latency/tokens to flag "
+        f"(default: {DEFAULT_MIN_CHANGE})",
+    )
+    parser.add_argument(
+        "--matcher",
+        choices=TRIGGER_MATCHERS,
+        default="heuristic",
+        help="Trigger matcher that decides pass/fail: keyword heuristic (default) or the "
+        "learned classifier from scripts/trigger_classifier.py; both are reported side by side",
+    )
+    loadtest = parser.add_argument_group("loadtest", "Synthetic load and the bundled mock Messages API")
+    loadtest.add_argument(
+        "--cases",
+        type=int,
+        default=1000,
+        help="Number of synthetic cases (default: 1000)",
+    )
+    add_mock_arguments(loadtest)
     args = parser.parse_args()
+    runner_options = RunnerOptions(
+        concurrency=args.concurrency,
+        rate=args.rate,
+        max_retries=args.max_retries,
+        breaker_threshold=args.breaker_threshold,
+        base_url=args.base_url or os.environ.get("ANTHROPIC_BASE_URL"),
+        request_timeout=args.request_timeout,
+        early_abort=args.early_abort,
+    )
 
     trigger_results: list[TriggerResult] = []
+    trigger_matchers: dict[str, dict] = {}
     functional_results: list[FunctionalResult] = []
+    response_cache = None
+    if args.cache_mode != "off" and args.mode in ("functional", "full", "loadtest"):
+        response_cache = ResponseCache(args.cache_mode, max_bytes=int(args.cache_max_mb * 1024 * 1024))
 
     if args.mode in ("trigger", "full"):
         print("Running trigger tests...")
-        trigger_results = run_trigger_tests()
+        try:
+            trigger_results = run_trigger_tests(args.matcher)
+        except (RuntimeError, ValueError) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(2)
+        trigger_matchers = compare_trigger_matchers()
 
     if args.mode in ("functional", "full"):
         print("Running functional tests...")
-        functional_results = run_functional_tests()
+        functional_results = run_functional_tests(runner_options, response_cache)
+
+    if args.mode == "loadtest":
+        try:
+            functional_results = run_loadtest(args, runner_options, response_cache)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(2)
+
+    if args.mode == "compare":
+        with HistoryStore(args.results_dir) as store:
+            store.import_reports(args.results_dir)
+            try:
+                comparison = compare_runs(
+                    store,
+                    run_id=args.run,
+                    baseline_id=args.baseline,
+                    window=args.window,
+                    alpha=args.alpha,
+                    min_change=args.min_change,
+                )
+            except LookupError as e:
+                print(f"ERROR: {e}", file=sys.stderr)
+                sys.exit(2)
+        print_comparison(comparison)
+        sys.exit(1 if comparison.regressed else 0)
 
     if args.mode == "report":
         # Load most recent report from results dir
@@ -585,9 +1593,19 @@ def main():
         print(json.dumps(data, indent=2))
         return
 
-    report = compute_report(args.mode, trigger_results, functional_results)
-    print_report(report)
+    report = compute_report(
+        args.mode,
+        trigger_results,
+        functional_results,
+        response_cache,
+        trigger_matcher=args.matcher,
+        trigger_matchers=trigger_matchers,
+    )
+    all_passed = print_report(report)
+    # Save failing runs too, so the history store sees regressions.
     save_report(report, args.results_dir)
+    if not all_passed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""Build and load the compiled CSCRF framework index.
+
+The index captures every standard and guideline in ``framework/**/*.md``
+(text, applicability, mandatory flag, referenced standards, and source line
+offsets) so validators do not have to re-read and regex-scan the corpus on
+every invocation. It is persisted under ``.cache/`` and keyed by the content
+hash of the framework files; a stale or missing index is rebuilt on load.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+FRAMEWORK_DIR = ROOT / "framework"
+CACHE_DIR = ROOT / ".cache"
+INDEX_PATH = CACHE_DIR / "framework-index.json"
+
+# Bump when the index layout or the parsing rules change.
+INDEX_VERSION = 1
+
+STANDARD_ID_RE = re.compile(r"\b[A-Z]{2}\.[A-Z]{2}\.S\d+\b")
+GUIDELINE_ID_RE = re.compile(r"\b[A-Z]{2}\.[A-Z]{2}\.G\d+\b")
+
+FRONTMATTER_KEY_RE = re.compile(r"^([a-z_]+):\s*(.*)$")
+STANDARD_ENTRY_RE = re.compile(r"^\s+-\s+id:\s*(\S+)\s*$")
+GUIDELINE_HEADING_RE = re.compile(r"^###\s+([A-Z]{2}\.[A-Z]{2}\.G\d+)\s*$")
+GUIDELINE_META_RE = re.compile(r"^-\s+\*\*(standards|applicability|mandatory):\*\*\s*(.*)$")
+
+
+def ok(message: str) -> None:
+    print(f"[PASS] {message}")
+
+
+def fail(message: str) -> None:
+    print(f"[FAIL] {message}")
+
+
+@dataclass
+class FrameworkIndex:
+    """In-memory view of the compiled framework index."""
+
+    digest: str
+    files: Dict[str, Dict[str, Any]]
+    standards: Dict[str, Dict[str, Any]]
+    guidelines: Dict[str, Dict[str, Any]]
+
+    @property
+    def standard_ids(self) -> Set[str]:
+        ids: Set[str] = set()
+        for record in self.files.values():
+            ids.update(record["standard_ids"])
+        return ids
+
+    @property
+    def guideline_ids(self) -> Set[str]:
+        ids: Set[str] = set()
+        for record in self.files.values():
+            ids.update(record["guideline_ids"])
+        return ids
+
+    def ids_for_files(self, rel_paths: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+        """Return (standard IDs, guideline IDs) mentioned in the given framework files."""
+        standards: Set[str] = set()
+        guidelines: Set[str] = set()
+        for rel_path in rel_paths:
+            record = self.files.get(rel_path)
+            if record is None:
+                continue
+            standards.update(record["standard_ids"])
+            guidelines.update(record["guideline_ids"])
+        return standards, guidelines
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "digest": self.digest,
+            "files": self.files,
+            "standards": self.standards,
+            "guidelines": self.guidelines,
+        }
+
+
+def _parse_inline_list(value: str) -> List[str]:
+    content = value.strip()
+    if content.startswith("[") and content.endswith("]"):
+        content = content[1:-1]
+    return [item.strip() for item in content.split(",") if item.strip()]
+
+
+def _fold(lines: Sequence[str]) -> str:
+    return " ".join(line.strip() for line in lines if line.strip())
+
+
+def parse_framework_file(rel_path: str, text: str) -> Dict[str, Any]:
+    """Parse one framework file into file, standard, and guideline records.
+
+    Line numbers are 1-based and refer to the source Markdown file.
+    """
+    lines = text.splitlines()
+    meta: Dict[str, str] = {}
+    standards: List[Dict[str, Any]] = []
+    guidelines: List[Dict[str, Any]] = []
+
+    index = 0
+    if lines and lines[0].strip() == "---":
+        index = 1
+        current: Dict[str, Any] | None = None
+        text_lines: List[str] = []
+        while index < len(lines) and lines[index].strip() != "---":
+            line = lines[index]
+            entry = STANDARD_ENTRY_RE.match(line)
+            if entry:
+                if current is not None:
+                    current["text"] = _fold(text_lines)
+                current = {"id": entry.group(1), "line": index + 1}
+                standards.append(current)
+                text_lines = []
+            elif current is not None:
+                stripped = line.strip()
+                if not stripped.startswith("text:"):
+                    text_lines.append(stripped)
+            else:
+                key_match = FRONTMATTER_KEY_RE.match(line)
+                if key_match and key_match.group(2) not in {"", ">", "|"}:
+                    meta[key_match.group(1)] = key_match.group(2).strip().strip('"')
+            index += 1
+        if current is not None:
+            current["text"] = _fold(text_lines)
+        index += 1
+
+    guideline: Dict[str, Any] | None = None
+    body_lines: List[str] = []
+
+    def close_guideline(end_line: int) -> None:
+        if guideline is None:
+            return
+        while body_lines and not body_lines[-1].strip():
+            body_lines.pop()
+        guideline["end_line"] = end_line
+        guideline["text"] = "\n".join(body_lines).strip()
+
+    while index < len(lines):
+        line = lines[index]
+        heading = GUIDELINE_HEADING_RE.match(line)
+        if heading:
+            close_guideline(index)
+            guideline = {
+                "id": heading.group(1),
+                "line": index + 1,
+                "standards": [],
+                "applicability": [],
+                "mandatory": False,
+            }
+            guidelines.append(guideline)
+            body_lines = []
+        elif line.startswith("## ") or line.startswith("### "):
+            close_guideline(index)
+            guideline = None
+        elif guideline is not None:
+            meta_match = GUIDELINE_META_RE.match(line)
+            if meta_match and not body_lines:
+                field, value = meta_match.groups()
+                if field == "mandatory":
+                    guideline["mandatory"] = value.strip().lower() == "true"
+                else:
+                    guideline[field] = _parse_inline_list(value)
+            else:
+                body_lines.append(line)
+        index += 1
+    close_guideline(len(lines))
+
+    code = meta.get("code", "")
+    function = meta.get("function", "")
+    for record in standards:
+        record["file"] = rel_path
+        record["code"] = code
+    for record in guidelines:
+        record["file"] = rel_path
+        record["code"] = code
+        record["function"] = function
+
+    return {
+        "file": {
+            "code": code,
+            "title": meta.get("title", ""),
+            "goal": meta.get("goal", ""),
+            "function": function,
+            "standards": [record["id"] for record in standards],
+            "guidelines": [record["id"] for record in guidelines],
+            "standard_ids": sorted(set(STANDARD_ID_RE.findall(text))),
+            "guideline_ids": sorted(set(GUIDELINE_ID_RE.findall(text))),
+        },
+        "standards": standards,
+        "guidelines": guidelines,
+    }
+
+
+def _framework_paths(root: Path) -> List[Path]:
+    return sorted((root / "framework").rglob("*.md"))
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _combined_digest(sources: Dict[str, Dict[str, Any]]) -> str:
+    hasher = hashlib.sha256(f"v{INDEX_VERSION}\n".encode("utf-8"))
+    for rel_path in sorted(sources):
+        hasher.update(f"{rel_path}\0{sources[rel_path]['sha256']}\n".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def build_index(root: Path = ROOT) -> Tuple[FrameworkIndex, Dict[str, Dict[str, Any]]]:
+    """Parse every framework file and return the index plus its source fingerprints."""
+    files: Dict[str, Dict[str, Any]] = {}
+    standards: Dict[str, Dict[str, Any]] = {}
+    guidelines: Dict[str, Dict[str, Any]] = {}
+    sources: Dict[str, Dict[str, Any]] = {}
+
+    for path in _framework_paths(root):
+        rel_path = path.relative_to(root).as_posix()
+        raw = path.read_bytes()
+        stat = path.stat()
+        sources[rel_path] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": _sha256(raw),
+        }
+        parsed = parse_framework_file(rel_path, raw.decode("utf-8"))
+        files[rel_path] = parsed["file"]
+        for record in parsed["standards"]:
+            standards[record.pop("id")] = record
+        for record in parsed["guidelines"]:
+            guidelines[record.pop("id")] = record
+
+    index = FrameworkIndex(
+        digest=_combined_digest(sources),
+        files=files,
+        standards=standards,
+        guidelines=guidelines,
+    )
+    return index, sources
+
+
+def _sources_current(root: Path, sources: Dict[str, Dict[str, Any]]) -> bool:
+    """Check cached fingerprints against the tree, hashing only files whose stat changed."""
+    paths = _framework_paths(root)
+    if len(paths) != len(sources):
+        return False
+    for path in paths:
+        rel_path = path.relative_to(root).as_posix()
+        cached = sources.get(rel_path)
+        if cached is None:
+            return False
+        stat = path.stat()
+        if stat.st_size == cached["size"] and stat.st_mtime_ns == cached["mtime_ns"]:
+            continue
+        if stat.st_size != cached["size"] or _sha256(path.read_bytes()) != cached["sha256"]:
+            return False
+    return True
+
+
+def write_index(
+    index: FrameworkIndex,
+    sources: Dict[str, Dict[str, Any]],
+    path: Path = INDEX_PATH,
+) -> None:
+    """Persist the index atomically (write to a temp file, then rename)."""
+    payload = {"version": INDEX_VERSION, "sources": sources, **index.to_dict()}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=".framework-index-", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"), ensure_ascii=False)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _read_cached(path: Path) -> Dict[str, Any] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return None
+    return data
+
+
+_LOADED: Dict[Path, FrameworkIndex] = {}
+
+
+def load_index(root: Path = ROOT, *, rebuild: bool = False) -> FrameworkIndex:
+    """Return the framework index, rebuilding and persisting it when stale.
+
+    Within one process the index is loaded at most once per root.
+    """
+    if not rebuild and root in _LOADED:
+        return _LOADED[root]
+
+    path = root / INDEX_PATH.relative_to(ROOT)
+    cached = None if rebuild else _read_cached(path)
+    if cached is not None and _sources_current(root, cached["sources"]):
+        index = FrameworkIndex(
+            digest=cached["digest"],
+            files=cached["files"],
+            standards=cached["standards"],
+            guidelines=cached["guidelines"],
+        )
+    else:
+        index, sources = build_index(root)
+        try:
+            write_index(index, sources, path)
+        except OSError:
+            # A read-only checkout still gets a correct in-memory index.
+            pass
+
+    _LOADED[root] = index
+    return index
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the cached index and rebuild it.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if the cached index is missing or stale instead of rebuilding it.",
+    )
+    parser.add_argument("--print-path", action="store_true", help="Print the index path and exit.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+
+    if args.print_path:
+        print(INDEX_PATH)
+        return 0
+
+    if args.check:
+        cached = _read_cached(INDEX_PATH)
+        if cached is None:
+            fail(f"framework index missing or unreadable: {INDEX_PATH.relative_to(ROOT)}")
+            return 1
+        if not _sources_current(ROOT, cached["sources"]):
+            fail("framework index is stale; run scripts/framework_index.py --rebuild")
+            return 1
+        ok(f"Framework index is current: {cached['digest'][:12]}")
+        return 0
+
+    index = load_index(rebuild=args.rebuild)
+    mandatory = sum(1 for record in index.guidelines.values() if record["mandatory"])
+    ok(f"Framework index {index.digest[:12]} at {INDEX_PATH.relative_to(ROOT)}")
+    ok(
+        f"Indexed files={len(index.files)}, standards={len(index.standards)}, "
+        f"guidelines={len(index.guidelines)} (mandatory={mandatory})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
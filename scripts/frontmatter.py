@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""Shared YAML frontmatter parser for skills, policies and workflow artifacts.
+
+A single-pass fast path covers the schema used across this repository:
+top-level ``key: value`` scalars (bare, single- or double-quoted, with
+trailing ``# comments``), inline ``[a, b]`` lists, ``- item`` block lists,
+one level of nested ``key: value`` mappings (SKILL.md ``metadata:``),
+comments and blank lines. Anything else, such as folded/literal block
+scalars, flow mappings, anchors or escapes in double quotes, falls back to
+PyYAML's BaseLoader. Like the fast path, BaseLoader keeps every scalar a
+string, so both paths agree on types.
+
+The block must open on the first line with ``---`` and close at the next
+line that is exactly ``---`` (trailing whitespace, CRLF endings and a UTF-8
+BOM are tolerated). Results record the source line of every top-level key
+and any problems found, so validators can point at ``file:line``.
+load_frontmatter() memoizes by path, mtime and size, so the several stages
+that inspect the same file parse it once.
+
+Usage:
+    python3 scripts/frontmatter.py docs/policies/access-control.md
+    python3 scripts/frontmatter.py --json .claude/skills/*/SKILL.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import yaml
+    HAS_YAML = True
+except ImportError:
+    HAS_YAML = False
+
+_CLOSING_RE = re.compile(r"^---[ \t]*\r?$", re.MULTILINE)
+_KEY_RE = re.compile(r"^([A-Za-z0-9_][A-Za-z0-9_.-]*)[ \t]*:(?:[ \t]+(.*))?$")
+_ITEM_RE = re.compile(r"^[ \t]*-(?:[ \t]+(.*))?$")
+_FLOW_SPECIAL_RE = re.compile(r"[\[\]{}\"']")
+_SINGLE_QUOTED_RE = re.compile(r"^'((?:[^']|'')*)'[ \t]*(?:#.*)?$")
+# Leading characters that need more YAML than the fast path implements.
+_YAML_ONLY_STARTS = frozenset("{|>&*!%@`")
+_QUOTE_OR_SPECIAL = _YAML_ONLY_STARTS | frozenset("\"']")
+
+
+@dataclass(frozen=True)
+class FrontmatterIssue:
+    line: int
+    message: str
+
+
+@dataclass
+class Frontmatter:
+    """Parsed frontmatter. Treat as read-only: load_frontmatter() shares instances."""
+
+    data: Dict[str, Any]
+    key_lines: Dict[str, int]
+    end_line: int
+    issues: List[FrontmatterIssue] = field(default_factory=list)
+    via_yaml: bool = False
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.data.get(key, default)
+
+    def line_of(self, key: str) -> int:
+        """1-based file line of ``key``, or the opening ``---`` line when absent."""
+        return self.key_lines.get(key, 1)
+
+
+class _Unsupported(Exception):
+    def __init__(self, line: int, construct: str) -> None:
+        super().__init__(construct)
+        self.line = line
+        self.construct = construct
+
+
+def _scalar(value: str, line: int) -> str:
+    """Decode one scalar the way YAML's BaseLoader would, or raise _Unsupported."""
+    if not value:
+        return ""
+    first = value[0]
+    if first == '"':
+        end = value.find('"', 1)
+        if "\\" in value or end < 0:
+            raise _Unsupported(line, "escaped or multi-line double-quoted string")
+        rest = value[end + 1 :].strip()
+        if rest and not rest.startswith("#"):
+            raise _Unsupported(line, "text after a quoted string")
+        return value[1:end]
+    if first == "'":
+        match = _SINGLE_QUOTED_RE.match(value)
+        if not match:
+            raise _Unsupported(line, "multi-line single-quoted string")
+        return match.group(1).replace("''", "'")
+    if first in _YAML_ONLY_STARTS or first in "[]":
+        raise _Unsupported(line, f"value starting with {first!r}")
+    comment = value.find(" #")
+    if comment >= 0:
+        value = value[:comment]
+    return value.rstrip()
+
+
+def _inline_list(value: str, line: int) -> List[str]:
+    if value[-1] != "]":
+        comment = value.find(" #", value.rfind("]"))
+        if comment >= 0:
+            value = value[:comment].rstrip()
+        if not value.endswith("]"):
+            raise _Unsupported(line, "multi-line flow sequence")
+    content = value[1:-1]
+    if _FLOW_SPECIAL_RE.search(content):
+        raise _Unsupported(line, "nested or quoted flow sequence")
+    return [item for item in map(str.strip, content.split(",")) if item]
+
+
+def _fast_parse(
+    block: str, first_line: int, strict: bool, issues: List[FrontmatterIssue]
+) -> Tuple[Dict[str, Any], Dict[str, int]]:
+    """Single pass over the block. With ``strict`` unsupported constructs raise
+    _Unsupported; otherwise they are recorded as issues and skipped."""
+    data: Dict[str, Any] = {}
+    key_lines: Dict[str, int] = {}
+    parent: Optional[str] = None  # key whose value is an indented list or mapping
+    if "\r" in block:
+        block = block.replace("\r", "")
+
+    for number, line in enumerate(block.split("\n"), start=first_line):
+        if not line or line[0] == "#":
+            continue
+        try:
+            if line[0] in " \t-":
+                stripped = line.strip()
+                if not stripped or stripped[0] == "#":
+                    continue
+                if parent is None:
+                    raise _Unsupported(number, "unexpected indentation or list item")
+                current = data[parent]
+                if stripped[0] == "-" and (len(stripped) == 1 or stripped[1] in " \t"):
+                    if current == "":
+                        current = data[parent] = []
+                    if not isinstance(current, list):
+                        raise _Unsupported(number, "list item inside a mapping")
+                    value = stripped[1:].strip()
+                    if _KEY_RE.match(value) or value.startswith("- "):
+                        raise _Unsupported(number, "nested structure in a list item")
+                    current.append(_scalar(value, number))
+                    continue
+                entry = _KEY_RE.match(stripped) if line[0] != "-" else None
+                if entry is None:
+                    raise _Unsupported(number, "unexpected indentation")
+                if current == "":
+                    current = data[parent] = {}
+                if not isinstance(current, dict):
+                    raise _Unsupported(number, "mapping entry inside a list")
+                value = (entry.group(2) or "").strip()
+                if not value or value[0] == "[":
+                    raise _Unsupported(number, "mapping nested deeper than one level")
+                current[entry.group(1)] = _scalar(value, number)
+                continue
+
+            parent = None
+            entry = _KEY_RE.match(line)
+            if entry is None:
+                raise _Unsupported(number, "expected 'key: value'")
+            key, value = entry.group(1), entry.group(2)
+            if key in data:
+                issues.append(FrontmatterIssue(number, f"duplicate key '{key}' (last value wins)"))
+            key_lines[key] = number
+            value = value.strip() if value else ""
+            if not value:
+                data[key] = ""
+                parent = key
+            elif value[0] == "[":
+                data[key] = _inline_list(value, number)
+            elif value[0] in _QUOTE_OR_SPECIAL or " #" in value:
+                data[key] = _scalar(value, number)
+            else:
+                data[key] = value
+        except _Unsupported as exc:
+            if strict:
+                raise
+            issues.append(FrontmatterIssue(exc.line, f"unsupported frontmatter: {exc.construct}"))
+    return data, key_lines
+
+
+def _top_level_key_lines(block: str, first_line: int) -> Dict[str, int]:
+    key_lines: Dict[str, int] = {}
+    for number, line in enumerate(block.split("\n"), start=first_line):
+        entry = _KEY_RE.match(line.rstrip("\r")) if line[:1] not in ("", " ", "\t", "#", "-") else None
+        if entry:
+            key_lines.setdefault(entry.group(1), number)
+    return key_lines
+
+
+def parse_frontmatter(text: str) -> Optional[Frontmatter]:
+    """Parse the leading ``---`` block of ``text``; None when there is none or it never closes."""
+    if text.startswith("\ufeff"):
+        text = text[1:]
+    if not text.startswith("---"):
+        return None
+    opening_end = text.find("\n")
+    if opening_end < 0 or text[3:opening_end].strip():
+        return None
+    closing = _CLOSING_RE.search(text, opening_end + 1)
+    if closing is None:
+        return None
+
+    block = text[opening_end + 1 : max(closing.start() - 1, opening_end + 1)]
+    end_line = text.count("\n", 0, closing.start()) + 1
+    issues: List[FrontmatterIssue] = []
+    try:
+        data, key_lines = _fast_parse(block, 2, True, issues)
+        return Frontmatter(data, key_lines, end_line, issues)
+    except _Unsupported as exc:
+        if not HAS_YAML:
+            issues = [
+                FrontmatterIssue(exc.line, f"{exc.construct} needs PyYAML; parsed what the fast path supports")
+            ]
+            data, key_lines = _fast_parse(block, 2, False, issues)
+            return Frontmatter(data, key_lines, end_line, issues)
+
+    try:
+        loaded = yaml.load(block.replace("\r\n", "\n"), Loader=yaml.BaseLoader)
+    except yaml.YAMLError as exc:
+        mark = getattr(exc, "problem_mark", None)
+        line = mark.line + 2 if mark is not None else 1
+        problem = getattr(exc, "problem", None) or str(exc).splitlines()[0]
+        issue = FrontmatterIssue(line, f"invalid YAML: {problem}")
+    else:
+        if loaded is None:
+            loaded = {}
+        if isinstance(loaded, dict):
+            return Frontmatter(loaded, _top_level_key_lines(block, 2), end_line, [], True)
+        issue = FrontmatterIssue(2, "frontmatter must be a mapping")
+
+    # Invalid YAML: keep whatever the lenient fast path can recover, so one bad
+    # line surfaces as a located issue instead of hiding every other key. The
+    # fast path usually pinpoints the offending line better than the YAML mark.
+    issues = []
+    data, key_lines = _fast_parse(block, 2, False, issues)
+    return Frontmatter(data, key_lines, end_line, issues or [issue], True)
+
+
+_CACHE: Dict[str, Tuple[int, int, Optional[Frontmatter]]] = {}
+
+
+def load_frontmatter(path: Path) -> Optional[Frontmatter]:
+    """Parse ``path``'s frontmatter, reusing the previous result while mtime and size are unchanged.
+
+    Raises OSError or UnicodeDecodeError if the file cannot be read.
+    """
+    key = os.fspath(path)
+    if not os.path.isabs(key):
+        key = os.path.abspath(key)
+    cached = _CACHE.get(key)
+    if cached is not None:
+        stat = os.stat(key)
+        if cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+    with open(key, "rb") as handle:
+        stat = os.fstat(handle.fileno())
+        raw = handle.read()
+    result = parse_frontmatter(raw.decode("utf-8"))
+    _CACHE[key] = (stat.st_mtime_ns, stat.st_size, result)
+    return result
+
+
+def clear_cache() -> None:
+    _CACHE.clear()
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Print the parsed frontmatter of Markdown files.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("paths", nargs="+", type=Path, help="Markdown files")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    results: Dict[str, Any] = {}
+    code = 0
+    for path in args.paths:
+        try:
+            fm = load_frontmatter(path)
+        except (OSError, UnicodeDecodeError) as exc:
+            print(f"ERROR: {path}: {exc}", file=sys.stderr)
+            code = 2
+            continue
+        if fm is None:
+            results[str(path)] = None
+            code = max(code, 1)
+            continue
+        if fm.issues:
+            code = max(code, 1)
+        results[str(path)] = {
+            "data": fm.data,
+            "key_lines": fm.key_lines,
+            "end_line": fm.end_line,
+            "via_yaml": fm.via_yaml,
+            "issues": [f"{issue.line}: {issue.message}" for issue in fm.issues],
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return code
+    for name, result in results.items():
+        if result is None:
+            print(f"{name}: no frontmatter")
+            continue
+        print(f"{name}: {len(result['data'])} keys, ends at line {result['end_line']}"
+              + (" (YAML fallback)" if result["via_yaml"] else ""))
+        for key, value in result["data"].items():
+            print(f"  {result['key_lines'].get(key, '?'):>4}  {key}: {value}")
+        for issue in result["issues"]:
+            print(f"  [WARN] {name}:{issue}")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,42 +1,103 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
+# Usage: bash scripts/install_ciso_fixtures.sh [--force] [--workspace-root DIR] [--workspace NAME]...
+# Without --workspace the fixtures go to the legacy layout (<root> and its sibling
+# policies/, i.e. docs/.ciso-work and docs/policies); each --workspace NAME gets its
+# own copy in <root>/NAME and <root>/NAME/policies. Files are copied to a temp name and
+# renamed into place under the workspace lock, so concurrent readers never see a torn file.
+
+usage="Usage: bash scripts/install_ciso_fixtures.sh [--force] [--workspace-root DIR] [--workspace NAME]..."
 force=0
-if [[ "${1:-}" == "--force" ]]; then
-  force=1
-elif [[ "${1:-}" != "" ]]; then
-  echo "[FAIL] unknown argument: ${1}"
-  echo "Usage: bash scripts/install_ciso_fixtures.sh [--force]"
-  exit 1
-fi
+workspace_root="${CISO_WORKSPACE_ROOT:-docs/.ciso-work}"
+workspaces=()
+while [[ $# -gt 0 ]]; do
+  case "$1" in
+    --force) force=1 ;;
+    --workspace-root)
+      [[ $# -ge 2 ]] || { echo "[FAIL] --workspace-root needs a directory"; echo "$usage"; exit 1; }
+      workspace_root="$2"
+      shift
+      ;;
+    --workspace)
+      [[ $# -ge 2 ]] || { echo "[FAIL] --workspace needs a name"; echo "$usage"; exit 1; }
+      if [[ ! "$2" =~ ^[A-Za-z0-9][A-Za-z0-9._-]*$ || "$2" == "policies" ]]; then
+        echo "[FAIL] invalid workspace name: $2"
+        exit 1
+      fi
+      workspaces+=("$2")
+      shift
+      ;;
+    *)
+      echo "[FAIL] unknown argument: $1"
+      echo "$usage"
+      exit 1
+      ;;
+  esac
+  shift
+done
 
 repo_root="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+cd "$repo_root"
 fixture_root="$repo_root/tests/fixtures"
 work_src="$fixture_root/ciso-work"
 policy_src="$fixture_root/policies"
-work_dst="$repo_root/docs/.ciso-work"
-policy_dst="$repo_root/docs/policies"
 
 if [[ ! -d "$work_src" || ! -d "$policy_src" ]]; then
   echo "[FAIL] fixture source directories missing under tests/fixtures"
   exit 1
 fi
 
-mkdir -p "$work_dst" "$policy_dst"
-
-if [[ "$force" -eq 0 ]]; then
-  for path in "$work_dst/entity-profile.md" "$work_dst/entity-profile.json" "$work_dst/entity-tags.json" \
-              "$work_dst/gap-analysis.md" "$work_dst/gap-analysis.json" "$work_dst/policy-plan.md" \
-              "$work_dst/review-findings.md" "$work_dst/roadmap.md" "$policy_dst/access-control.md"; do
-    if [[ -e "$path" ]]; then
-      echo "[FAIL] destination file already exists: ${path#$repo_root/}"
-      echo "Run with --force to overwrite fixture-target paths."
-      exit 1
-    fi
-  done
+if [[ ${#workspaces[@]} -eq 0 ]]; then
+  workspaces=(".")
 fi
 
-cp -f "$work_src"/* "$work_dst"/
-cp -f "$policy_src"/*.md "$policy_dst"/
+# Copy $1 to $2 via a temp file in the destination directory and an atomic rename.
+install_file() {
+  local src="$1"
+  local dst="$2"
+  local tmp
+  tmp="$(mktemp "$(dirname "$dst")/.$(basename "$dst").XXXXXX")"
+  cp -f "$src" "$tmp"
+  chmod 644 "$tmp"
+  mv -f "$tmp" "$dst"
+}
+
+for name in "${workspaces[@]}"; do
+  if [[ "$name" == "." ]]; then
+    work_dst="$workspace_root"
+    policy_dst="$(dirname "$workspace_root")/policies"
+  else
+    work_dst="$workspace_root/$name"
+    policy_dst="$work_dst/policies"
+  fi
+  mkdir -p "$work_dst" "$policy_dst"
+
+  if [[ "$force" -eq 0 ]]; then
+    for path in "$work_dst/entity-profile.md" "$work_dst/entity-profile.json" "$work_dst/entity-tags.json" \
+                "$work_dst/gap-analysis.md" "$work_dst/gap-analysis.json" "$work_dst/policy-plan.md" \
+                "$work_dst/review-findings.md" "$work_dst/roadmap.md" "$policy_dst/access-control.md"; do
+      if [[ -e "$path" ]]; then
+        echo "[FAIL] destination file already exists: ${path#$repo_root/}"
+        echo "Run with --force to overwrite fixture-target paths."
+        exit 1
+      fi
+    done
+  fi
+
+  (
+    # Same advisory lock scripts/workspaces.py takes for writers.
+    if command -v flock >/dev/null 2>&1; then
+      exec 9>>"$work_dst/.lock"
+      flock 9
+    fi
+    for src in "$work_src"/*; do
+      install_file "$src" "$work_dst/$(basename "$src")"
+    done
+    for src in "$policy_src"/*.md; do
+      install_file "$src" "$policy_dst/$(basename "$src")"
+    done
+  )
 
-echo "[PASS] installed fixture artifacts into docs/.ciso-work and docs/policies"
+  echo "[PASS] installed fixture artifacts into $work_dst and $policy_dst"
+done
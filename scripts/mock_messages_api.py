@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Local mock of the Messages API for exercising eval_skills_api.py offline.
+
+Serves POST /v1/messages with plain JSON or server-sent-event streaming,
+with configurable latency, injected failures, and scripted responses:
+
+    --latency SPEC        time to first token in ms: fixed:MS, uniform:LO,HI,
+                          normal:MEAN,SD or lognormal:MEDIAN,SIGMA
+    --token-delay-ms MS   delay between streamed text deltas
+    --error-429 P         probability of a 429 with a retry-after header
+    --error-5xx P         probability of a 500/529 response
+    --timeout P           probability of hanging, then dropping the connection
+    --script FILE         JSON object of scripted responses keyed by test ID
+                          (x-eval-test-id header) or by exact prompt text
+
+A scripted response is {"text": ..., "status": ..., "latency_ms": ...,
+"tool_calls": N}; any field may be omitted. Error injection is seeded, so a
+given --seed and request order reproduce the same failures.
+
+Usage:
+    python3 scripts/mock_messages_api.py --port 8765 --latency lognormal:400,0.6 --error-429 0.05
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=mock \\
+        uv run scripts/eval_skills_api.py functional --concurrency 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import math
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+TEST_ID_HEADER = "x-eval-test-id"
+FILLER_WORDS = (
+    "cscrf compliance guideline policy control access incident response vendor data "
+    "security resilience audit evidence mandatory applicability governance"
+).split()
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Return a sampler of latencies in milliseconds for a --latency spec."""
+    kind, _, params = spec.partition(":")
+    try:
+        values = [float(value) for value in params.split(",")] if params else []
+    except ValueError:
+        raise ValueError(f"invalid latency spec: {spec}") from None
+
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "normal" and len(values) == 2:
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == "lognormal" and len(values) == 2 and values[0] > 0:
+        median, sigma = values
+        mu = math.log(median)
+        return lambda rng: rng.lognormvariate(mu, sigma)
+    raise ValueError(f"invalid latency spec: {spec}")
+
+
+@dataclass
+class MockConfig:
+    latency: str = "fixed:50"
+    token_delay_ms: float = 0.0
+    output_tokens: int = 64
+    error_429: float = 0.0
+    error_5xx: float = 0.0
+    timeout: float = 0.0
+    timeout_hang_ms: float = 5000.0
+    retry_after_s: float = 1.0
+    seed: int = 0
+    scripts: dict = field(default_factory=dict)
+
+
+class MockState:
+    """Shared, lock-protected state of one mock server."""
+
+    def __init__(self, config: MockConfig):
+        self.config = config
+        self.sample_latency = parse_latency(config.latency)
+        self._rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.requests = 0
+        self.errors = {"429": 0, "5xx": 0, "timeout": 0}
+
+    def draw(self) -> tuple[int, float, float]:
+        """Return (message number, uniform draw for errors, latency in ms)."""
+        with self._lock:
+            self.requests += 1
+            return next(self._ids), self._rng.random(), self.sample_latency(self._rng)
+
+    def count_error(self, kind: str) -> None:
+        with self._lock:
+            self.errors[kind] += 1
+
+
+def _response_text(test_id: str, tokens: int) -> list[str]:
+    words = [f"Mock response for {test_id or 'request'}:"]
+    words += [FILLER_WORDS[i % len(FILLER_WORDS)] for i in range(max(0, tokens - 1))]
+    return [word + " " for word in words]
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    server_version = "MockMessagesAPI/1.0"
+    protocol_version = "HTTP/1.1"
+    state: MockState
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def _send_json(self, status: int, payload: dict, headers: Optional[dict] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, error_type: str, message: str, headers: Optional[dict] = None) -> None:
+        self._send_json(
+            status,
+            {"type": "error", "error": {"type": error_type, "message": message}},
+            headers,
+        )
+
+    def _event(self, name: str, payload: dict) -> None:
+        chunk = f"event: {name}\ndata: {json.dumps(payload)}\n\n".encode("utf-8")
+        self.wfile.write(f"{len(chunk):x}\r\n".encode("ascii") + chunk + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self) -> None:
+        if self.path.split("?")[0].rstrip("/") != "/v1/messages":
+            self._send_error(404, "not_found_error", f"no route for {self.path}")
+            return
+        length = int(self.headers.get("content-length") or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_error(400, "invalid_request_error", "body is not valid JSON")
+            return
+
+        state = self.state
+        config = state.config
+        number, draw, latency_ms = state.draw()
+        messages = request.get("messages") or [{}]
+        prompt = messages[-1].get("content", "")
+        prompt = prompt if isinstance(prompt, str) else json.dumps(prompt)
+        test_id = self.headers.get(TEST_ID_HEADER, "")
+        script = config.scripts.get(test_id) or config.scripts.get(prompt) or {}
+        latency_ms = script.get("latency_ms", latency_ms)
+
+        status = script.get("status")
+        if status is None:
+            if draw < config.timeout:
+                status = "timeout"
+            elif draw < config.timeout + config.error_429:
+                status = 429
+            elif draw < config.timeout + config.error_429 + config.error_5xx:
+                status = 529 if number % 2 else 500
+
+        if status == "timeout":
+            state.count_error("timeout")
+            time.sleep(config.timeout_hang_ms / 1000)
+            self.close_connection = True
+            return
+        if status == 429:
+            state.count_error("429")
+            self._send_error(
+                429, "rate_limit_error", "mock rate limit",
+                {"retry-after": f"{config.retry_after_s:g}"},
+            )
+            return
+        if isinstance(status, int) and status >= 400:
+            state.count_error("5xx")
+            error_type = "overloaded_error" if status == 529 else "api_error"
+            self._send_error(status, error_type, f"mock {status}")
+            return
+
+        if "text" in script:
+            chunks = [word + " " for word in str(script["text"]).split(" ")]
+        else:
+            chunks = _response_text(test_id, config.output_tokens)
+        input_tokens = max(1, len(prompt) // 4)
+        tool_calls = int(script.get("tool_calls", 0))
+        message_id = f"msg_mock_{number:08d}"
+        model = request.get("model", "mock")
+
+        time.sleep(max(0.0, latency_ms) / 1000)
+
+        if not request.get("stream"):
+            content = [
+                {"type": "tool_use", "id": f"toolu_mock_{number}_{i}", "name": "mock_tool", "input": {}}
+                for i in range(tool_calls)
+            ]
+            content.append({"type": "text", "text": "".join(chunks)})
+            self._send_json(200, {
+                "id": message_id, "type": "message", "role": "assistant", "model": model,
+                "content": content, "stop_reason": "end_turn", "stop_sequence": None,
+                "usage": {"input_tokens": input_tokens, "output_tokens": len(chunks)},
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("cache-control", "no-cache")
+        self.send_header("transfer-encoding", "chunked")
+        self.end_headers()
+        try:
+            self._event("message_start", {"type": "message_start", "message": {
+                "id": message_id, "type": "message", "role": "assistant", "model": model,
+                "content": [], "stop_reason": None, "stop_sequence": None,
+                "usage": {"input_tokens": input_tokens, "output_tokens": 1},
+            }})
+            index = 0
+            for i in range(tool_calls):
+                self._event("content_block_start", {"type": "content_block_start", "index": index,
+                            "content_block": {"type": "tool_use", "id": f"toolu_mock_{number}_{i}",
+                                              "name": "mock_tool", "input": {}}})
+                self._event("content_block_stop", {"type": "content_block_stop", "index": index})
+                index += 1
+            self._event("content_block_start", {"type": "content_block_start", "index": index,
+                        "content_block": {"type": "text", "text": ""}})
+            for position, chunk in enumerate(chunks):
+                if position and config.token_delay_ms:
+                    time.sleep(config.token_delay_ms / 1000)
+                self._event("content_block_delta", {"type": "content_block_delta", "index": index,
+                            "delta": {"type": "text_delta", "text": chunk}})
+            self._event("content_block_stop", {"type": "content_block_stop", "index": index})
+            self._event("message_delta", {"type": "message_delta",
+                        "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                        "usage": {"output_tokens": len(chunks)}})
+            self._event("message_stop", {"type": "message_stop"})
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # The client aborted the stream (e.g. --early-abort).
+            self.close_connection = True
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address) -> None:
+        # Clients drop kept-alive connections between requests; that is not an error.
+        if isinstance(sys.exc_info()[1], (BrokenPipeError, ConnectionResetError)):
+            return
+        super().handle_error(request, client_address)
+
+
+def start_mock_server(config: MockConfig, host: str = "127.0.0.1", port: int = 0):
+    """Start the mock in a daemon thread. Returns (server, state, base_url)."""
+    state = MockState(config)
+    handler = type("BoundMockHandler", (MockHandler,), {"state": state})
+    server = MockServer((host, port), handler)
+    thread = threading.Thread(target=server.serve_forever, name="mock-messages-api", daemon=True)
+    thread.start()
+    return server, state, f"http://{host}:{server.server_address[1]}"
+
+
+def load_scripts(path: Optional[Path]) -> dict:
+    if path is None:
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a JSON object keyed by test ID or prompt")
+    return data
+
+
+def add_mock_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = MockConfig()
+    parser.add_argument("--latency", default=defaults.latency,
+                        help=f"Time-to-first-token distribution in ms (default: {defaults.latency})")
+    parser.add_argument("--token-delay-ms", type=float, default=defaults.token_delay_ms,
+                        help="Delay between streamed text deltas in ms (default: 0)")
+    parser.add_argument("--output-tokens", type=int, default=defaults.output_tokens,
+                        help=f"Words per unscripted response (default: {defaults.output_tokens})")
+    parser.add_argument("--error-429", type=float, default=0.0, help="Probability of a 429 response")
+    parser.add_argument("--error-5xx", type=float, default=0.0, help="Probability of a 500/529 response")
+    parser.add_argument("--timeout", type=float, default=0.0,
+                        help="Probability of hanging and dropping the connection")
+    parser.add_argument("--timeout-hang-ms", type=float, default=defaults.timeout_hang_ms,
+                        help=f"How long a timed-out request hangs (default: {defaults.timeout_hang_ms:g})")
+    parser.add_argument("--retry-after", type=float, default=defaults.retry_after_s,
+                        help=f"retry-after seconds sent with 429s (default: {defaults.retry_after_s:g})")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for latency and error draws")
+    parser.add_argument("--script", type=Path, help="JSON file of scripted responses")
+
+
+def config_from_args(args: argparse.Namespace) -> MockConfig:
+    parse_latency(args.latency)
+    return MockConfig(
+        latency=args.latency,
+        token_delay_ms=args.token_delay_ms,
+        output_tokens=args.output_tokens,
+        error_429=args.error_429,
+        error_5xx=args.error_5xx,
+        timeout=args.timeout,
+        timeout_hang_ms=args.timeout_hang_ms,
+        retry_after_s=args.retry_after,
+        seed=args.seed,
+        scripts=load_scripts(args.script),
+    )
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Local mock Messages API",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_mock_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    try:
+        config = config_from_args(args)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+    server, state, base_url = start_mock_server(config, args.host, args.port)
+    print(f"Mock Messages API listening on {base_url}", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        print(f"Served {state.requests} requests; injected errors: {state.errors}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -2,7 +2,8 @@
 set -euo pipefail
 
 # Package each Claude Code skill as an individual .zip for distribution.
-# Output: dist/ciso.zip, dist/ciso-policy.zip, dist/ciso-assess.zip
+# Output: dist/ciso.zip (with references/search-index.json and references/resolver-truth-table.json),
+# dist/ciso-policy.zip, dist/ciso-assess.zip
 
 repo_root="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
 skills_dir="$repo_root/.claude/skills"
@@ -10,6 +11,21 @@ dist_dir="$repo_root/dist"
 
 mkdir -p "$dist_dir"
 
+# Generated references staged into skill zips on top of .claude/skills/.
+stage_dir="$(mktemp -d)"
+trap 'rm -rf "$stage_dir"' EXIT
+mkdir -p "$stage_dir/ciso/references"
+
+# Prebuild the BM25 search index so retrieval loads it instead of indexing at query time.
+# It ships inside the ciso skill, where search_index.py looks before .cache/.
+python3 "$repo_root/scripts/search_index.py" --build
+cp -f "$repo_root/.cache/search-index.json" "$stage_dir/ciso/references/search-index.json"
+
+# Ship the resolver truth table so agents can read tags and guideline sets statically.
+# The check fails packaging when the table is stale.
+python3 "$repo_root/scripts/resolver_truth_table.py"
+cp -f "$repo_root/scripts/data/resolver-truth-table.json" "$stage_dir/ciso/references/resolver-truth-table.json"
+
 skills=(ciso ciso-policy ciso-assess)
 
 for skill in "${skills[@]}"; do
@@ -23,6 +39,9 @@ for skill in "${skills[@]}"; do
   rm -f "$zip_path"
 
   (cd "$skills_dir" && zip -r "$zip_path" "$skill/" -x '*.DS_Store' '*__pycache__*')
+  if [[ -d "$stage_dir/$skill" ]]; then
+    (cd "$stage_dir" && zip -r "$zip_path" "$skill/")
+  fi
 
   echo "[OK] $zip_path"
 done
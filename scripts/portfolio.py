@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""Portfolio-wide applicability and gap rollups, deduplicated by tag set.
+
+Entities that resolve to the same tag set (for example every mid-size stock
+broker with a third-party SOC) have identical applicable and mandatory
+guideline sets. The portfolio groups profiles by their resolved tag mask,
+an applicability equivalence class, and computes each class's guideline
+sets and per-function summary once. It then fans them out to:
+
+- per-entity records (--entities-out, JSONL): the entity's class, tags and
+  applicable/mandatory guidelines, plus its gap-analysis status counts and
+  any mandatory guidelines its gap analysis has not assessed, when the
+  entity comes from a workspace that has one;
+- a portfolio rollup: the classes with their members, how many entities
+  each guideline applies to or is mandatory for, and gap status totals.
+
+Per-guideline counts are summed over classes rather than entities, so at
+hundreds of entities the work tracks the number of distinct tag sets
+(a few dozen at most), not the portfolio size.
+
+Usage:
+    python3 scripts/portfolio.py --profiles .cache/synthetic-corpus/profiles.jsonl
+    python3 scripts/portfolio.py --profiles entities.csv --entities-out per-entity.jsonl --json
+    python3 scripts/portfolio.py --workspaces              # every workspace's entity-profile.json
+    python3 scripts/portfolio.py --workspaces --workspace acme-broking --workspace zenith-amc
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from applicability_query import ApplicabilityEngine, get_engine, tag_mask
+from framework_index import load_index
+from resolve_entity_tags import ResolverError, iter_profiles, resolve_tags
+from workspaces import ROOT_ENV, Workspace, artifact_path, display_path, locked, select, workspace_root
+
+# Profile fields that name an entity, in order of preference.
+ENTITY_KEYS = ("id", "entity_id", "name", "entity_name")
+
+
+def ok(message: str) -> None:
+    print(f"[PASS] {message}")
+
+
+def fail(message: str) -> None:
+    print(f"[FAIL] {message}")
+
+
+def warn(message: str) -> None:
+    print(f"[WARN] {message}")
+
+
+# ---------------------------------------------------------------------------
+# Model
+# ---------------------------------------------------------------------------
+
+@dataclass
+class EntityInput:
+    entity: str
+    source: str
+    profile: Any
+    gap_rows: Optional[List[Dict[str, Any]]] = None
+    gap_error: Optional[str] = None
+
+
+@dataclass
+class ApplicabilityClass:
+    """Entities sharing one resolved tag set, and the guideline sets computed once for them."""
+
+    tags: List[str]
+    applicable: List[str]
+    mandatory: List[str]
+    by_function: Dict[str, Dict[str, int]]
+    members: List[str] = field(default_factory=list)
+    id: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "tags": self.tags,
+            "entities": len(self.members),
+            "applicable_count": len(self.applicable),
+            "mandatory_count": len(self.mandatory),
+            "by_function": self.by_function,
+            "applicable": self.applicable,
+            "mandatory": self.mandatory,
+            "members": self.members,
+        }
+
+
+@dataclass
+class EntityResult:
+    entity: str
+    source: str
+    entity_type: Optional[str] = None
+    category: Optional[str] = None
+    group: Optional[ApplicabilityClass] = None
+    gap_status: Optional[Dict[str, int]] = None
+    unassessed_mandatory: Optional[List[str]] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"entity": self.entity, "source": self.source}
+        if self.error is not None:
+            data["error"] = self.error
+            return data
+        assert self.group is not None
+        data.update(
+            {
+                "entity_type": self.entity_type,
+                "category": self.category,
+                "class": self.group.id,
+                "tags": self.group.tags,
+                "applicable_count": len(self.group.applicable),
+                "mandatory_count": len(self.group.mandatory),
+                "applicable": self.group.applicable,
+                "mandatory": self.group.mandatory,
+            }
+        )
+        if self.gap_status is not None:
+            data["gap_status"] = self.gap_status
+            data["unassessed_mandatory"] = self.unassessed_mandatory
+        return data
+
+
+@dataclass
+class Portfolio:
+    classes: List[ApplicabilityClass]
+    entities: List[EntityResult]
+    guideline_order: List[str]
+
+    @property
+    def failed(self) -> List[EntityResult]:
+        return [result for result in self.entities if result.error is not None]
+
+    def guideline_counts(self) -> Dict[str, Dict[str, int]]:
+        """Entities each guideline applies to / is mandatory for, summed per class."""
+        applicable: Counter[str] = Counter()
+        mandatory: Counter[str] = Counter()
+        for group in self.classes:
+            size = len(group.members)
+            for guideline_id in group.applicable:
+                applicable[guideline_id] += size
+            for guideline_id in group.mandatory:
+                mandatory[guideline_id] += size
+        return {
+            guideline_id: {"applicable": applicable[guideline_id], "mandatory": mandatory[guideline_id]}
+            for guideline_id in self.guideline_order
+            if applicable[guideline_id]
+        }
+
+    def gap_totals(self) -> Tuple[int, Dict[str, int], int]:
+        """(entities with a gap analysis, status totals, unassessed mandatory guidelines)."""
+        assessed = 0
+        totals: Counter[str] = Counter()
+        unassessed = 0
+        for result in self.entities:
+            if result.gap_status is None:
+                continue
+            assessed += 1
+            totals.update(result.gap_status)
+            unassessed += len(result.unassessed_mandatory or [])
+        return assessed, dict(sorted(totals.items())), unassessed
+
+    def to_dict(self) -> Dict[str, Any]:
+        assessed, totals, unassessed = self.gap_totals()
+        data: Dict[str, Any] = {
+            "entities": len(self.entities),
+            "resolved": len(self.entities) - len(self.failed),
+            "failed": len(self.failed),
+            "classes": [group.to_dict() for group in self.classes],
+            "guidelines": self.guideline_counts(),
+        }
+        if assessed:
+            data["gap_analysis"] = {
+                "entities": assessed,
+                "status": totals,
+                "unassessed_mandatory": unassessed,
+            }
+        data["errors"] = [{"entity": r.entity, "source": r.source, "error": r.error} for r in self.failed]
+        return data
+
+
+# ---------------------------------------------------------------------------
+# Inputs
+# ---------------------------------------------------------------------------
+
+def entity_name(profile: Any, fallback: str) -> str:
+    if isinstance(profile, dict):
+        for key in ENTITY_KEYS:
+            value = profile.get(key)
+            if isinstance(value, (str, int)) and str(value).strip():
+                return str(value).strip()
+    return fallback
+
+
+def profiles_from_stream(stream: IO[str], label: str, fmt: str = "jsonl") -> Iterator[EntityInput]:
+    for number, profile in iter_profiles(stream, fmt):
+        yield EntityInput(entity_name(profile, f"record {number}"), f"{label}:{number}", profile)
+
+
+def profiles_from_workspaces(workspaces: Iterable[Workspace]) -> Iterator[EntityInput]:
+    """One entity per workspace with an entity-profile.json.
+
+    The profile and any gap analysis are read under one shared lock, so a writer
+    cannot replace either between the two reads.
+    """
+    for workspace in workspaces:
+        profile_path = workspace.path / "entity-profile.json"
+        if not profile_path.is_file():
+            continue
+        gap_rows: Optional[List[Dict[str, Any]]] = None
+        gap_error: Optional[str] = None
+        with locked(workspace.path, shared=True):
+            try:
+                profile: Any = json.loads(profile_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                profile = ResolverError(f"cannot read {display_path(profile_path)}: {exc}")
+            gap_path = artifact_path(workspace.path, "gap-analysis.json")
+            if gap_path.is_file():
+                try:
+                    gap_rows = load_gap_rows(gap_path)
+                except (OSError, ValueError) as exc:
+                    gap_error = f"cannot read {display_path(gap_path)}: {exc}"
+        name = workspace.name if not workspace.legacy else entity_name(profile, workspace.label)
+        yield EntityInput(name, display_path(profile_path), profile, gap_rows, gap_error)
+
+
+def load_gap_rows(path: Path) -> List[Dict[str, Any]]:
+    """Rows of a gap-analysis.json(l); malformed rows are left to validate_ciso_outputs.py."""
+    if path.suffix == ".jsonl":
+        rows: List[Any] = []
+        with path.open(encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    with contextlib.suppress(ValueError):
+                        rows.append(json.loads(line))
+    else:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        rows = data.get("items") if isinstance(data, dict) else data
+        if not isinstance(rows, list):
+            raise ValueError("expected a list or an object with an 'items' list")
+    return [row for row in rows if isinstance(row, dict)]
+
+
+# ---------------------------------------------------------------------------
+# Rollup
+# ---------------------------------------------------------------------------
+
+_FUNCTIONS: Optional[Dict[str, str]] = None
+
+
+def guideline_functions() -> Dict[str, str]:
+    """Guideline ID -> CSCRF function (GOVERNANCE, IDENTIFY, ...), loaded once per process."""
+    global _FUNCTIONS
+    if _FUNCTIONS is None:
+        _FUNCTIONS = {gid: record["function"] for gid, record in load_index().guidelines.items()}
+    return _FUNCTIONS
+
+
+def _new_class(engine: ApplicabilityEngine, functions: Dict[str, str], tags: List[str]) -> ApplicabilityClass:
+    result = engine.query(tags)
+    by_function: Dict[str, Dict[str, int]] = {}
+    for guideline_id in result.applicable:
+        counts = by_function.setdefault(functions[guideline_id], {"applicable": 0, "mandatory": 0})
+        counts["applicable"] += 1
+    for guideline_id in result.mandatory:
+        by_function[functions[guideline_id]]["mandatory"] += 1
+    return ApplicabilityClass(result.tags, result.applicable, result.mandatory, by_function)
+
+
+def _overlay_gaps(result: EntityResult, rows: List[Dict[str, Any]]) -> None:
+    assert result.group is not None
+    # Rows with non-string fields are malformed; validate_ciso_outputs.py reports them.
+    statuses = Counter(row["status"] for row in rows if isinstance(row.get("status"), str))
+    result.gap_status = dict(sorted(statuses.items()))
+    assessed = {row["guideline_id"] for row in rows if isinstance(row.get("guideline_id"), str)}
+    result.unassessed_mandatory = [gid for gid in result.group.mandatory if gid not in assessed]
+
+
+def build_portfolio(
+    inputs: Iterable[EntityInput],
+    engine: Optional[ApplicabilityEngine] = None,
+    functions: Optional[Dict[str, str]] = None,
+) -> Portfolio:
+    """Resolve every entity, group by tag mask and compute each class's guideline sets once.
+
+    Classes are numbered C1, C2, ... by descending size, then tag set.
+    """
+    engine = engine or get_engine()
+    functions = functions or guideline_functions()
+
+    classes: Dict[int, ApplicabilityClass] = {}
+    results: List[EntityResult] = []
+    for item in inputs:
+        result = EntityResult(item.entity, item.source)
+        results.append(result)
+        if isinstance(item.profile, ResolverError):
+            result.error = str(item.profile)
+            continue
+        if not isinstance(item.profile, dict):
+            result.error = "Profile record must be a JSON object"
+            continue
+        try:
+            resolved = resolve_tags(item.profile)
+            mask = tag_mask(resolved["tags"])
+        except (ResolverError, ValueError) as exc:
+            result.error = str(exc)
+            continue
+        if item.gap_error is not None:
+            result.error = item.gap_error
+            continue
+        group = classes.get(mask)
+        if group is None:
+            group = classes[mask] = _new_class(engine, functions, resolved["tags"])
+        result.group = group
+        if item.gap_rows is not None:
+            _overlay_gaps(result, item.gap_rows)
+        result.entity_type = resolved["entity_type"]
+        result.category = resolved["category"]
+        group.members.append(item.entity)
+
+    populated = [group for group in classes.values() if group.members]
+    ordered = sorted(populated, key=lambda group: (-len(group.members), group.tags))
+    for number, group in enumerate(ordered, start=1):
+        group.id = f"C{number}"
+    return Portfolio(ordered, results, list(engine.guideline_ids))
+
+
+def write_entities(portfolio: Portfolio, sink: IO[str]) -> None:
+    for result in portfolio.entities:
+        sink.write(json.dumps(result.to_dict(), separators=(",", ":"), ensure_ascii=True) + "\n")
+
+
+def print_report(portfolio: Portfolio) -> None:
+    resolved = len(portfolio.entities) - len(portfolio.failed)
+    summary = (
+        f"{len(portfolio.entities)} entities in {len(portfolio.classes)} applicability class(es) "
+        f"({resolved} resolved, {len(portfolio.failed)} failed)"
+    )
+    if portfolio.failed:
+        fail(summary)
+    else:
+        ok(summary)
+    for group in portfolio.classes:
+        print(
+            f"  {group.id:<4} {len(group.members):>6} entities  applicable={len(group.applicable):<3} "
+            f"mandatory={len(group.mandatory):<3} tags: {', '.join(group.tags)}"
+        )
+    assessed, totals, unassessed = portfolio.gap_totals()
+    if assessed:
+        status = ", ".join(f"{name}={count}" for name, count in totals.items()) or "no rows"
+        print(f"Gap analysis across {assessed} entities: {status}")
+        for result in portfolio.entities:
+            missing = result.unassessed_mandatory
+            if missing:
+                more = f", ... (+{len(missing) - 5})" if len(missing) > 5 else ""
+                warn(
+                    f"{result.entity}: {len(missing)} mandatory guideline(s) missing from gap analysis: "
+                    f"{', '.join(missing[:5])}{more}"
+                )
+        if unassessed == 0:
+            ok("Every gap analysis covers its class's mandatory guidelines")
+    for result in portfolio.failed:
+        fail(f"{result.entity} ({result.source}): {result.error}")
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--profiles", type=Path, help="JSONL or CSV file of entity profiles ('-' for stdin)")
+    parser.add_argument(
+        "--format",
+        choices=["jsonl", "csv"],
+        help="Profile input format (default: inferred from --profiles extension, else jsonl)",
+    )
+    parser.add_argument("--workspaces", action="store_true", help="Include every workspace's entity-profile.json")
+    parser.add_argument(
+        "--workspace", action="append", default=[], help="With --workspaces: only this workspace (repeatable)"
+    )
+    parser.add_argument(
+        "--workspace-root",
+        type=Path,
+        help=f"Workspace root (default: ${ROOT_ENV} or docs/.ciso-work)",
+    )
+    parser.add_argument("--entities-out", type=Path, help="Write per-entity records as JSONL ('-' for stdout)")
+    parser.add_argument("--json", action="store_true", help="Print the portfolio rollup as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    if args.profiles is None and not args.workspaces:
+        fail("nothing to do: pass --profiles FILE and/or --workspaces")
+        return 2
+    if args.json and str(args.entities_out) == "-":
+        fail("--json and --entities-out - both write to stdout; send per-entity records to a file")
+        return 2
+
+    sources: List[Iterable[EntityInput]] = []
+    with contextlib.ExitStack() as stack:
+        if args.profiles is not None:
+            fmt = args.format or ("csv" if str(args.profiles).lower().endswith(".csv") else "jsonl")
+            if str(args.profiles) == "-":
+                stream: IO[str] = sys.stdin
+            else:
+                try:
+                    stream = stack.enter_context(open(args.profiles, encoding="utf-8", newline=""))
+                except OSError as exc:
+                    fail(f"cannot read profiles: {exc}")
+                    return 2
+            sources.append(profiles_from_stream(stream, str(args.profiles), fmt))
+        if args.workspaces:
+            try:
+                selected = select(workspace_root(args.workspace_root), args.workspace)
+            except ValueError as exc:
+                fail(str(exc))
+                return 2
+            sources.append(profiles_from_workspaces(selected))
+        portfolio = build_portfolio(entity for source in sources for entity in source)
+
+    if not portfolio.entities:
+        fail("no entity profiles found")
+        return 2
+
+    if args.entities_out is not None:
+        if str(args.entities_out) == "-":
+            write_entities(portfolio, sys.stdout)
+        else:
+            args.entities_out.parent.mkdir(parents=True, exist_ok=True)
+            with open(args.entities_out, "w", encoding="utf-8") as sink:
+                write_entities(portfolio, sink)
+
+    if args.json:
+        print(json.dumps(portfolio.to_dict(), indent=2))
+    elif str(args.entities_out) != "-":
+        print_report(portfolio)
+    return 2 if portfolio.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
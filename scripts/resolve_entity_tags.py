@@ -4,10 +4,12 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import json
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, Set
+from typing import IO, Any, Dict, Iterable, Iterator, List, Set, Tuple
 
 VALID_CATEGORIES = {
     "mii",
@@ -28,6 +30,7 @@ ENTITY_TYPE_ALIASES = {
     "dp": "depository-participant",
     "mutual-fund-amc": "mutual-fund-amc",
     "mutual_fund_amc": "mutual-fund-amc",
+    "mutual fund amc": "mutual-fund-amc",
     "mutual fund": "mutual-fund-amc",
     "amc": "mutual-fund-amc",
     "clearing-corporation": "clearing-corporation",
@@ -101,20 +104,7 @@ def _first_value(data: Dict[str, Any], candidates: Iterable[str], default: Any =
     return default
 
 
-def resolve_tags(profile: Dict[str, Any]) -> Dict[str, Any]:
-    entity_type_raw = _first_value(profile, ["entity_type", "entityType", "type"])
-    category_raw = _first_value(profile, ["category", "entity_category", "entityCategory"])
-
-    cii_raw = _first_value(profile, ["cii", "is_cii", "isCii"], False)
-    third_party_soc_raw = _first_value(
-        profile, ["third_party_soc", "thirdPartySoc", "uses_market_soc", "usesMarketSoc"], False
-    )
-
-    entity_type = _normalize_entity_type(entity_type_raw)
-    category = _normalize_category(category_raw)
-    cii = _normalize_bool(cii_raw)
-    third_party_soc = _normalize_bool(third_party_soc_raw)
-
+def _derive_tags(entity_type: str, category: str, cii: bool, third_party_soc: bool) -> Tuple[str, ...]:
     tags: Set[str] = {category}
 
     if cii:
@@ -136,6 +126,40 @@ def resolve_tags(profile: Dict[str, Any]) -> Dict[str, Any]:
         elif category == "mid-size":
             tags.add("mid-size-stock-brokers-dps")
 
+    return tuple(sorted(tags))
+
+
+CANONICAL_ENTITY_TYPES = tuple(sorted(set(ENTITY_TYPE_ALIASES.values())))
+
+# The input space is small and finite, so every combination is resolved once
+# at import time and resolve_tags() is a single dictionary lookup.
+TAG_TABLE: Dict[Tuple[str, str, bool, bool], Tuple[str, ...]] = {
+    (entity_type, category, cii, third_party_soc): _derive_tags(
+        entity_type, category, cii, third_party_soc
+    )
+    for entity_type in CANONICAL_ENTITY_TYPES
+    for category in sorted(VALID_CATEGORIES)
+    for cii in (False, True)
+    for third_party_soc in (False, True)
+}
+
+
+def resolve_tags(profile: Dict[str, Any]) -> Dict[str, Any]:
+    entity_type_raw = _first_value(profile, ["entity_type", "entityType", "type"])
+    category_raw = _first_value(profile, ["category", "entity_category", "entityCategory"])
+
+    cii_raw = _first_value(profile, ["cii", "is_cii", "isCii"], False)
+    third_party_soc_raw = _first_value(
+        profile, ["third_party_soc", "thirdPartySoc", "uses_market_soc", "usesMarketSoc"], False
+    )
+
+    entity_type = _normalize_entity_type(entity_type_raw)
+    category = _normalize_category(category_raw)
+    cii = _normalize_bool(cii_raw)
+    third_party_soc = _normalize_bool(third_party_soc_raw)
+
+    tags = TAG_TABLE[(entity_type, category, cii, third_party_soc)]
+
     return {
         "entity_type": entity_type,
         "category": category,
@@ -143,10 +167,132 @@ def resolve_tags(profile: Dict[str, Any]) -> Dict[str, Any]:
             "cii": cii,
             "third_party_soc": third_party_soc,
         },
-        "tags": sorted(tags),
+        "tags": list(tags),
     }
 
 
+BatchItem = Tuple[int, Any]
+BatchOutcome = Tuple[int, Dict[str, Any] | None, str | None]
+
+
+def _iter_jsonl(stream: IO[str]) -> Iterator[BatchItem]:
+    for number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield number, ResolverError(f"Invalid JSON ({exc})")
+
+
+def _iter_csv(stream: IO[str]) -> Iterator[BatchItem]:
+    reader = csv.DictReader(stream)
+    for row in reader:
+        # Header is line 1; report the physical line of each record.
+        yield reader.line_num, {key: value for key, value in row.items() if key is not None}
+
+
+def iter_profiles(stream: IO[str], fmt: str = "jsonl") -> Iterator[BatchItem]:
+    """Yield (line number, profile) per record; unparseable JSONL lines yield a ResolverError."""
+    return _iter_csv(stream) if fmt == "csv" else _iter_jsonl(stream)
+
+
+def _resolve_record(item: BatchItem) -> BatchOutcome:
+    number, profile = item
+    if isinstance(profile, ResolverError):
+        return number, None, str(profile)
+    if not isinstance(profile, dict):
+        return number, None, "Profile record must be a JSON object"
+    try:
+        return number, resolve_tags(profile), None
+    except ResolverError as exc:
+        return number, None, str(exc)
+
+
+def _chunks(items: Iterable[BatchItem], size: int) -> Iterator[List[BatchItem]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def resolve_batch(
+    source: IO[str],
+    sink: IO[str],
+    errors: IO[str],
+    fmt: str = "jsonl",
+    jobs: int = 1,
+    chunk_size: int = 1000,
+) -> Tuple[int, int]:
+    """Resolve a stream of profiles, writing one JSONL result or error per record.
+
+    Records are read, resolved, and written in bounded chunks so memory stays
+    constant regardless of input size. Output order matches input order.
+    Returns (resolved, failed) counts.
+    """
+    items = iter_profiles(source, fmt)
+    resolved = failed = 0
+
+    pool = None
+    if jobs > 1:
+        from multiprocessing import Pool
+
+        pool = Pool(jobs)
+    try:
+        for chunk in _chunks(items, chunk_size):
+            if pool is not None:
+                outcomes = pool.map(_resolve_record, chunk, chunksize=max(1, len(chunk) // (jobs * 4)))
+            else:
+                outcomes = [_resolve_record(item) for item in chunk]
+            for number, result, error in outcomes:
+                if error is not None:
+                    errors.write(
+                        json.dumps({"record": number, "error": error}, separators=(",", ":"), ensure_ascii=True)
+                        + "\n"
+                    )
+                    failed += 1
+                    continue
+                sink.write(
+                    json.dumps({"record": number, **result}, separators=(",", ":"), ensure_ascii=True)
+                    + "\n"
+                )
+                resolved += 1
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    return resolved, failed
+
+
+def _batch_main(args: argparse.Namespace) -> int:
+    fmt = args.format
+    if fmt is None:
+        fmt = "csv" if str(args.batch).lower().endswith(".csv") else "jsonl"
+
+    try:
+        source = sys.stdin if str(args.batch) == "-" else open(args.batch, encoding="utf-8", newline="")
+    except FileNotFoundError:
+        print(f"ERROR: Batch input not found: {args.batch}", file=sys.stderr)
+        return 2
+
+    sink = sys.stdout
+    errors = sys.stderr
+    try:
+        if args.output:
+            args.output.parent.mkdir(parents=True, exist_ok=True)
+            sink = open(args.output, "w", encoding="utf-8")
+        if args.errors:
+            args.errors.parent.mkdir(parents=True, exist_ok=True)
+            errors = open(args.errors, "w", encoding="utf-8")
+        _, failed = resolve_batch(source, sink, errors, fmt, max(1, args.jobs), max(1, args.chunk_size))
+    finally:
+        for stream in (source, sink, errors):
+            if stream not in (sys.stdin, sys.stdout, sys.stderr):
+                stream.close()
+
+    return 2 if failed else 0
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Resolve CSCRF applicability tags from profile JSON or CLI arguments."
@@ -158,12 +304,30 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--third-party-soc", action="store_true", help="Set third-party-soc true")
     parser.add_argument("--output", type=Path, help="Optional output JSON path")
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON")
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        help="Resolve many profiles from a JSONL or CSV file ('-' for stdin); writes JSONL",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["jsonl", "csv"],
+        help="Batch input format (default: inferred from --batch extension, else jsonl)",
+    )
+    parser.add_argument("--errors", type=Path, help="Batch error JSONL path (default: stderr)")
+    parser.add_argument("--jobs", type=int, default=1, help="Batch worker processes (default: 1)")
+    parser.add_argument(
+        "--chunk-size", type=int, default=1000, help="Batch records held in memory at once"
+    )
     return parser.parse_args()
 
 
 def main() -> int:
     args = _parse_args()
 
+    if args.batch is not None:
+        return _batch_main(args)
+
     profile: Dict[str, Any] = {}
     if args.profile:
         profile = _load_profile(args.profile)
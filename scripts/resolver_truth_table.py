@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Generate or check the shipped resolver truth table.
+
+The table enumerates every (entity type, category, cii, third_party_soc)
+combination accepted by resolve_tags(), with its tag set and the applicable
+and mandatory guideline IDs. Skill agents can read it as one static artifact
+instead of running the resolver and filtering framework files;
+package_skills.sh ships it in the ciso skill as
+references/resolver-truth-table.json. Guideline lists are stored once per
+distinct tag set and referenced from each row.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Sequence
+
+from applicability_query import ApplicabilityEngine
+from framework_index import load_index
+from resolve_entity_tags import CANONICAL_ENTITY_TYPES, VALID_CATEGORIES, resolve_tags
+
+ROOT = Path(__file__).resolve().parent.parent
+TABLE_PATH = ROOT / "scripts/data/resolver-truth-table.json"
+TABLE_VERSION = 1
+
+
+def ok(message: str) -> None:
+    print(f"[PASS] {message}")
+
+
+def fail(message: str) -> None:
+    print(f"[FAIL] {message}")
+
+
+def row_key(entity_type: str, category: str, cii: bool, third_party_soc: bool) -> str:
+    return f"{entity_type}|{category}|{int(cii)}|{int(third_party_soc)}"
+
+
+def build_table() -> Dict[str, Any]:
+    index = load_index()
+    engine = ApplicabilityEngine(index)
+    rows: Dict[str, Dict[str, Any]] = {}
+    tag_sets: Dict[str, Dict[str, Any]] = {}
+
+    for entity_type in CANONICAL_ENTITY_TYPES:
+        for category in sorted(VALID_CATEGORIES):
+            for cii in (False, True):
+                for third_party_soc in (False, True):
+                    resolved = resolve_tags(
+                        {
+                            "entity_type": entity_type,
+                            "category": category,
+                            "cii": cii,
+                            "third_party_soc": third_party_soc,
+                        }
+                    )
+                    tag_set = ",".join(resolved["tags"])
+                    if tag_set not in tag_sets:
+                        result = engine.query(resolved["tags"])
+                        tag_sets[tag_set] = {
+                            "applicable": result.applicable,
+                            "mandatory": result.mandatory,
+                        }
+                    rows[row_key(entity_type, category, cii, third_party_soc)] = {
+                        "tags": resolved["tags"],
+                        "tag_set": tag_set,
+                    }
+
+    return {
+        "version": TABLE_VERSION,
+        "framework_digest": index.digest,
+        "key": "entity_type|category|cii|third_party_soc (booleans as 0/1)",
+        "dimensions": {
+            "entity_type": list(CANONICAL_ENTITY_TYPES),
+            "category": sorted(VALID_CATEGORIES),
+            "cii": [False, True],
+            "third_party_soc": [False, True],
+        },
+        "rows": rows,
+        "tag_sets": tag_sets,
+    }
+
+
+def render(table: Dict[str, Any]) -> str:
+    """Serialize with one row or tag set per line to keep diffs readable."""
+
+    def compact(value: Any) -> str:
+        return json.dumps(value, separators=(", ", ": "), ensure_ascii=True)
+
+    lines = ["{"]
+    for key in ("version", "framework_digest", "key", "dimensions"):
+        lines.append(f"  {compact(key)}: {compact(table[key])},")
+    for section in ("rows", "tag_sets"):
+        lines.append(f"  {compact(section)}: {{")
+        entries = list(table[section].items())
+        for position, (key, value) in enumerate(entries):
+            comma = "," if position < len(entries) - 1 else ""
+            lines.append(f"    {compact(key)}: {compact(value)}{comma}")
+        lines.append("  }," if section == "rows" else "  }")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def load_table(path: Path = TABLE_PATH) -> Dict[str, Any]:
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def lookup(
+    table: Dict[str, Any], entity_type: str, category: str, cii: bool, third_party_soc: bool
+) -> Dict[str, Any]:
+    """Return tags plus applicable and mandatory guideline IDs for canonical inputs."""
+    row = table["rows"][row_key(entity_type, category, cii, third_party_soc)]
+    return {"tags": row["tags"], **table["tag_sets"][row["tag_set"]]}
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--write",
+        action="store_true",
+        help=f"Regenerate {TABLE_PATH.relative_to(ROOT)} instead of checking it.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    expected = render(build_table())
+    rel_path = TABLE_PATH.relative_to(ROOT)
+
+    if args.write:
+        TABLE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        TABLE_PATH.write_text(expected, encoding="utf-8")
+        ok(f"Wrote {rel_path}")
+        return 0
+
+    if not TABLE_PATH.exists():
+        fail(f"Missing resolver truth table: {rel_path}")
+        return 1
+    if TABLE_PATH.read_text(encoding="utf-8") != expected:
+        fail(
+            f"{rel_path} disagrees with resolve_tags() or the framework index; "
+            "regenerate with scripts/resolver_truth_table.py --write"
+        )
+        return 1
+
+    table = json.loads(expected)
+    ok(
+        f"Resolver truth table is current: {len(table['rows'])} combinations, "
+        f"{len(table['tag_sets'])} distinct tag sets"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
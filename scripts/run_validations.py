@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Run the 7-step skill validation harness in a single interpreter.
+
+Each stage calls the existing validator's main() in-process, so PyYAML, the
+framework index, and the other validator modules are imported and loaded once
+per run instead of once per stage. Output and exit codes match the stages
+they wrap; per-stage wall times are reported at the end.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Sequence, Tuple
+
+import resolve_entity_tags
+import resolver_truth_table
+import validate_agent_versions
+import validate_ciso_outputs
+import validate_skill_functional_contracts
+import validate_skill_mappings
+import validate_trigger_suite
+from frontmatter import load_frontmatter
+
+ROOT = Path(__file__).resolve().parent.parent
+MAX_DESCRIPTION_CHARS = 1024
+TOTAL_STAGES = 7
+
+
+class StageFailed(Exception):
+    """Raised by a stage to stop the run with the given exit code."""
+
+    def __init__(self, code: int = 1) -> None:
+        super().__init__(code)
+        self.code = code
+
+
+def fail(message: str) -> None:
+    print(f"[FAIL] {message}")
+
+
+def ok(message: str) -> None:
+    print(f"[PASS] {message}")
+
+
+def _check(code: int) -> None:
+    if code != 0:
+        raise StageFailed(code)
+
+
+def _run_shell(script: str, *args: str) -> None:
+    sys.stdout.flush()
+    _check(subprocess.run(["bash", str(ROOT / "scripts" / script), *args], cwd=ROOT).returncode)
+
+
+def stage_description_lengths() -> None:
+    skill_files = sorted((ROOT / ".claude/skills").glob("*/SKILL.md"))
+    if not skill_files:
+        fail("no SKILL.md files found under .claude/skills")
+        raise StageFailed(1)
+    for skill_md in skill_files:
+        skill_name = skill_md.parent.name
+        fm = load_frontmatter(skill_md)
+        if fm is None:
+            fail(f"{skill_name} SKILL.md has no YAML frontmatter")
+            raise StageFailed(1)
+        desc_len = len(fm.get("description", ""))
+        if desc_len > MAX_DESCRIPTION_CHARS:
+            fail(f"{skill_name} description is {desc_len} chars (max {MAX_DESCRIPTION_CHARS})")
+            raise StageFailed(1)
+        print(f"  {skill_name}: {desc_len} chars")
+    ok(f"all skill descriptions under {MAX_DESCRIPTION_CHARS} chars")
+
+
+def stage_resolver() -> None:
+    resolve = resolve_entity_tags.resolve_tags
+    out_a = resolve({"entity_type": "stock-broker", "category": "mid-size", "third_party_soc": True})
+    out_b = resolve({"entity_type": "Stock Broker", "category": "mid-size", "third_party_soc": True})
+    if out_a != out_b:
+        fail("resolver produced different outputs for equivalent entity-type inputs")
+        raise StageFailed(1)
+    out_c = resolve({"entity_type": "depository-participant", "category": "qualified", "cii": True})
+    if "qualified-stock-brokers-dps" not in out_c["tags"]:
+        fail("expected qualified-stock-brokers-dps tag was not produced")
+        raise StageFailed(1)
+    _check(resolver_truth_table.main([]))
+    ok("resolver outputs are stable for equivalence and conditional tags")
+
+
+def build_stages(
+    run_artifact_checks: bool,
+) -> List[Tuple[str, Callable[[], None]]]:
+    def output_contracts() -> None:
+        _check(validate_ciso_outputs.main([]))
+        if run_artifact_checks:
+            _check(validate_ciso_outputs.main(["--strict"]))
+            _run_shell("verify-ciso-artifacts.sh", "--strict")
+        else:
+            print(
+                "[INFO] skipping artifact strict checks "
+                "(run with --with-artifacts or --with-fixtures to enable)"
+            )
+
+    return [
+        ("Validate skill description lengths (max 1024 chars)", stage_description_lengths),
+        (
+            "Validate canonical policy-area mapping and mirror parity",
+            lambda: _check(validate_skill_mappings.main([])),
+        ),
+        ("Validate agent version compatibility", lambda: _check(validate_agent_versions.main())),
+        ("Validate deterministic tag resolver behavior", stage_resolver),
+        ("Validate semantic trigger suite", lambda: _check(validate_trigger_suite.main([]))),
+        (
+            "Validate functional contract manifests",
+            lambda: _check(validate_skill_functional_contracts.main([])),
+        ),
+        ("Validate output contracts for existing artifacts", output_contracts),
+    ]
+
+
+def print_timings(timings: Sequence[Tuple[str, float]]) -> None:
+    if not timings:
+        return
+    print()
+    print("Stage timings:")
+    for label, seconds in timings:
+        print(f"  {label} {seconds * 1000:.1f} ms")
+    print(f"  total {sum(seconds for _, seconds in timings) * 1000:.1f} ms")
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace | None:
+    run_artifact_checks = False
+    install_fixtures = False
+    for arg in argv:
+        if arg == "--with-artifacts":
+            run_artifact_checks = True
+        elif arg == "--with-fixtures":
+            run_artifact_checks = True
+            install_fixtures = True
+        else:
+            print(f"[FAIL] unknown argument: {arg}")
+            print("Usage: bash scripts/eval_skills.sh [--with-artifacts] [--with-fixtures]")
+            return None
+    return argparse.Namespace(
+        run_artifact_checks=run_artifact_checks,
+        install_fixtures=install_fixtures,
+    )
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    if args is None:
+        return 1
+
+    timings: List[Tuple[str, float]] = []
+    try:
+        if args.install_fixtures:
+            print(f"[0/{TOTAL_STAGES}] Install deterministic fixture artifacts")
+            start = time.perf_counter()
+            _run_shell("install_ciso_fixtures.sh", "--force")
+            timings.append((f"[0/{TOTAL_STAGES}]", time.perf_counter() - start))
+            print()
+
+        for number, (title, stage) in enumerate(build_stages(args.run_artifact_checks), start=1):
+            if number > 1:
+                print()
+            print(f"[{number}/{TOTAL_STAGES}] {title}")
+            start = time.perf_counter()
+            try:
+                stage()
+            finally:
+                timings.append((f"[{number}/{TOTAL_STAGES}]", time.perf_counter() - start))
+    except StageFailed as exc:
+        print_timings(timings)
+        return exc.code
+
+    print()
+    print("Skill evaluation checks complete.")
+    print_timings(timings)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
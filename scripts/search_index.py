@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""BM25 full-text search over CSCRF standards, guidelines, definitions and abbreviations.
+
+The inverted index is built from the compiled framework index plus
+meta/definitions.md and meta/abbreviations.md, persisted to
+.cache/search-index.json, and loaded lazily on the first query.
+package_skills.sh builds it ahead of time and ships it in the ciso skill as
+references/search-index.json; that copy (or $CSCRF_SEARCH_INDEX) is read
+before .cache/ whenever its digest still matches the sources. Each hit
+carries the document ID, so agents can fetch the few most relevant guidelines
+instead of whole framework files.
+
+Usage:
+    python3 scripts/search_index.py "privileged access review" -k 3
+    python3 scripts/search_index.py "SOC efficacy" --kind guideline --with-text
+    python3 scripts/search_index.py --build
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import sys
+import tempfile
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from framework_index import load_index
+
+ROOT = Path(__file__).resolve().parent.parent
+INDEX_PATH = ROOT / ".cache/search-index.json"
+PACKAGED_INDEX_PATH = ROOT / ".claude/skills/ciso/references/search-index.json"
+INDEX_ENV = "CSCRF_SEARCH_INDEX"
+META_SOURCES = [ROOT / "meta/definitions.md", ROOT / "meta/abbreviations.md"]
+
+# Bump when tokenization, document extraction, or the layout changes.
+SEARCH_INDEX_VERSION = 1
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+KINDS = ("standard", "guideline", "definition", "abbreviation")
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or shall such that the "
+    "their there these this to was were which will with".split()
+)
+
+DEFINITION_HEADING_RE = re.compile(r"^###\s+\d+\.\s+(.+?)\s*$")
+ABBREVIATION_ROW_RE = re.compile(r"^\|\s*\d+\s*\|\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*$")
+
+
+def tokenize(text: str) -> List[str]:
+    tokens: List[str] = []
+    for token in TOKEN_RE.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        # Light plural folding so "policies"/"policy" and "controls"/"control" meet.
+        if len(token) > 4 and token.endswith("ies"):
+            token = token[:-3] + "y"
+        elif len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+@dataclass
+class SearchHit:
+    id: str
+    kind: str
+    score: float
+    title: str
+    file: str
+    line: int
+    text: str = ""
+
+
+def _definition_documents(path: Path) -> Iterable[Dict[str, Any]]:
+    rel_path = path.relative_to(ROOT).as_posix()
+    current: Dict[str, Any] | None = None
+    body: List[str] = []
+    for number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        heading = DEFINITION_HEADING_RE.match(line)
+        if heading:
+            if current is not None:
+                current["text"] = "\n".join(body).strip()
+                yield current
+            title = heading.group(1)
+            slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+            current = {
+                "id": f"definition:{slug}",
+                "kind": "definition",
+                "title": title,
+                "file": rel_path,
+                "line": number,
+            }
+            body = []
+        elif current is not None:
+            body.append(line)
+    if current is not None:
+        current["text"] = "\n".join(body).strip()
+        yield current
+
+
+def _abbreviation_documents(path: Path) -> Iterable[Dict[str, Any]]:
+    rel_path = path.relative_to(ROOT).as_posix()
+    for number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
+        row = ABBREVIATION_ROW_RE.match(line)
+        if not row:
+            continue
+        abbreviation, expansion = row.groups()
+        yield {
+            "id": f"abbreviation:{abbreviation}",
+            "kind": "abbreviation",
+            "title": abbreviation,
+            "file": rel_path,
+            "line": number,
+            "text": expansion,
+        }
+
+
+def collect_documents() -> List[Dict[str, Any]]:
+    index = load_index()
+    titles = {record["code"]: record["title"] for record in index.files.values()}
+    documents: List[Dict[str, Any]] = []
+    for standard_id, record in index.standards.items():
+        documents.append(
+            {
+                "id": standard_id,
+                "kind": "standard",
+                "title": f"{record['code']} {titles.get(record['code'], '')}".strip(),
+                "file": record["file"],
+                "line": record["line"],
+                "text": record["text"],
+            }
+        )
+    for guideline_id, record in index.guidelines.items():
+        documents.append(
+            {
+                "id": guideline_id,
+                "kind": "guideline",
+                "title": f"{record['code']} {titles.get(record['code'], '')}".strip(),
+                "file": record["file"],
+                "line": record["line"],
+                "text": record["text"],
+            }
+        )
+    documents.extend(_definition_documents(META_SOURCES[0]))
+    documents.extend(_abbreviation_documents(META_SOURCES[1]))
+    return documents
+
+
+def _source_digest() -> str:
+    hasher = hashlib.sha256(f"v{SEARCH_INDEX_VERSION}\n{load_index().digest}\n".encode("utf-8"))
+    for path in META_SOURCES:
+        hasher.update(path.read_bytes())
+    return hasher.hexdigest()
+
+
+class SearchIndex:
+    """Inverted index with BM25 scoring."""
+
+    def __init__(self, data: Dict[str, Any]) -> None:
+        self.digest: str = data["digest"]
+        self.documents: List[Dict[str, Any]] = data["documents"]
+        self.lengths: List[int] = data["lengths"]
+        self.postings: Dict[str, List[List[int]]] = data["postings"]
+        self.avgdl: float = data["avgdl"]
+        count = len(self.documents)
+        self.idf: Dict[str, float] = {
+            term: math.log(1 + (count - len(plist) + 0.5) / (len(plist) + 0.5))
+            for term, plist in self.postings.items()
+        }
+        # Per-document BM25 length normalization, precomputed once.
+        self.norms: List[float] = [
+            BM25_K1 * (1 - BM25_B + BM25_B * length / self.avgdl) if self.avgdl else BM25_K1
+            for length in self.lengths
+        ]
+
+    @classmethod
+    def build(cls) -> "SearchIndex":
+        documents = collect_documents()
+        lengths: List[int] = []
+        postings: Dict[str, List[List[int]]] = {}
+        for position, document in enumerate(documents):
+            terms = tokenize(f"{document['id']} {document['title']} {document['text']}")
+            lengths.append(len(terms))
+            for term, frequency in Counter(terms).items():
+                postings.setdefault(term, []).append([position, frequency])
+        avgdl = sum(lengths) / len(lengths) if lengths else 0.0
+        return cls(
+            {
+                "digest": _source_digest(),
+                "documents": documents,
+                "lengths": lengths,
+                "postings": postings,
+                "avgdl": avgdl,
+            }
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": SEARCH_INDEX_VERSION,
+            "digest": self.digest,
+            "documents": self.documents,
+            "lengths": self.lengths,
+            "postings": self.postings,
+            "avgdl": self.avgdl,
+        }
+
+    def save(self, path: Path = INDEX_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=".search-index-", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(self.to_dict(), handle, separators=(",", ":"), ensure_ascii=False)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    def search(
+        self,
+        query: str,
+        k: int = 3,
+        kinds: Sequence[str] | None = None,
+        with_text: bool = False,
+    ) -> List[SearchHit]:
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            plist = self.postings.get(term)
+            if not plist:
+                continue
+            idf = self.idf[term]
+            for position, frequency in plist:
+                gain = idf * frequency * (BM25_K1 + 1) / (frequency + self.norms[position])
+                scores[position] = scores.get(position, 0.0) + gain
+
+        if kinds:
+            allowed = set(kinds)
+            candidates: Iterable[Tuple[int, float]] = (
+                item for item in scores.items() if self.documents[item[0]]["kind"] in allowed
+            )
+        else:
+            candidates = scores.items()
+
+        hits: List[SearchHit] = []
+        for position, score in heapq.nlargest(k, candidates, key=lambda item: (item[1], -item[0])):
+            document = self.documents[position]
+            hits.append(
+                SearchHit(
+                    id=document["id"],
+                    kind=document["kind"],
+                    score=round(score, 4),
+                    title=document["title"],
+                    file=document["file"],
+                    line=document["line"],
+                    text=document["text"] if with_text else "",
+                )
+            )
+        return hits
+
+
+_INDEX: SearchIndex | None = None
+
+
+def _index_candidates() -> List[Path]:
+    """Prebuilt index locations in lookup order: env override, packaged, cache."""
+    candidates: List[Path] = []
+    override = os.environ.get(INDEX_ENV)
+    if override:
+        candidates.append(Path(override))
+    candidates.extend([PACKAGED_INDEX_PATH, INDEX_PATH])
+    return candidates
+
+
+def load_search_index(rebuild: bool = False) -> SearchIndex:
+    """Load the persisted index on first use, rebuilding it when sources changed."""
+    global _INDEX
+    if _INDEX is not None and not rebuild:
+        return _INDEX
+
+    index: SearchIndex | None = None
+    if not rebuild:
+        digest = _source_digest()
+        for path in _index_candidates():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if (
+                isinstance(data, dict)
+                and data.get("version") == SEARCH_INDEX_VERSION
+                and data.get("digest") == digest
+            ):
+                index = SearchIndex(data)
+                break
+    if index is None:
+        index = SearchIndex.build()
+        try:
+            index.save()
+        except OSError:
+            pass
+    _INDEX = index
+    return index
+
+
+def search(
+    query: str,
+    k: int = 3,
+    kinds: Sequence[str] | None = None,
+    with_text: bool = False,
+) -> List[SearchHit]:
+    """Return the top-k BM25 hits for a free-text query."""
+    return load_search_index().search(query, k=k, kinds=kinds, with_text=with_text)
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="BM25 search over CSCRF standards, guidelines, definitions and abbreviations.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("query", nargs="?", help="Free-text query")
+    parser.add_argument("-k", type=int, default=3, help="Number of hits to return (default: 3)")
+    parser.add_argument(
+        "--kind",
+        action="append",
+        choices=KINDS,
+        help="Restrict hits to a document kind. Repeat to allow several.",
+    )
+    parser.add_argument("--with-text", action="store_true", help="Include the document text in hits")
+    parser.add_argument("--build", action="store_true", help="(Re)build the persisted index and exit")
+    parser.add_argument("--json", action="store_true", help="Print hits as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+
+    if args.build:
+        index = load_search_index(rebuild=True)
+        print(
+            f"[PASS] Built {INDEX_PATH.relative_to(ROOT)}: documents={len(index.documents)}, "
+            f"terms={len(index.postings)}"
+        )
+        return 0
+
+    if not args.query:
+        print("ERROR: a query is required (or pass --build)", file=sys.stderr)
+        return 2
+
+    hits = search(args.query, k=args.k, kinds=args.kind, with_text=args.with_text)
+    if args.json:
+        print(json.dumps([asdict(hit) for hit in hits], indent=2, ensure_ascii=False))
+        return 0
+
+    for hit in hits:
+        print(f"{hit.score:8.3f}  {hit.id:<28} {hit.kind:<12} {hit.file}:{hit.line}")
+        if hit.text:
+            print(f"          {hit.text}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
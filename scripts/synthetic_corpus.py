@@ -0,0 +1,662 @@
+#!/usr/bin/env python3
+"""Seeded synthetic corpus generator for scale-testing the validators.
+
+Everything is drawn from the real framework index and the policy-area map:
+standard and guideline IDs, guideline functions and mandatory flags, and the
+per-area ID sets that validate_ciso_outputs.py enforces. The same seed and
+sizes always produce byte-identical output.
+
+Layout under --out (default .cache/synthetic-corpus/):
+    profiles.jsonl          entity profiles, resolve_entity_tags.py --batch input
+    gap-analysis.json       gap rows (list form); gap-analysis.jsonl holds the same rows
+    policies/NNNN/<area>.md policy files, one directory per batch of areas
+    trigger-tests.yaml      trigger suite (JSON, same shape as the skills' suite)
+    manifest.json           seed, sizes, and the expected finding for every invalid item
+
+A configurable share of profiles, gap rows and policy files is deliberately
+invalid; manifest.json records which ones and how, and --verify checks the
+validators report exactly those.
+
+Usage:
+    python3 scripts/synthetic_corpus.py --profiles 1000 --gap-rows 20000 --policies 5000
+    python3 scripts/synthetic_corpus.py --seed 7 --invalid-rate 0.2 --verify
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple
+
+from framework_index import load_index
+from resolve_entity_tags import ENTITY_TYPE_ALIASES, VALID_CATEGORIES, ResolverError, resolve_tags
+from validate_ciso_outputs import (
+    REQUIRED_POLICY_KEYS,
+    VALID_GAP_STATUSES,
+    VALID_PRIORITIES,
+    load_area_allowed_ids,
+    load_json,
+    validate_gap_row,
+    validate_policy_file,
+    MAP_PATH,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_OUT = ROOT / ".cache/synthetic-corpus"
+MANIFEST_NAME = "manifest.json"
+
+# Bump when the generated layout or value distributions change.
+CORPUS_VERSION = 1
+
+ENTITY_TYPES = sorted(set(ENTITY_TYPE_ALIASES.values()))
+CATEGORIES = sorted(VALID_CATEGORIES)
+REVIEW_CYCLES = ["Quarterly", "Half-yearly", "Annual"]
+OWNER_HINTS = ["CISO", "Head of IT", "Compliance Officer", "IT Committee", "Board", "CTO"]
+NAME_PREFIXES = [
+    "Zenith", "Orbit", "Kestrel", "Sahyadri", "Indus", "Meridian", "Vardhan", "Nilgiri",
+    "Ashoka", "Coromandel", "Sterling", "Pinnacle", "Aravali", "Konkan", "Trident", "Lotus",
+]
+NAME_SUFFIXES = {
+    "stock-broker": "Broking Pvt Ltd",
+    "depository-participant": "Depository Services Ltd",
+    "mutual-fund-amc": "Asset Management Co Ltd",
+    "clearing-corporation": "Clearing Corporation Ltd",
+    "stock-exchange": "Stock Exchange Ltd",
+    "depository": "Depository Ltd",
+    "other": "Capital Services Ltd",
+}
+GAP_REASONS = [
+    "Policy does not define a review cadence for {code} controls.",
+    "Evidence for {code} exists only as email approvals.",
+    "Draft covers {code} but lacks named control owners.",
+    "{code} procedures are documented but not tested this year.",
+    "Tooling for {code} is deployed but coverage is partial.",
+    "Third-party attestation for {code} is pending.",
+]
+
+# mutation -> substring the validator must report for it
+POLICY_MUTATIONS = {
+    "missing-frontmatter": "missing YAML frontmatter",
+    "unterminated-frontmatter": "missing YAML frontmatter",
+    "missing-key": "missing frontmatter key",
+    "invalid-category": "invalid category",
+    "invalid-date": "invalid generated_date",
+    "malformed-id": "invalid ID in",
+    "unknown-id": "unknown ID in",
+    "out-of-area-id": "outside mapped area",
+    "empty-list": "must be a non-empty list",
+}
+GAP_MUTATIONS = {
+    "missing-field": "missing fields",
+    "malformed-id": "invalid guideline_id",
+    "unknown-id": "unknown guideline_id",
+    "invalid-status": "invalid status",
+    "invalid-priority": "invalid priority",
+}
+PROFILE_MUTATIONS = {
+    "unsupported-entity-type": "Unsupported entity type",
+    "invalid-category": "Invalid category",
+    "invalid-boolean": "Invalid boolean value",
+}
+
+TRIGGER_SKILLS = ["ciso", "ciso-policy", "ciso-assess"]
+TRIGGER_TEMPLATES: Dict[Tuple[str, str], List[str]] = {
+    ("positive", "ciso"): [
+        "Run the full CSCRF compliance workflow for our {category} {entity}",
+        "Start the CISO interview and build a 90-day CSCRF roadmap for a {category} {entity}",
+        "We are a {category} {entity}; profile us and tell us which SEBI CSCRF guidelines apply",
+        "Do a complete CSCRF gap assessment and roadmap for our {entity}, starting with {area}",
+    ],
+    ("positive", "ciso-policy"): [
+        "Draft a {area} policy for our {category} {entity} under SEBI CSCRF",
+        "Write a CSCRF-aligned {area} policy that covers {guideline}",
+        "Create the {area} policy document for a {entity} per CSCRF",
+        "Generate a {area} policy with a traceability matrix to {guideline} for our {entity}",
+    ],
+    ("positive", "ciso-assess"): [
+        "Review docs/policies/{slug}.md against CSCRF and list the gaps",
+        "Assess our existing {area} policy for SEBI CSCRF compliance",
+        "Evaluate whether our {area} document meets {guideline} for a {category} {entity}",
+        "Check docs/policies/{slug}.md for missing CSCRF controls",
+    ],
+    ("paraphrase", "ciso"): [
+        "Help our {entity} get ready for the SEBI cyber resilience framework end to end",
+        "Walk me through becoming CSCRF compliant as a {category} {entity}, from profiling to roadmap",
+    ],
+    ("paraphrase", "ciso-policy"): [
+        "Put together {area} rules for our {entity} that satisfy the SEBI cyber framework",
+        "I need a fresh {area} document written to the CSCRF standard for a {category} {entity}",
+    ],
+    ("paraphrase", "ciso-assess"): [
+        "Look at our current {area} write-up and tell us where it falls short of CSCRF",
+        "How far is our {area} document from what CSCRF expects of a {category} {entity}?",
+    ],
+    ("boundary", "ciso-assess"): [
+        "Review our {area} policy against CSCRF before we draft anything new",
+        "Our auditor flagged {guideline}; assess docs/policies/{slug}.md before the CSCRF filing",
+    ],
+    ("boundary", "ciso-policy"): [
+        "We have no {area} policy yet; draft one that a CSCRF review would pass",
+        "Write the {area} policy first, we will review it against CSCRF later",
+    ],
+    ("boundary", "ciso"): [
+        "Which CSCRF policies does a {category} {entity} need, and in what order should we fix them?",
+        "Plan our CSCRF programme: profile, gaps and roadmap for a {entity}",
+    ],
+    ("negative", "none"): [
+        "Write a Python function that parses {area} log files",
+        "Summarize the latest news about {entity} stocks",
+        "Explain how {area} works in Kubernetes clusters",
+        "What is the difference between ISO 27001 and SOC 2 for {area}?",
+        "Draft a marketing email for our {entity} customers",
+        "Review this pull request that refactors the {area} module",
+    ],
+}
+TRIGGER_BUCKET_WEIGHTS = {"positive": 0.4, "negative": 0.3, "paraphrase": 0.2, "boundary": 0.1}
+TRIGGER_SUFFIXES = [
+    "", " please", " this week", " for the board", " before the SEBI audit",
+    " with {n} branches", " with {n} IT staff", " across {n} data centres",
+]
+
+
+def fail(message: str) -> None:
+    print(f"[FAIL] {message}")
+
+
+def ok(message: str) -> None:
+    print(f"[PASS] {message}")
+
+
+class Framework:
+    """Framework IDs and policy areas the generator samples from."""
+
+    def __init__(self) -> None:
+        index = load_index()
+        self.guidelines = {
+            guideline_id: (record.get("function", ""), bool(record.get("mandatory")))
+            for guideline_id, record in sorted(index.guidelines.items())
+        }
+        self.all_standards: Set[str] = index.standard_ids
+        self.all_guidelines: Set[str] = index.guideline_ids
+        self.codes = sorted({record["code"] for record in index.files.values() if record["code"]})
+        self.area_ids = load_area_allowed_ids()
+        areas = load_json(MAP_PATH)["areas"]
+        self.areas = [
+            (area["slug"], area.get("title", area["slug"]))
+            for area in areas
+            if area.get("slug") in self.area_ids and all(self.area_ids[area["slug"]])
+        ]
+        if not self.areas:
+            raise ValueError("policy-area-map.json has no areas with framework IDs")
+        self.area_sorted = {
+            slug: (sorted(standards), sorted(guidelines))
+            for slug, (standards, guidelines) in self.area_ids.items()
+        }
+
+
+# ---------------------------------------------------------------------------
+# Profiles
+# ---------------------------------------------------------------------------
+
+
+def entity_name(rng: random.Random, entity_type: str) -> str:
+    return f"{rng.choice(NAME_PREFIXES)} {rng.choice(NAME_PREFIXES)} {NAME_SUFFIXES[entity_type]}"
+
+
+def generate_profiles(
+    rng: random.Random, count: int, invalid_rate: float
+) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    aliases: Dict[str, List[str]] = {}
+    for alias, canonical in sorted(ENTITY_TYPE_ALIASES.items()):
+        aliases.setdefault(canonical, []).append(alias)
+
+    profiles: List[Dict[str, Any]] = []
+    invalid: Dict[str, str] = {}
+    for number in range(1, count + 1):
+        entity_type = rng.choice(ENTITY_TYPES)
+        profile: Dict[str, Any] = {
+            "id": f"entity-{number:05d}",
+            "name": entity_name(rng, entity_type),
+            # Mostly canonical spellings, with the aliases the resolver accepts mixed in.
+            "entity_type": entity_type if rng.random() < 0.7 else rng.choice(aliases[entity_type]),
+            "category": rng.choice(CATEGORIES),
+            "cii": rng.random() < 0.15,
+            "third_party_soc": rng.random() < 0.5,
+        }
+        if rng.random() < invalid_rate:
+            mutation = rng.choice(sorted(PROFILE_MUTATIONS))
+            if mutation == "unsupported-entity-type":
+                profile["entity_type"] = "portfolio manager"
+            elif mutation == "invalid-category":
+                profile["category"] = "large-size"
+            else:
+                profile["cii"] = "sometimes"
+            invalid[profile["id"]] = mutation
+        profiles.append(profile)
+    return profiles, invalid
+
+
+# ---------------------------------------------------------------------------
+# Gap analysis
+# ---------------------------------------------------------------------------
+
+
+def generate_gap_rows(
+    rng: random.Random, framework: Framework, count: int, entity_ids: Sequence[str], invalid_rate: float
+) -> Tuple[List[Dict[str, Any]], Dict[int, str]]:
+    guideline_ids = sorted(framework.guidelines)
+    statuses = sorted(VALID_GAP_STATUSES)
+    priorities = sorted(VALID_PRIORITIES)
+    rows: List[Dict[str, Any]] = []
+    invalid: Dict[int, str] = {}
+    for position in range(count):
+        guideline_id = guideline_ids[position % len(guideline_ids)]
+        function, mandatory = framework.guidelines[guideline_id]
+        row: Dict[str, Any] = {
+            "guideline_id": guideline_id,
+            "function": function,
+            "mandatory": mandatory,
+            "status": rng.choice(statuses),
+            "reason": rng.choice(GAP_REASONS).format(code=guideline_id.rsplit(".", 1)[0]),
+            "owner_hint": rng.choice(OWNER_HINTS),
+            "priority": rng.choice(priorities),
+        }
+        if entity_ids:
+            # Every full pass over the guidelines belongs to the next entity.
+            row["entity_id"] = entity_ids[(position // len(guideline_ids)) % len(entity_ids)]
+        if rng.random() < invalid_rate:
+            mutation = rng.choice(sorted(GAP_MUTATIONS))
+            if mutation == "missing-field":
+                del row[rng.choice(["function", "mandatory", "reason", "owner_hint"])]
+            elif mutation == "malformed-id":
+                row["guideline_id"] = guideline_id.lower()
+            elif mutation == "unknown-id":
+                row["guideline_id"] = f"{guideline_id.rsplit('.', 1)[0]}.G99"
+            elif mutation == "invalid-status":
+                row["status"] = "PARTIAL"
+            else:
+                row["priority"] = "P0"
+            # 1-based, matching the validators' "item N" / "line N" labels.
+            invalid[position + 1] = mutation
+        rows.append(row)
+    return rows, invalid
+
+
+# ---------------------------------------------------------------------------
+# Policy files
+# ---------------------------------------------------------------------------
+
+
+def _format_list(rng: random.Random, key: str, values: Sequence[str]) -> str:
+    # Alternate inline and block lists so every frontmatter parser path is exercised.
+    if rng.random() < 0.5:
+        return f"{key}: [{', '.join(values)}]"
+    return f"{key}:\n" + "\n".join(f"  - {value}" for value in values)
+
+
+def _format_scalar(rng: random.Random, key: str, value: str) -> str:
+    return f'{key}: "{value}"' if rng.random() < 0.3 else f"{key}: {value}"
+
+
+def policy_text(
+    rng: random.Random, framework: Framework, slug: str, title: str, entity: str, mutation: str | None
+) -> str:
+    standards, guidelines = framework.area_sorted[slug]
+    chosen_standards = sorted(rng.sample(standards, rng.randint(1, min(4, len(standards)))))
+    chosen_guidelines = sorted(rng.sample(guidelines, rng.randint(1, min(6, len(guidelines)))))
+    fields: Dict[str, Any] = {
+        "title": f"{title} Policy",
+        "entity": entity,
+        "category": rng.choice(CATEGORIES),
+        "cscrf_version": "1.0",
+        "cscrf_standards": chosen_standards,
+        "cscrf_guidelines": chosen_guidelines,
+        "generated_date": f"{rng.choice([2025, 2026])}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "review_cycle": rng.choice(REVIEW_CYCLES),
+    }
+
+    if mutation == "missing-key":
+        del fields[rng.choice(REQUIRED_POLICY_KEYS)]
+    elif mutation == "invalid-category":
+        fields["category"] = "enterprise"
+    elif mutation == "invalid-date":
+        fields["generated_date"] = "15/01/2026"
+    elif mutation == "malformed-id":
+        fields["cscrf_guidelines"] = chosen_guidelines + [chosen_guidelines[0].replace(".G", ".G-")]
+    elif mutation == "unknown-id":
+        fields["cscrf_standards"] = chosen_standards + [f"{chosen_standards[0].rsplit('.', 1)[0]}.S99"]
+    elif mutation == "out-of-area-id":
+        outside = sorted(framework.all_guidelines - set(guidelines))
+        fields["cscrf_guidelines"] = chosen_guidelines + [rng.choice(outside)]
+    elif mutation == "empty-list":
+        fields["cscrf_guidelines"] = []
+
+    lines = []
+    for key, value in fields.items():
+        if isinstance(value, list):
+            lines.append(_format_list(rng, key, value) if value else f"{key}: []")
+        else:
+            lines.append(_format_scalar(rng, key, value))
+    frontmatter = "---\n" + "\n".join(lines) + "\n---\n"
+    if mutation == "missing-frontmatter":
+        frontmatter = ""
+    elif mutation == "unterminated-frontmatter":
+        frontmatter = "---\n" + "\n".join(lines) + "\n\n"
+
+    statements = [
+        f"{number}. Controls for {guideline} shall be owned by the {rng.choice(OWNER_HINTS)} "
+        f"and reviewed {fields.get('review_cycle', 'Annual').lower()}."
+        for number, guideline in enumerate(chosen_guidelines, start=1)
+    ]
+    matrix = [
+        f"| {title} {number} | {guideline} | Control coverage for {guideline} |"
+        for number, guideline in enumerate(chosen_guidelines, start=1)
+    ]
+    return (
+        f"{frontmatter}\n# {title} Policy\n\n"
+        f"This policy applies to {entity} and its technology service providers.\n\n"
+        "## Control Statements\n\n" + "\n".join(statements) + "\n\n"
+        "## Traceability Matrix\n\n| Section | CSCRF Ref | Control Summary |\n|---|---|---|\n"
+        + "\n".join(matrix) + "\n"
+    )
+
+
+def generate_policies(
+    rng: random.Random,
+    framework: Framework,
+    out: Path,
+    count: int,
+    profiles: Sequence[Dict[str, Any]],
+    invalid_rate: float,
+) -> Dict[str, str]:
+    invalid: Dict[str, str] = {}
+    per_dir = len(framework.areas)
+    for number in range(count):
+        slug, title = framework.areas[number % per_dir]
+        directory = out / "policies" / f"{number // per_dir:04d}"
+        if number % per_dir == 0:
+            directory.mkdir(parents=True, exist_ok=True)
+        entity = profiles[(number // per_dir) % len(profiles)]["name"] if profiles else "Synthetic RE Ltd"
+        mutation = rng.choice(sorted(POLICY_MUTATIONS)) if rng.random() < invalid_rate else None
+        path = directory / f"{slug}.md"
+        path.write_text(policy_text(rng, framework, slug, title, entity, mutation), encoding="utf-8")
+        if mutation:
+            invalid[path.relative_to(out).as_posix()] = mutation
+    return invalid
+
+
+# ---------------------------------------------------------------------------
+# Trigger suite
+# ---------------------------------------------------------------------------
+
+
+def generate_trigger_suite(rng: random.Random, framework: Framework, count: int) -> Dict[str, Any]:
+    buckets = list(TRIGGER_BUCKET_WEIGHTS)
+    weights = [TRIGGER_BUCKET_WEIGHTS[bucket] for bucket in buckets]
+    templates: Dict[str, List[Tuple[str, str]]] = {}
+    for (bucket, skill), texts in TRIGGER_TEMPLATES.items():
+        templates.setdefault(bucket, []).extend((skill, text) for text in texts)
+    guideline_ids = sorted(framework.all_guidelines)
+    entities = [entity.replace("-", " ") for entity in ENTITY_TYPES if entity != "other"]
+
+    cases: List[Dict[str, Any]] = []
+    seen: Set[str] = set()
+    attempts = 0
+    while len(cases) < count:
+        attempts += 1
+        if attempts > count * 50:
+            raise ValueError(f"could only generate {len(cases)} unique trigger prompts")
+        bucket = rng.choices(buckets, weights)[0]
+        skill, template = rng.choice(templates[bucket])
+        slug, title = rng.choice(framework.areas)
+        prompt = template.format(
+            category=rng.choice(CATEGORIES),
+            entity=rng.choice(entities),
+            area=title.lower(),
+            slug=slug,
+            guideline=rng.choice(guideline_ids),
+        ) + rng.choice(TRIGGER_SUFFIXES).format(n=rng.randint(2, 400))
+        normalized = " ".join(prompt.split()).lower()
+        if normalized in seen:
+            continue
+        seen.add(normalized)
+        cases.append(
+            {
+                "id": f"syn-{bucket}-{len(cases) + 1:06d}",
+                "bucket": bucket,
+                "prompt": prompt,
+                "expected_skill": skill,
+            }
+        )
+    return {"skills": TRIGGER_SKILLS, "cases": cases}
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+
+def _write_json(path: Path, data: Any) -> None:
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+
+
+def generate(
+    out: Path,
+    seed: int,
+    profiles: int,
+    gap_rows: int,
+    policies: int,
+    trigger_cases: int,
+    invalid_rate: float,
+) -> Dict[str, Any]:
+    """Write the corpus under ``out`` and return its manifest."""
+    framework = Framework()
+    if out.exists():
+        if any(out.iterdir()) and not (out / MANIFEST_NAME).exists():
+            raise ValueError(f"{out} is not empty and holds no {MANIFEST_NAME}; refusing to overwrite")
+        shutil.rmtree(out)
+    out.mkdir(parents=True)
+
+    # Independent streams per artifact, so resizing one leaves the others unchanged.
+    profile_rows, invalid_profiles = generate_profiles(
+        random.Random(f"{seed}:profiles"), profiles, invalid_rate
+    )
+    with (out / "profiles.jsonl").open("w", encoding="utf-8") as handle:
+        for profile in profile_rows:
+            handle.write(json.dumps(profile) + "\n")
+
+    rows, invalid_rows = generate_gap_rows(
+        random.Random(f"{seed}:gap"),
+        framework,
+        gap_rows,
+        [profile["id"] for profile in profile_rows],
+        invalid_rate,
+    )
+    _write_json(out / "gap-analysis.json", rows)
+    with (out / "gap-analysis.jsonl").open("w", encoding="utf-8") as handle:
+        for row in rows:
+            handle.write(json.dumps(row) + "\n")
+
+    invalid_policies = generate_policies(
+        random.Random(f"{seed}:policies"), framework, out, policies, profile_rows, invalid_rate
+    )
+    _write_json(
+        out / "trigger-tests.yaml",
+        generate_trigger_suite(random.Random(f"{seed}:triggers"), framework, trigger_cases),
+    )
+
+    manifest = {
+        "version": CORPUS_VERSION,
+        "seed": seed,
+        "framework_digest": load_index().digest,
+        "sizes": {
+            "profiles": profiles,
+            "gap_rows": gap_rows,
+            "policies": policies,
+            "trigger_cases": trigger_cases,
+        },
+        "invalid_rate": invalid_rate,
+        "invalid": {
+            "profiles": invalid_profiles,
+            "gap_rows": {str(row): mutation for row, mutation in invalid_rows.items()},
+            "policies": invalid_policies,
+        },
+    }
+    _write_json(out / MANIFEST_NAME, manifest)
+    return manifest
+
+
+def _check_expected(
+    label: str,
+    findings: List[str],
+    mutation: str | None,
+    expectations: Dict[str, str],
+    problems: List[str],
+) -> None:
+    if mutation is None:
+        if findings:
+            problems.append(f"{label}: expected valid, got {findings[0]}")
+    elif not any(expectations[mutation] in finding for finding in findings):
+        problems.append(f"{label}: expected '{expectations[mutation]}' for {mutation}, got {findings}")
+
+
+def verify(out: Path) -> int:
+    """Run the validators over the corpus and compare against the manifest."""
+    if not out.is_relative_to(ROOT):
+        raise ValueError(f"--verify needs the corpus inside the repository ({ROOT}); got {out}")
+    manifest = load_json(out / MANIFEST_NAME)
+    framework = Framework()
+    problems: List[str] = []
+    timings: List[Tuple[str, int, float]] = []
+
+    def timed(name: str, count: int, body: Callable[[], None]) -> None:
+        start = time.perf_counter()
+        body()
+        timings.append((name, count, time.perf_counter() - start))
+
+    invalid_profiles = manifest["invalid"]["profiles"]
+    profile_lines = (out / "profiles.jsonl").read_text(encoding="utf-8").splitlines()
+
+    def check_profiles() -> None:
+        for line in profile_lines:
+            profile = json.loads(line)
+            findings: List[str] = []
+            try:
+                resolve_tags(profile)
+            except ResolverError as exc:
+                findings.append(str(exc))
+            _check_expected(
+                profile["id"], findings, invalid_profiles.get(profile["id"]), PROFILE_MUTATIONS, problems
+            )
+
+    invalid_rows = manifest["invalid"]["gap_rows"]
+    rows = load_json(out / "gap-analysis.json")
+
+    def check_gap_rows() -> None:
+        for number, row in enumerate(rows, start=1):
+            findings: List[str] = []
+            validate_gap_row(row, f"gap row {number}", framework.all_guidelines, findings)
+            _check_expected(f"gap row {number}", findings, invalid_rows.get(str(number)), GAP_MUTATIONS, problems)
+
+    invalid_policies = manifest["invalid"]["policies"]
+    policy_paths = sorted((out / "policies").glob("*/*.md"))
+
+    def check_policies() -> None:
+        for path in policy_paths:
+            findings: List[str] = []
+            validate_policy_file(
+                path, framework.all_standards, framework.all_guidelines, framework.area_ids, findings
+            )
+            rel_path = path.relative_to(out).as_posix()
+            _check_expected(rel_path, findings, invalid_policies.get(rel_path), POLICY_MUTATIONS, problems)
+
+    timed("profiles", len(profile_lines), check_profiles)
+    timed("gap rows", len(rows), check_gap_rows)
+    timed("policies", len(policy_paths), check_policies)
+
+    for name, count, seconds in timings:
+        rate = count / seconds if seconds else 0.0
+        print(f"  {name:<10} {count:>8} items  {seconds * 1000:9.1f} ms  {rate:,.0f}/s")
+    if problems:
+        for problem in problems[:50]:
+            fail(problem)
+        if len(problems) > 50:
+            fail(f"... and {len(problems) - 50} more")
+        return 1
+    ok("Validators reported exactly the seeded invalid items")
+    return 0
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate a seeded synthetic CSCRF corpus for scale testing.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help="Output directory")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--profiles", type=int, default=1000, help="Entity profiles (default: 1000)")
+    parser.add_argument("--gap-rows", type=int, default=10000, help="Gap analysis rows (default: 10000)")
+    parser.add_argument("--policies", type=int, default=2000, help="Policy files (default: 2000)")
+    parser.add_argument(
+        "--trigger-cases", type=int, default=5000, help="Trigger suite cases (default: 5000)"
+    )
+    parser.add_argument(
+        "--invalid-rate",
+        type=float,
+        default=0.1,
+        help="Share of profiles, gap rows and policies made deliberately invalid (default: 0.1)",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="After generating, run the validators and check they flag exactly the invalid items",
+    )
+    parser.add_argument(
+        "--verify-only", action="store_true", help="Verify an existing corpus without regenerating"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    out = args.out.resolve()
+    if not 0.0 <= args.invalid_rate <= 1.0:
+        print("ERROR: --invalid-rate must be between 0 and 1", file=sys.stderr)
+        return 2
+
+    try:
+        if not args.verify_only:
+            start = time.perf_counter()
+            manifest = generate(
+                out,
+                args.seed,
+                args.profiles,
+                args.gap_rows,
+                args.policies,
+                args.trigger_cases,
+                args.invalid_rate,
+            )
+            invalid = manifest["invalid"]
+            ok(
+                f"Generated corpus in {out} ({time.perf_counter() - start:.1f}s): "
+                f"profiles={args.profiles} ({len(invalid['profiles'])} invalid), "
+                f"gap_rows={args.gap_rows} ({len(invalid['gap_rows'])} invalid), "
+                f"policies={args.policies} ({len(invalid['policies'])} invalid), "
+                f"trigger_cases={args.trigger_cases}"
+            )
+        if args.verify or args.verify_only:
+            return verify(out)
+    except (OSError, ValueError) as exc:
+        fail(str(exc))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
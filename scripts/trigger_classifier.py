@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""Learned offline trigger classifier: char n-gram TF-IDF with a linear softmax model.
+
+The model is trained from the positive/negative/paraphrase/boundary cases of
+the canonical trigger suite and serialized to scripts/data/trigger-classifier.json.
+Scoring vectorizes a whole batch of prompts into one TF-IDF matrix and
+multiplies it by the weight matrix, so eval_skills_api.py can classify
+thousands of prompts per call (``--matcher learned``). NumPy is only needed
+here; the keyword heuristic in eval_skills_api.py remains dependency-free.
+
+Usage:
+    python3 scripts/trigger_classifier.py --train
+    python3 scripts/trigger_classifier.py --train --suite path/to/trigger-tests.yaml --folds 5
+    python3 scripts/trigger_classifier.py "draft an access control policy for our stock broker"
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+ROOT = Path(__file__).resolve().parent.parent
+MODEL_PATH = ROOT / "scripts/data/trigger-classifier.json"
+SUITE_PATH = ROOT / ".claude/skills/ciso/references/trigger-tests.yaml"
+
+# Bump when featurization or the serialized layout changes.
+MODEL_VERSION = 1
+
+LABELS = ["none", "ciso", "ciso-assess", "ciso-policy"]
+NGRAM_RANGE = (2, 4)
+MAX_FEATURES = 16384
+L2_PENALTY = 1e-4
+EPOCHS = 400
+LEARNING_RATE = 0.05
+SEED = 17
+
+# Rows per dense TF-IDF block; bounds scoring memory at CHUNK_SIZE x vocabulary floats.
+CHUNK_SIZE = 2048
+
+# Polynomial rolling hash over code points; n-grams are matched to the vocabulary by
+# their 64-bit hash, so featurizing a batch never loops over n-grams in Python.
+_HASH_BASE = 1_000_003
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise RuntimeError("the learned trigger matcher requires NumPy (uv sync --extra eval)")
+
+
+def normalize(text: str) -> str:
+    return " " + " ".join(text.lower().split()) + " "
+
+
+def char_ngrams(text: str, ngram_range: Tuple[int, int] = NGRAM_RANGE) -> List[str]:
+    text = normalize(text)
+    low, high = ngram_range
+    grams: List[str] = []
+    for n in range(low, high + 1):
+        grams.extend(text[i : i + n] for i in range(len(text) - n + 1))
+    return grams
+
+
+def load_cases(path: Path = SUITE_PATH) -> List[Dict[str, Any]]:
+    """Load trigger cases (flat ``cases`` or bucketed layout), JSON first with a YAML fallback."""
+    try:
+        raw = path.read_text(encoding="utf-8")
+    except OSError as exc:
+        raise ValueError(f"cannot read trigger suite {path}: {exc}") from exc
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError:
+        try:
+            import yaml  # type: ignore
+        except ModuleNotFoundError as exc:
+            raise ValueError(f"{path} is not JSON-compatible YAML and PyYAML is unavailable") from exc
+        data = yaml.safe_load(raw)
+    if not isinstance(data, dict):
+        raise ValueError(f"top-level suite structure must be a mapping in {path}")
+
+    if "cases" in data:
+        cases = data["cases"]
+    else:
+        cases = []
+        for bucket in data.get("buckets", []):
+            for case in bucket.get("cases", []):
+                cases.append({**case, "bucket": bucket.get("name", "unknown")})
+    return [case for case in cases if isinstance(case, dict) and case.get("prompt")]
+
+
+def case_label(case: Dict[str, Any]) -> str:
+    expected = case.get("expected_skill")
+    return expected if expected in LABELS else "none"
+
+
+def suite_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class TriggerClassifier:
+    """TF-IDF vocabulary plus a (features x labels) weight matrix."""
+
+    def __init__(
+        self,
+        vocabulary: List[str],
+        idf: Sequence[float],
+        weights: Sequence[Sequence[float]],
+        bias: Sequence[float],
+        labels: Sequence[str] = LABELS,
+        ngram_range: Tuple[int, int] = NGRAM_RANGE,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        _require_numpy()
+        self.vocabulary = vocabulary
+        self.idf = np.asarray(idf, dtype=np.float32)
+        self.weights = np.asarray(weights, dtype=np.float32).reshape(len(vocabulary), len(labels))
+        self.bias = np.asarray(bias, dtype=np.float32)
+        self.labels = list(labels)
+        self.ngram_range = (int(ngram_range[0]), int(ngram_range[1]))
+        self.metadata = metadata or {}
+        hashes = np.array([_hash_gram(gram) for gram in vocabulary], dtype=np.uint64)
+        self._hash_order = np.argsort(hashes, kind="stable")
+        self._sorted_hashes = hashes[self._hash_order]
+
+    # -- featurization -----------------------------------------------------
+
+    def transform(self, texts: Sequence[str]) -> "np.ndarray":
+        """Dense, L2-normalized sublinear TF-IDF rows for ``texts``."""
+        rows, cols, counts = self._count_ngrams(texts)
+        matrix = np.zeros((len(texts), len(self.vocabulary)), dtype=np.float32)
+        matrix[rows, cols] = (1.0 + np.log(counts.astype(np.float32))) * self.idf[cols]
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    def _count_ngrams(
+        self, texts: Sequence[str]
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """(row, feature, count) triples for every in-vocabulary n-gram in ``texts``.
+
+        All prompts are concatenated into one code-point array; n-grams that
+        would straddle two prompts are masked out.
+        """
+        empty = np.zeros(0, dtype=np.intp)
+        if not self.vocabulary:
+            return empty, empty, empty
+        normalized = [normalize(text) for text in texts]
+        lengths = np.fromiter((len(text) for text in normalized), dtype=np.intp, count=len(normalized))
+        codes = np.frombuffer("".join(normalized).encode("utf-32-le"), dtype=np.uint32).astype(np.uint64)
+        ends = np.cumsum(lengths)
+        owner = np.repeat(np.arange(len(normalized)), lengths)
+
+        rows: List["np.ndarray"] = []
+        cols: List["np.ndarray"] = []
+        low, high = self.ngram_range
+        for n in range(low, high + 1):
+            if len(codes) < n:
+                continue
+            hashes = _rolling_hash(codes, n)
+            doc = owner[: len(hashes)]
+            inside = np.arange(len(hashes)) + n <= ends[doc]
+            hashes, doc = hashes[inside], doc[inside]
+            slots = np.searchsorted(self._sorted_hashes, hashes)
+            np.minimum(slots, len(self._sorted_hashes) - 1, out=slots)
+            found = self._sorted_hashes[slots] == hashes
+            rows.append(doc[found])
+            cols.append(self._hash_order[slots[found]])
+
+        if not rows:
+            return empty, empty, empty
+        width = len(self.vocabulary)
+        keys, counts = np.unique(np.concatenate(rows) * width + np.concatenate(cols), return_counts=True)
+        return keys // width, keys % width, counts
+
+    # -- scoring -----------------------------------------------------------
+
+    def predict_proba(self, texts: Sequence[str]) -> "np.ndarray":
+        logits = self.transform(texts) @ self.weights + self.bias
+        return _softmax(logits)
+
+    def predict_batch(
+        self, prompts: Iterable[str], chunk_size: int = CHUNK_SIZE
+    ) -> List[Optional[str]]:
+        """Classify prompts, one matrix multiply per chunk; ``None`` means no skill."""
+        results: List[Optional[str]] = []
+        for chunk in _chunks(prompts, chunk_size):
+            for position in self.predict_proba(chunk).argmax(axis=1):
+                label = self.labels[int(position)]
+                results.append(None if label == "none" else label)
+        return results
+
+    # -- training ----------------------------------------------------------
+
+    @classmethod
+    def fit(
+        cls,
+        texts: Sequence[str],
+        labels: Sequence[str],
+        max_features: int = MAX_FEATURES,
+        l2: float = L2_PENALTY,
+        epochs: int = EPOCHS,
+        learning_rate: float = LEARNING_RATE,
+        seed: int = SEED,
+    ) -> "TriggerClassifier":
+        _require_numpy()
+        if not texts:
+            raise ValueError("no training cases")
+
+        document_frequency: Counter = Counter()
+        for text in texts:
+            document_frequency.update(set(char_ngrams(text)))
+        # Most frequent n-grams first; ties broken lexically so training is deterministic.
+        ranked = sorted(document_frequency.items(), key=lambda item: (-item[1], item[0]))
+        vocabulary = [gram for gram, _ in ranked[:max_features]]
+        total = len(texts)
+        idf = [
+            math.log((1 + total) / (1 + document_frequency[gram])) + 1.0 for gram in vocabulary
+        ]
+
+        model = cls(
+            vocabulary,
+            idf,
+            np.zeros((len(vocabulary), len(LABELS)), dtype=np.float32),
+            np.zeros(len(LABELS), dtype=np.float32),
+        )
+        features = model.transform(texts)
+        targets = np.zeros((total, len(LABELS)), dtype=np.float32)
+        targets[np.arange(total), [LABELS.index(label) for label in labels]] = 1.0
+
+        # Balanced class weights so the usually larger "none" bucket does not dominate.
+        class_counts = targets.sum(axis=0)
+        class_weights = np.where(
+            class_counts > 0, total / (len(LABELS) * np.maximum(class_counts, 1)), 0.0
+        )
+        sample_weights = (targets @ class_weights).astype(np.float32)
+        sample_weights /= sample_weights.sum()
+
+        model.weights, model.bias = _adam(
+            features, targets, sample_weights, l2, epochs, learning_rate, seed
+        )
+        return model
+
+    # -- serialization -----------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": MODEL_VERSION,
+            "labels": self.labels,
+            "ngram_range": list(self.ngram_range),
+            "metadata": self.metadata,
+            "vocabulary": self.vocabulary,
+            "idf": [round(float(value), 6) for value in self.idf],
+            "bias": [round(float(value), 6) for value in self.bias],
+            "weights": [[round(float(value), 6) for value in row] for row in self.weights],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TriggerClassifier":
+        if data.get("version") != MODEL_VERSION:
+            raise ValueError(
+                f"trigger classifier version {data.get('version')} != {MODEL_VERSION}; retrain with --train"
+            )
+        return cls(
+            data["vocabulary"],
+            data["idf"],
+            data["weights"],
+            data["bias"],
+            labels=data["labels"],
+            ngram_range=tuple(data["ngram_range"]),
+            metadata=data.get("metadata"),
+        )
+
+    def save(self, path: Path = MODEL_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=".trigger-classifier-", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(self.to_dict(), handle, separators=(",", ":"), ensure_ascii=False)
+                handle.write("\n")
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+
+def _rolling_hash(codes: "np.ndarray", n: int) -> "np.ndarray":
+    """Hash of every length-``n`` window of ``codes`` (uint64, wrapping)."""
+    count = len(codes) - n + 1
+    hashes = np.full(count, n, dtype=np.uint64)
+    base = np.uint64(_HASH_BASE)
+    for offset in range(n):
+        hashes *= base
+        hashes += codes[offset : offset + count]
+    return hashes
+
+
+def _hash_gram(gram: str) -> int:
+    value = len(gram)
+    for char in gram:
+        value = (value * _HASH_BASE + ord(char)) % (1 << 64)
+    return value
+
+
+def _chunks(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    chunk: List[str] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _softmax(logits: "np.ndarray") -> "np.ndarray":
+    shifted = np.exp(logits - logits.max(axis=1, keepdims=True))
+    return shifted / shifted.sum(axis=1, keepdims=True)
+
+
+def _adam(
+    features: "np.ndarray",
+    targets: "np.ndarray",
+    sample_weights: "np.ndarray",
+    l2: float,
+    epochs: int,
+    learning_rate: float,
+    seed: int,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Full-batch Adam on weighted softmax cross-entropy with an L2 penalty."""
+    rng = np.random.default_rng(seed)
+    weights = (rng.standard_normal((features.shape[1], targets.shape[1])) * 0.01).astype(np.float32)
+    bias = np.zeros(targets.shape[1], dtype=np.float32)
+    params = [weights, bias]
+    first = [np.zeros_like(param) for param in params]
+    second = [np.zeros_like(param) for param in params]
+    beta1, beta2, eps = 0.9, 0.999, 1e-8
+    for step in range(1, epochs + 1):
+        residual = (_softmax(features @ weights + bias) - targets) * sample_weights[:, None]
+        grads = [features.T @ residual + l2 * weights, residual.sum(axis=0)]
+        for param, grad, m, v in zip(params, grads, first, second):
+            m *= beta1
+            m += (1 - beta1) * grad
+            v *= beta2
+            v += (1 - beta2) * grad * grad
+            m_hat = m / (1 - beta1**step)
+            v_hat = v / (1 - beta2**step)
+            param -= learning_rate * m_hat / (np.sqrt(v_hat) + eps)
+    return weights, bias
+
+
+def cross_validate(texts: List[str], labels: List[str], folds: int, seed: int = SEED) -> float:
+    """Mean held-out accuracy over ``folds`` seeded splits (vocabulary refit per fold)."""
+    order = np.random.default_rng(seed).permutation(len(texts))
+    correct = 0
+    for fold in range(folds):
+        held_out = set(order[fold::folds].tolist())
+        train = [i for i in range(len(texts)) if i not in held_out]
+        test = sorted(held_out)
+        model = TriggerClassifier.fit([texts[i] for i in train], [labels[i] for i in train])
+        predictions = model.predict_batch(texts[i] for i in test)
+        correct += sum(
+            (prediction or "none") == labels[i] for prediction, i in zip(predictions, test)
+        )
+    return correct / len(texts)
+
+
+_MODEL: Optional[TriggerClassifier] = None
+
+
+def load_model(path: Path = MODEL_PATH) -> TriggerClassifier:
+    """Load the serialized classifier once per process."""
+    global _MODEL
+    _require_numpy()
+    if _MODEL is not None and path == MODEL_PATH:
+        return _MODEL
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        raise ValueError(
+            f"no trained trigger classifier at {path}; run scripts/trigger_classifier.py --train"
+        ) from exc
+    model = TriggerClassifier.from_dict(data)
+    if path == MODEL_PATH:
+        _MODEL = model
+    return model
+
+
+def train(suite: Path, output: Path, folds: int) -> int:
+    cases = load_cases(suite)
+    texts = [case["prompt"] for case in cases]
+    labels = [case_label(case) for case in cases]
+    if len(set(labels)) < 2:
+        print(f"[FAIL] {suite}: need cases for at least two labels, found {sorted(set(labels))}")
+        return 1
+
+    metadata: Dict[str, Any] = {
+        "suite_sha256": suite_digest(suite),
+        "cases": len(cases),
+        "label_counts": dict(sorted(Counter(labels).items())),
+        "buckets": dict(sorted(Counter(case.get("bucket", "unknown") for case in cases).items())),
+    }
+    if folds > 1:
+        metadata["cv_folds"] = folds
+        metadata["cv_accuracy"] = round(cross_validate(texts, labels, folds), 4)
+
+    model = TriggerClassifier.fit(texts, labels)
+    predictions = model.predict_batch(texts)
+    metadata["train_accuracy"] = round(
+        sum((prediction or "none") == label for prediction, label in zip(predictions, labels))
+        / len(labels),
+        4,
+    )
+    model.metadata = metadata
+    model.save(output)
+
+    print(
+        f"[PASS] Trained on {len(cases)} cases: features={len(model.vocabulary)}, "
+        f"train_accuracy={metadata['train_accuracy']:.1%}"
+        + (f", cv_accuracy={metadata['cv_accuracy']:.1%} ({folds}-fold)" if folds > 1 else "")
+    )
+    print(f"[PASS] Wrote {output}")
+    return 0
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Train or query the learned CSCRF skill trigger classifier.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("prompts", nargs="*", help="Prompts to classify with the saved model")
+    parser.add_argument("--train", action="store_true", help="Train from the trigger suite and save")
+    parser.add_argument("--suite", type=Path, default=SUITE_PATH, help="Trigger suite to train on")
+    parser.add_argument("--model", type=Path, default=MODEL_PATH, help="Serialized model path")
+    parser.add_argument(
+        "--folds",
+        type=int,
+        default=5,
+        help="Cross-validation folds reported at training time, 0 to skip (default: 5)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    try:
+        if args.train:
+            return train(args.suite, args.model, args.folds)
+        if not args.prompts:
+            print("ERROR: pass prompts to classify (or --train)", file=sys.stderr)
+            return 2
+        model = load_model(args.model)
+    except (RuntimeError, ValueError) as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 2
+
+    probabilities = model.predict_proba(args.prompts)
+    for prompt, row in zip(args.prompts, probabilities):
+        best = int(row.argmax())
+        print(f"{model.labels[best]:<12} p={row[best]:.3f}  {prompt}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
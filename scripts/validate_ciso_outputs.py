@@ -1,29 +1,41 @@
 #!/usr/bin/env python3
-"""Validate CSCRF skill output contracts and generated artifacts."""
+"""Validate CSCRF skill output contracts and generated artifacts.
+
+Checks every per-entity workspace under the workspace root (see
+scripts/workspaces.py) in one invocation; --jobs spreads artifact and policy
+validation across processes.
+"""
 
 from __future__ import annotations
 
 import argparse
+import contextlib
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Sequence, Set, Tuple
 
+from framework_index import load_index
+import frontmatter
+from frontmatter import load_frontmatter
+from validation_cache import ValidationCache, add_cache_arguments, source_version
+from workspaces import (
+    ROOT_ENV,
+    WORK_ARTIFACTS,
+    Workspace,
+    artifact_path,
+    display_path,
+    locked,
+    select,
+    workspace_root,
+)
+
 ROOT = Path(__file__).resolve().parent.parent
 MAP_PATH = ROOT / ".claude/skills/ciso/references/policy-area-map.json"
 
-WORK_ARTIFACTS = [
-    "docs/.ciso-work/entity-profile.md",
-    "docs/.ciso-work/entity-profile.json",
-    "docs/.ciso-work/entity-tags.json",
-    "docs/.ciso-work/gap-analysis.md",
-    "docs/.ciso-work/gap-analysis.json",
-    "docs/.ciso-work/policy-plan.md",
-    "docs/.ciso-work/review-findings.md",
-    "docs/.ciso-work/roadmap.md",
-]
-
 REQUIRED_POLICY_KEYS = [
     "title",
     "entity",
@@ -43,6 +55,8 @@ STANDARD_ID_RE = re.compile(r"^[A-Z]{2}\.[A-Z]{2}\.S\d+$")
 GUIDELINE_ID_RE = re.compile(r"^[A-Z]{2}\.[A-Z]{2}\.G\d+$")
 DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
+AreaIds = Dict[str, Tuple[Set[str], Set[str]]]
+
 
 def fail(message: str) -> None:
     print(f"[FAIL] {message}")
@@ -60,119 +74,25 @@ def load_json(path: Path) -> Any:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def strip_quotes(value: str) -> str:
-    value = value.strip()
-    if len(value) >= 2 and value[0] == value[-1] and value[0] in {"'", '"'}:
-        return value[1:-1]
-    return value
-
-
-def parse_inline_list(value: str) -> List[str]:
-    content = value.strip()[1:-1].strip()
-    if not content:
-        return []
-    return [strip_quotes(item.strip()) for item in content.split(",") if item.strip()]
-
-
-def parse_frontmatter(markdown_text: str) -> Dict[str, Any] | None:
-    match = re.match(r"^---\n(.*?)\n---\n?", markdown_text, re.DOTALL)
-    if not match:
-        return None
-
-    block = match.group(1)
-    lines = block.splitlines()
-    data: Dict[str, Any] = {}
-    index = 0
-
-    while index < len(lines):
-        line = lines[index]
-        if not line.strip():
-            index += 1
-            continue
-
-        key_match = re.match(r"^([A-Za-z0-9_-]+):\s*(.*)$", line)
-        if not key_match:
-            index += 1
-            continue
-
-        key, raw_value = key_match.groups()
-        raw_value = raw_value.strip()
-
-        if raw_value.startswith("[") and raw_value.endswith("]"):
-            data[key] = parse_inline_list(raw_value)
-            index += 1
-            continue
-
-        if raw_value == "":
-            items: List[str] = []
-            cursor = index + 1
-            while cursor < len(lines):
-                list_match = re.match(r"^\s*-\s*(.+)$", lines[cursor])
-                if list_match:
-                    items.append(strip_quotes(list_match.group(1).strip()))
-                    cursor += 1
-                    continue
-                if not lines[cursor].strip():
-                    cursor += 1
-                    continue
-                if re.match(r"^[A-Za-z0-9_-]+:\s*", lines[cursor]):
-                    break
-                break
-
-            data[key] = items if items else ""
-            index = cursor
-            continue
-
-        data[key] = strip_quotes(raw_value)
-        index += 1
-
-    return data
-
-
-def extract_ids(text: str) -> Tuple[Set[str], Set[str]]:
-    standards = set(re.findall(r"\b[A-Z]{2}\.[A-Z]{2}\.S\d+\b", text))
-    guidelines = set(re.findall(r"\b[A-Z]{2}\.[A-Z]{2}\.G\d+\b", text))
-    return standards, guidelines
-
-
 def collect_global_framework_ids() -> Tuple[Set[str], Set[str]]:
-    standards: Set[str] = set()
-    guidelines: Set[str] = set()
-
-    for path in sorted((ROOT / "framework").rglob("*.md")):
-        std, gid = extract_ids(path.read_text(encoding="utf-8"))
-        standards.update(std)
-        guidelines.update(gid)
+    index = load_index()
+    return index.standard_ids, index.guideline_ids
 
-    return standards, guidelines
 
-
-def load_area_allowed_ids() -> Dict[str, Tuple[Set[str], Set[str]]]:
+def load_area_allowed_ids() -> AreaIds:
     data = load_json(MAP_PATH)
     areas = data.get("areas")
     if not isinstance(areas, list):
         raise ValueError("policy-area-map.json must define an areas list")
 
+    index = load_index()
     area_ids: Dict[str, Tuple[Set[str], Set[str]]] = {}
     for area in areas:
         slug = area.get("slug")
         files = area.get("framework_files")
         if not isinstance(slug, str) or not isinstance(files, list):
             continue
-
-        standards: Set[str] = set()
-        guidelines: Set[str] = set()
-        for rel_path in files:
-            if not isinstance(rel_path, str):
-                continue
-            path = ROOT / rel_path
-            if not path.exists():
-                continue
-            std, gid = extract_ids(path.read_text(encoding="utf-8"))
-            standards.update(std)
-            guidelines.update(gid)
-
-        area_ids[slug] = (standards, guidelines)
+        area_ids[slug] = index.ids_for_files(rel for rel in files if isinstance(rel, str))
 
     return area_ids
 
@@ -200,6 +120,42 @@ def validate_entity_tags_json(path: Path, errors: List[str]) -> None:
         errors.append(f"entity-tags.json has invalid category: {category}")
 
 
+GAP_ROW_REQUIRED_FIELDS = {
+    "guideline_id",
+    "function",
+    "mandatory",
+    "status",
+    "reason",
+    "owner_hint",
+    "priority",
+}
+
+
+def validate_gap_row(row: Any, label: str, known_guidelines: Set[str], errors: List[str]) -> None:
+    """Validate one gap-analysis row; ``label`` prefixes every finding."""
+    if not isinstance(row, dict):
+        errors.append(f"{label} must be an object")
+        return
+    missing = [field for field in GAP_ROW_REQUIRED_FIELDS if field not in row]
+    if missing:
+        errors.append(f"{label} missing fields: {', '.join(missing)}")
+        return
+
+    guideline_id = row["guideline_id"]
+    if not isinstance(guideline_id, str) or not GUIDELINE_ID_RE.match(guideline_id):
+        errors.append(f"{label} has invalid guideline_id: {guideline_id!r}")
+    elif guideline_id not in known_guidelines:
+        errors.append(f"{label} references unknown guideline_id: {guideline_id}")
+
+    status = row["status"]
+    if not isinstance(status, str) or status not in VALID_GAP_STATUSES:
+        errors.append(f"{label} has invalid status: {status!r}")
+
+    priority = row["priority"]
+    if not isinstance(priority, str) or priority not in VALID_PRIORITIES:
+        errors.append(f"{label} has invalid priority: {priority!r}")
+
+
 def validate_gap_analysis_json(path: Path, known_guidelines: Set[str], errors: List[str]) -> None:
     data = load_json(path)
     rows: Any = data
@@ -209,37 +165,27 @@ def validate_gap_analysis_json(path: Path, known_guidelines: Set[str], errors: L
         errors.append("gap-analysis.json must be a list or object with 'items' list")
         return
 
-    required = {
-        "guideline_id",
-        "function",
-        "mandatory",
-        "status",
-        "reason",
-        "owner_hint",
-        "priority",
-    }
     for index, row in enumerate(rows, start=1):
-        if not isinstance(row, dict):
-            errors.append(f"gap-analysis.json item {index} must be an object")
-            continue
-        missing = [field for field in required if field not in row]
-        if missing:
-            errors.append(f"gap-analysis.json item {index} missing fields: {', '.join(missing)}")
-            continue
-
-        guideline_id = row["guideline_id"]
-        if not isinstance(guideline_id, str) or not GUIDELINE_ID_RE.match(guideline_id):
-            errors.append(f"gap-analysis.json item {index} has invalid guideline_id: {guideline_id!r}")
-        elif guideline_id not in known_guidelines:
-            errors.append(f"gap-analysis.json item {index} references unknown guideline_id: {guideline_id}")
+        validate_gap_row(row, f"gap-analysis.json item {index}", known_guidelines, errors)
 
-        status = row["status"]
-        if not isinstance(status, str) or status not in VALID_GAP_STATUSES:
-            errors.append(f"gap-analysis.json item {index} has invalid status: {status!r}")
 
-        priority = row["priority"]
-        if not isinstance(priority, str) or priority not in VALID_PRIORITIES:
-            errors.append(f"gap-analysis.json item {index} has invalid priority: {priority!r}")
+def validate_gap_analysis_jsonl(path: Path, known_guidelines: Set[str], errors: List[str]) -> None:
+    """Stream-validate the JSONL gap analysis: one row object per line, constant memory."""
+    rows = 0
+    with path.open(encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            rows += 1
+            label = f"gap-analysis.jsonl line {line_number}"
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as exc:
+                errors.append(f"{label} is not valid JSON: {exc.msg}")
+                continue
+            validate_gap_row(row, label, known_guidelines, errors)
+    if rows == 0:
+        errors.append("gap-analysis.jsonl must contain at least one row")
 
 
 def validate_review_findings(path: Path, errors: List[str]) -> None:
@@ -253,6 +199,10 @@ def validate_review_findings(path: Path, errors: List[str]) -> None:
             errors.append(f"review-findings.md missing '{token}' field in findings")
 
 
+def _located(path: Path, line: int) -> str:
+    return f"{display_path(path)}:{line}"
+
+
 def validate_policy_file(
     path: Path,
     all_standards: Set[str],
@@ -260,23 +210,27 @@ def validate_policy_file(
     area_ids: Dict[str, Tuple[Set[str], Set[str]]],
     errors: List[str],
 ) -> None:
-    text = path.read_text(encoding="utf-8")
-    fm = parse_frontmatter(text)
+    fm = load_frontmatter(path)
     if fm is None:
-        errors.append(f"{path.relative_to(ROOT)} missing YAML frontmatter")
+        errors.append(f"{display_path(path)} missing YAML frontmatter")
         return
 
+    for issue in fm.issues:
+        errors.append(f"{_located(path, issue.line)} {issue.message}")
+
     for key in REQUIRED_POLICY_KEYS:
         if key not in fm:
-            errors.append(f"{path.relative_to(ROOT)} missing frontmatter key: {key}")
+            errors.append(f"{display_path(path)} missing frontmatter key: {key}")
 
     category = fm.get("category")
     if isinstance(category, str) and category not in VALID_CATEGORIES:
-        errors.append(f"{path.relative_to(ROOT)} has invalid category: {category}")
+        errors.append(f"{_located(path, fm.line_of('category'))} has invalid category: {category}")
 
     generated_date = fm.get("generated_date")
     if isinstance(generated_date, str) and not DATE_RE.match(generated_date):
-        errors.append(f"{path.relative_to(ROOT)} has invalid generated_date: {generated_date}")
+        errors.append(
+            f"{_located(path, fm.line_of('generated_date'))} has invalid generated_date: {generated_date}"
+        )
 
     for list_key, pattern, known_ids in (
         ("cscrf_standards", STANDARD_ID_RE, all_standards),
@@ -284,14 +238,14 @@ def validate_policy_file(
     ):
         values = fm.get(list_key)
         if not isinstance(values, list) or not values:
-            errors.append(f"{path.relative_to(ROOT)} key '{list_key}' must be a non-empty list")
+            errors.append(f"{_located(path, fm.line_of(list_key))} key '{list_key}' must be a non-empty list")
             continue
         for value in values:
             if not isinstance(value, str) or not pattern.match(value):
-                errors.append(f"{path.relative_to(ROOT)} invalid ID in {list_key}: {value!r}")
+                errors.append(f"{_located(path, fm.line_of(list_key))} invalid ID in {list_key}: {value!r}")
                 continue
             if value not in known_ids:
-                errors.append(f"{path.relative_to(ROOT)} unknown ID in {list_key}: {value}")
+                errors.append(f"{_located(path, fm.line_of(list_key))} unknown ID in {list_key}: {value}")
 
     area = path.stem
     if area in area_ids:
@@ -302,66 +256,227 @@ def validate_policy_file(
             for standard in standards:
                 if isinstance(standard, str) and standard not in allowed_standards:
                     errors.append(
-                        f"{path.relative_to(ROOT)} references standard outside mapped area '{area}': {standard}"
+                        f"{_located(path, fm.line_of('cscrf_standards'))} references standard "
+                        f"outside mapped area '{area}': {standard}"
                     )
         if isinstance(guidelines, list):
             for guideline in guidelines:
                 if isinstance(guideline, str) and guideline not in allowed_guidelines:
                     errors.append(
-                        f"{path.relative_to(ROOT)} references guideline outside mapped area '{area}': {guideline}"
+                        f"{_located(path, fm.line_of('cscrf_guidelines'))} references guideline "
+                        f"outside mapped area '{area}': {guideline}"
                     )
 
 
+# Workspace artifacts with content contracts; the rest are only checked for presence.
+ARTIFACT_VALIDATORS = {
+    "entity-profile.json",
+    "entity-tags.json",
+    "gap-analysis.json",
+    "gap-analysis.jsonl",
+    "review-findings.md",
+}
+POLICY = "policy"
+
+# (kind, path): kind is POLICY or an ARTIFACT_VALIDATORS name.
+FileItem = Tuple[str, Path]
+
+_WORKER_CONTEXT: Tuple[Set[str], Set[str], AreaIds] | None = None
+
+
+def validate_file(
+    item: FileItem,
+    all_standards: Set[str],
+    all_guidelines: Set[str],
+    area_ids: AreaIds,
+) -> List[str]:
+    kind, path = item
+    findings: List[str] = []
+    if kind == POLICY:
+        validate_policy_file(path, all_standards, all_guidelines, area_ids, findings)
+    elif kind == "entity-profile.json":
+        validate_entity_profile_json(path, findings)
+    elif kind == "entity-tags.json":
+        validate_entity_tags_json(path, findings)
+    elif kind == "gap-analysis.json":
+        validate_gap_analysis_json(path, all_guidelines, findings)
+    elif kind == "gap-analysis.jsonl":
+        validate_gap_analysis_jsonl(path, all_guidelines, findings)
+    elif kind == "review-findings.md":
+        validate_review_findings(path, findings)
+    return findings
+
+
+def _init_worker(all_standards: Set[str], all_guidelines: Set[str], area_ids: AreaIds) -> None:
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = (all_standards, all_guidelines, area_ids)
+
+
+def _validate_in_worker(item: FileItem) -> List[str]:
+    assert _WORKER_CONTEXT is not None
+    return validate_file(item, *_WORKER_CONTEXT)
+
+
+def validate_files(
+    items: Sequence[FileItem],
+    all_standards: Set[str],
+    all_guidelines: Set[str],
+    area_ids: AreaIds,
+    jobs: int = 1,
+) -> List[List[str]]:
+    """Validate policy files and workspace artifacts, returning findings per item in input order.
+
+    With jobs > 1 the items are spread across a process pool; the framework ID
+    sets and area map are sent to each worker once via the pool initializer.
+    """
+    if jobs <= 1 or len(items) < 2:
+        return [validate_file(item, all_standards, all_guidelines, area_ids) for item in items]
+
+    workers = min(jobs, len(items))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(all_standards, all_guidelines, area_ids),
+    ) as pool:
+        return list(
+            pool.map(_validate_in_worker, items, chunksize=max(1, len(items) // (workers * 4)))
+        )
+
+
+def validate_policy_files(
+    paths: Sequence[Path],
+    all_standards: Set[str],
+    all_guidelines: Set[str],
+    area_ids: AreaIds,
+    jobs: int = 1,
+) -> List[List[str]]:
+    """Validate policy files, returning findings per file in input order."""
+    return validate_files([(POLICY, path) for path in paths], all_standards, all_guidelines, area_ids, jobs)
+
+
 def parse_args(argv: Sequence[str]) -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description=__doc__)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
     parser.add_argument(
         "--strict",
         action="store_true",
-        help="Require all workflow artifacts from docs/.ciso-work to exist.",
+        help="Require all workflow artifacts to exist in every checked workspace.",
+    )
+    parser.add_argument(
+        "--workspace-root",
+        type=Path,
+        help=f"Directory holding per-entity workspaces (default: ${ROOT_ENV} or docs/.ciso-work).",
+    )
+    parser.add_argument(
+        "--workspace",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Check only this workspace ('.' for the legacy root); repeat for several (default: all).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Validate artifacts and policy files across N processes (0 = one per CPU; default: 1).",
     )
+    add_cache_arguments(parser)
     return parser.parse_args(argv)
 
 
 def main(argv: Sequence[str]) -> int:
     args = parse_args(argv)
-
     errors: List[str] = []
 
     try:
         all_standards, all_guidelines = collect_global_framework_ids()
         area_ids = load_area_allowed_ids()
+        root = workspace_root(args.workspace_root)
+        workspaces = select(root, args.workspace)
     except (ValueError, json.JSONDecodeError) as exc:
         fail(str(exc))
         return 1
 
-    for rel_path in WORK_ARTIFACTS:
-        path = ROOT / rel_path
-        if not path.exists():
-            if args.strict:
-                errors.append(f"missing required artifact: {rel_path}")
-            else:
-                warn(f"artifact not present (skipped in non-strict mode): {rel_path}")
-            continue
-
-        if rel_path.endswith("entity-profile.json"):
-            validate_entity_profile_json(path, errors)
-        if rel_path.endswith("entity-tags.json"):
-            validate_entity_tags_json(path, errors)
-        if rel_path.endswith("gap-analysis.json"):
-            validate_gap_analysis_json(path, all_guidelines, errors)
-        if rel_path.endswith("review-findings.md"):
-            validate_review_findings(path, errors)
-
-    policy_dir = ROOT / "docs/policies"
-    policy_files: List[Path] = []
-    if policy_dir.exists():
-        policy_files = sorted(
-            path for path in policy_dir.glob("*.md") if path.name.lower() != "readme.md"
-        )
-    if not policy_files:
-        warn("no policy files found in docs/policies; skipping policy contract checks")
-    for path in policy_files:
-        validate_policy_file(path, all_standards, all_guidelines, area_ids, errors)
+    cache = ValidationCache(
+        "validate_ciso_outputs", source_version(__file__, frontmatter.__file__), not args.no_cache
+    )
+    framework_digest = load_index().digest
+
+    # Every file to check, with its cache key and the prefix naming its workspace.
+    items: List[FileItem] = []
+    keys: List[str] = []
+    prefixes: List[str] = []
+    # Strict-mode errors for absent artifacts, keyed by the position of the next
+    # item so they print in artifact order between the findings.
+    missing: Dict[int, List[str]] = {}
+
+    def add(item: FileItem, key: str, prefix: str) -> None:
+        items.append(item)
+        keys.append(key)
+        prefixes.append(prefix)
+
+    policy_files: Dict[Path, None] = {}
+    policy_dirs: Dict[Path, None] = {}
+    with contextlib.ExitStack() as stack:
+        # Shared locks keep writers from swapping artifacts mid-check.
+        for workspace in workspaces:
+            stack.enter_context(locked(workspace.path, shared=True))
+
+        for workspace in workspaces:
+            prefix = "" if workspace.legacy else f"{workspace.name}: "
+            for name in WORK_ARTIFACTS:
+                path = artifact_path(workspace.path, name)
+                if not path.exists():
+                    if args.strict:
+                        missing.setdefault(len(items), []).append(
+                            f"missing required artifact: {display_path(path)}"
+                        )
+                    else:
+                        warn(f"artifact not present (skipped in non-strict mode): {display_path(path)}")
+                    continue
+                if path.name not in ARTIFACT_VALIDATORS:
+                    continue
+                extra = display_path(path)
+                if path.name.startswith("gap-analysis"):
+                    extra = f"{extra}|{framework_digest}"
+                add((path.name, path), cache.key([path], extra), prefix)
+            policy_dirs[workspace.policy_dir] = None
+            policy_files.update(dict.fromkeys(workspace.policy_files()))
+
+        if not args.workspace:
+            # docs/policies stays in scope even when only entity workspaces exist.
+            legacy = Workspace(".", root, legacy=True)
+            policy_dirs[legacy.policy_dir] = None
+            policy_files.update(dict.fromkeys(legacy.policy_files()))
+        if not policy_files:
+            searched = ", ".join(display_path(directory) for directory in policy_dirs)
+            warn(f"no policy files found in {searched}; skipping policy contract checks")
+        for path in policy_files:
+            add((POLICY, path), cache.key([path, MAP_PATH], framework_digest), "")
+
+        findings = [cache.get(key) for key in keys]
+        pending = [position for position, found in enumerate(findings) if found is None]
+        if pending:
+            jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+            fresh = validate_files(
+                [items[position] for position in pending],
+                all_standards,
+                all_guidelines,
+                area_ids,
+                jobs,
+            )
+            for position, item_findings in zip(pending, fresh):
+                findings[position] = item_findings
+                cache.put(keys[position], item_findings)
+
+    for position, (prefix, item_findings) in enumerate(zip(prefixes, findings)):
+        errors.extend(missing.get(position, []))
+        errors.extend(f"{prefix}{finding}" for finding in item_findings or [])
+    errors.extend(missing.get(len(items), []))
+
+    cache.save()
+    if args.cache_stats:
+        print(cache.summary())
 
     if errors:
         for error in errors:
@@ -370,6 +485,8 @@ def main(argv: Sequence[str]) -> int:
 
     ok("Validated CISO output contracts")
     ok(f"Framework ID inventory: standards={len(all_standards)}, guidelines={len(all_guidelines)}")
+    if len(workspaces) > 1:
+        ok(f"Validated {len(workspaces)} workspace(s)")
     if policy_files:
         ok(f"Validated {len(policy_files)} policy file(s)")
     return 0
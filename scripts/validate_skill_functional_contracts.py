@@ -1,14 +1,27 @@
 #!/usr/bin/env python3
-"""Validate deterministic functional contracts for CSCRF skills."""
+"""Validate deterministic functional contracts for CSCRF skills.
+
+All manifests needing validation are compiled into one execution plan that
+groups checks by target file, so each file is read and parsed once however
+many cases reference it, and every contains_all pattern for that file is
+answered together from one deduplicated, precompiled pattern set.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence
+from typing import Any, Dict, Iterator, List, Pattern, Sequence, Set, Tuple
+
+import frontmatter
+from frontmatter import Frontmatter, parse_frontmatter
+from validation_cache import ValidationCache, add_cache_arguments, source_version
 
 ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_MANIFEST_GLOB = "tests/skills/functional/*.yaml"
@@ -39,150 +52,351 @@ def load_data(path: Path) -> Dict[str, Any]:
     return data
 
 
-def parse_frontmatter(markdown_text: str) -> Dict[str, str] | None:
-    match = re.match(r"^---\n(.*?)\n---\n?", markdown_text, re.DOTALL)
-    if not match:
+def resolve_path(rel_path: str) -> Path:
+    return ROOT / rel_path
+
+
+# ---------------------------------------------------------------------------
+# Execution plan
+# ---------------------------------------------------------------------------
+# Manifests are compiled into checks grouped by the file they read. Each file
+# is read and parsed at most once, however many cases point at it, and
+# independent files are evaluated on a thread pool.
+
+# (manifest index, position within that manifest); sorting findings by it
+# restores the order a case-by-case run would report them in.
+FindingKey = Tuple[int, int]
+Finding = Tuple[FindingKey, str]
+
+_REGEX_META_RE = re.compile(r"[.^$*+?{}\[\]\\|()]")
+_UNSET: Any = object()
+
+
+def _is_string_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+class PatternSet:
+    """Every contains_all pattern for one file, deduplicated and compiled once.
+
+    missing() answers for all of them in one call. Regexes without
+    metacharacters are matched as plain substrings. One alternation of all
+    patterns was measured at about 20x slower than this under Python's re
+    (it loses the per-pattern literal prefix scan), so each distinct pattern
+    keeps its own compiled search.
+    """
+
+    def __init__(self) -> None:
+        self.literals: Set[str] = set()
+        self.regexes: Dict[str, Pattern[str]] = {}
+
+    @staticmethod
+    def key(pattern: str, regex: bool) -> Tuple[bool, str]:
+        return (regex and _REGEX_META_RE.search(pattern) is not None, pattern)
+
+    def add(self, pattern: str, regex: bool) -> str | None:
+        """Register a pattern; return an error message if the regex does not compile."""
+        is_regex, _ = self.key(pattern, regex)
+        if not is_regex:
+            self.literals.add(pattern)
+            return None
+        if pattern not in self.regexes:
+            try:
+                self.regexes[pattern] = re.compile(pattern, re.MULTILINE)
+            except re.error as exc:
+                return f"invalid regex in contains_all: {pattern} ({exc})"
         return None
-    out: Dict[str, str] = {}
-    for line in match.group(1).splitlines():
-        m = re.match(r"^([A-Za-z0-9_-]+):\s*(.*)$", line.strip())
-        if m:
-            out[m.group(1)] = m.group(2).strip()
-    return out
 
+    def missing(self, text: str) -> Set[Tuple[bool, str]]:
+        missing = {(False, literal) for literal in self.literals if literal not in text}
+        missing.update(
+            (True, pattern) for pattern, compiled in self.regexes.items() if compiled.search(text) is None
+        )
+        return missing
 
-def resolve_path(rel_path: str) -> Path:
-    return ROOT / rel_path
 
+@dataclass
+class PlannedCheck:
+    key: FindingKey
+    context: str
+    check_type: str
+    check: Dict[str, Any]
 
-def run_check(check: Dict[str, Any], errors: List[str], context: str) -> None:
-    check_type = check.get("type")
-    path_value = check.get("path")
-    if not isinstance(check_type, str):
-        errors.append(f"{context}: check missing string 'type'")
-        return
-    if not isinstance(path_value, str):
-        errors.append(f"{context}: check missing string 'path'")
-        return
 
-    path = resolve_path(path_value)
+@dataclass
+class FileGroup:
+    """The checks that read one file, with their patterns merged."""
 
+    path_value: str
+    checks: List[PlannedCheck] = field(default_factory=list)
+    patterns: PatternSet = field(default_factory=PatternSet)
+
+
+def _argument_error(check_type: str, check: Dict[str, Any]) -> str | None:
     if check_type == "file_exists":
-        if not path.exists():
-            errors.append(f"{context}: file does not exist: {path_value}")
+        return None
+    if check_type == "contains_all":
+        if not _is_string_list(check.get("patterns")):
+            return "contains_all requires string list 'patterns'"
+        return None
+    if check_type == "frontmatter_keys":
+        if not _is_string_list(check.get("keys")):
+            return "frontmatter_keys requires string list 'keys'"
+        return None
+    if check_type == "json_items_have_fields":
+        if not _is_string_list(check.get("required_fields")):
+            return "json_items_have_fields requires string list 'required_fields'"
+        min_items = check.get("min_items", 1)
+        if not isinstance(min_items, int) or min_items < 0:
+            return "json_items_have_fields requires non-negative integer 'min_items'"
+        return None
+    return f"unsupported check type: {check_type}"
+
+
+def _has_frontmatter_key(fm: Frontmatter, key: str) -> bool:
+    """Top-level key, or a key of a one-level nested mapping such as ``metadata: {version: ...}``."""
+    if key in fm:
+        return True
+    return any(isinstance(value, dict) and key in value for value in fm.data.values())
+
+
+@dataclass
+class ExecutionPlan:
+    groups: Dict[str, FileGroup] = field(default_factory=dict)
+    # Problems found while compiling (malformed cases and checks, bad regexes).
+    findings: List[Finding] = field(default_factory=list)
+
+    def add_check(self, key: FindingKey, context: str, check: Dict[str, Any]) -> None:
+        check_type = check.get("type")
+        path_value = check.get("path")
+        if not isinstance(check_type, str):
+            self.findings.append((key, f"{context}: check missing string 'type'"))
+            return
+        if not isinstance(path_value, str):
+            self.findings.append((key, f"{context}: check missing string 'path'"))
+            return
+        problem = _argument_error(check_type, check)
+        if problem is not None:
+            self.findings.append((key, f"{context}: {problem}"))
+            return
+
+        group = self.groups.get(path_value)
+        if group is None:
+            group = self.groups[path_value] = FileGroup(path_value)
+        if check_type == "contains_all":
+            regex = bool(check.get("regex", True))
+            for pattern in check["patterns"]:
+                error = group.patterns.add(pattern, regex)
+                if error is not None:
+                    self.findings.append((key, f"{context}: {error}"))
+        group.checks.append(PlannedCheck(key, context, check_type, check))
+
+    def add_manifest(self, index: int, path: Path, data: Dict[str, Any]) -> None:
+        rel = path.relative_to(ROOT)
+        suite = data.get("suite")
+        cases = data.get("cases")
+        if not isinstance(suite, str) or not suite.strip():
+            self.findings.append(((index, 0), f"{rel}: missing string 'suite'"))
+            return
+        if not isinstance(cases, list):
+            self.findings.append(((index, 0), f"{rel}: missing list 'cases'"))
+            return
+
+        position = 0
+        for case_index, case in enumerate(cases, start=1):
+            context = f"{rel} case[{case_index}]"
+            position += 1
+            if not isinstance(case, dict):
+                self.findings.append(((index, position), f"{context}: case must be an object"))
+                continue
+
+            case_id = case.get("id")
+            checks = case.get("checks")
+            if not isinstance(case_id, str) or not case_id.strip():
+                self.findings.append(((index, position), f"{context}: missing string 'id'"))
+                continue
+            if not isinstance(checks, list) or not checks:
+                self.findings.append(
+                    ((index, position), f"{context} ({case_id}): missing non-empty list 'checks'")
+                )
+                continue
+
+            for check_index, check in enumerate(checks, start=1):
+                position += 1
+                check_context = f"{context} ({case_id}) check[{check_index}]"
+                if not isinstance(check, dict):
+                    self.findings.append(((index, position), f"{check_context}: check must be an object"))
+                    continue
+                self.add_check((index, position), check_context, check)
+
+
+class FileContents:
+    """One file's text and the views checks need, each computed at most once."""
+
+    def __init__(self, path: Path, patterns: PatternSet) -> None:
+        self.path = path
+        self.exists = path.exists()
+        self._patterns = patterns
+        self._text: str | None = None
+        self._missing: Set[Tuple[bool, str]] | None = None
+        self._frontmatter: Any = _UNSET
+        self._json: Any = _UNSET
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self.path.read_text(encoding="utf-8")
+        return self._text
+
+    def missing_patterns(self) -> Set[Tuple[bool, str]]:
+        if self._missing is None:
+            self._missing = self._patterns.missing(self.text)
+        return self._missing
+
+    def frontmatter(self) -> Frontmatter | None:
+        if self._frontmatter is _UNSET:
+            self._frontmatter = parse_frontmatter(self.text)
+        return self._frontmatter
+
+    def json(self) -> Any:
+        """Decoded JSON; raises ValueError for invalid JSON."""
+        if self._json is _UNSET:
+            self._json = json.loads(self.text)
+        return self._json
+
+
+def _evaluate(planned: PlannedCheck, contents: FileContents, path_value: str) -> Iterator[str]:
+    check_type, check = planned.check_type, planned.check
+
+    if check_type == "file_exists":
+        if not contents.exists:
+            yield f"file does not exist: {path_value}"
         return
 
-    if not path.exists():
-        errors.append(f"{context}: required file missing for {check_type}: {path_value}")
+    if not contents.exists:
+        yield f"required file missing for {check_type}: {path_value}"
         return
 
     if check_type == "contains_all":
-        patterns = check.get("patterns")
         regex = bool(check.get("regex", True))
-        if not isinstance(patterns, list) or not all(isinstance(item, str) for item in patterns):
-            errors.append(f"{context}: contains_all requires string list 'patterns'")
-            return
-        text = path.read_text(encoding="utf-8")
-        for pattern in patterns:
-            if regex:
-                if re.search(pattern, text, re.MULTILINE) is None:
-                    errors.append(f"{context}: pattern not found in {path_value}: {pattern}")
-            else:
-                if pattern not in text:
-                    errors.append(f"{context}: literal not found in {path_value}: {pattern}")
+        missing = contents.missing_patterns()
+        for pattern in check["patterns"]:
+            if PatternSet.key(pattern, regex) in missing:
+                kind = "pattern" if regex else "literal"
+                yield f"{kind} not found in {path_value}: {pattern}"
         return
 
     if check_type == "frontmatter_keys":
-        keys = check.get("keys")
-        if not isinstance(keys, list) or not all(isinstance(item, str) for item in keys):
-            errors.append(f"{context}: frontmatter_keys requires string list 'keys'")
-            return
-        fm = parse_frontmatter(path.read_text(encoding="utf-8"))
+        fm = contents.frontmatter()
         if fm is None:
-            errors.append(f"{context}: missing YAML frontmatter in {path_value}")
+            yield f"missing YAML frontmatter in {path_value}"
             return
-        for key in keys:
-            if key not in fm:
-                errors.append(f"{context}: frontmatter key missing in {path_value}: {key}")
+        for key in check["keys"]:
+            if not _has_frontmatter_key(fm, key):
+                yield f"frontmatter key missing in {path_value}: {key}"
         return
 
-    if check_type == "json_items_have_fields":
-        required_fields = check.get("required_fields")
-        min_items = check.get("min_items", 1)
-        container_key = check.get("container_key")
-        if not isinstance(required_fields, list) or not all(
-            isinstance(item, str) for item in required_fields
-        ):
-            errors.append(f"{context}: json_items_have_fields requires string list 'required_fields'")
-            return
-        if not isinstance(min_items, int) or min_items < 0:
-            errors.append(f"{context}: json_items_have_fields requires non-negative integer 'min_items'")
+    # json_items_have_fields
+    required_fields = check["required_fields"]
+    min_items = check.get("min_items", 1)
+    container_key = check.get("container_key")
+    try:
+        data = contents.json()
+    except ValueError as exc:
+        yield f"invalid JSON in {path_value}: {exc}"
+        return
+    rows: Any = data
+    if isinstance(container_key, str):
+        if not isinstance(data, dict):
+            yield f"expected object for container_key in {path_value}"
             return
+        rows = data.get(container_key)
 
-        data = json.loads(path.read_text(encoding="utf-8"))
-        rows: Any = data
-        if isinstance(container_key, str):
-            if not isinstance(data, dict):
-                errors.append(f"{context}: expected object for container_key in {path_value}")
-                return
-            rows = data.get(container_key)
+    if not isinstance(rows, list):
+        yield f"target JSON value is not a list in {path_value}"
+        return
+    if len(rows) < min_items:
+        yield f"expected at least {min_items} items in {path_value}"
+        return
 
-        if not isinstance(rows, list):
-            errors.append(f"{context}: target JSON value is not a list in {path_value}")
-            return
-        if len(rows) < min_items:
-            errors.append(f"{context}: expected at least {min_items} items in {path_value}")
-            return
+    for idx, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            yield f"item {idx} in {path_value} is not an object"
+            continue
+        missing_fields = [name for name in required_fields if name not in row]
+        if missing_fields:
+            yield f"item {idx} in {path_value} missing fields: {', '.join(missing_fields)}"
 
-        for idx, row in enumerate(rows, start=1):
-            if not isinstance(row, dict):
-                errors.append(f"{context}: item {idx} in {path_value} is not an object")
-                continue
-            missing = [field for field in required_fields if field not in row]
-            if missing:
-                errors.append(
-                    f"{context}: item {idx} in {path_value} missing fields: {', '.join(missing)}"
-                )
-        return
 
-    errors.append(f"{context}: unsupported check type: {check_type}")
+def evaluate_group(group: FileGroup) -> List[Finding]:
+    """Run every check on one file, reading and parsing it at most once."""
+    contents = FileContents(resolve_path(group.path_value), group.patterns)
+    findings: List[Finding] = []
+    for planned in group.checks:
+        try:
+            for message in _evaluate(planned, contents, group.path_value):
+                findings.append((planned.key, f"{planned.context}: {message}"))
+        except (OSError, UnicodeDecodeError) as exc:
+            findings.append((planned.key, f"{planned.context}: cannot read {group.path_value}: {exc}"))
+    return findings
+
+
+def execute_plan(plan: ExecutionPlan, jobs: int = 1) -> List[Finding]:
+    """Evaluate every file group, across up to ``jobs`` threads, and return findings in order."""
+    groups = list(plan.groups.values())
+    if jobs <= 1 or len(groups) < 2:
+        results = [evaluate_group(group) for group in groups]
+    else:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(groups))) as pool:
+            results = list(pool.map(evaluate_group, groups))
 
+    findings = list(plan.findings)
+    for group_findings in results:
+        findings.extend(group_findings)
+    findings.sort(key=lambda finding: finding[0])
+    return findings
 
-def validate_manifest(path: Path) -> List[str]:
-    data = load_data(path)
-    errors: List[str] = []
 
-    suite = data.get("suite")
-    cases = data.get("cases")
+def run_check(check: Dict[str, Any], errors: List[str], context: str) -> None:
+    """Run a single check; manifests go through ExecutionPlan instead."""
+    plan = ExecutionPlan()
+    plan.add_check((0, 0), context, check)
+    errors.extend(message for _, message in execute_plan(plan))
 
-    if not isinstance(suite, str) or not suite.strip():
-        return [f"{path.relative_to(ROOT)}: missing string 'suite'"]
-    if not isinstance(cases, list):
-        return [f"{path.relative_to(ROOT)}: missing list 'cases'"]
 
-    for case_index, case in enumerate(cases, start=1):
-        context = f"{path.relative_to(ROOT)} case[{case_index}]"
-        if not isinstance(case, dict):
-            errors.append(f"{context}: case must be an object")
+def manifest_inputs(data: Dict[str, Any]) -> List[Path]:
+    """Return every file a manifest's checks read."""
+    paths: List[Path] = []
+    cases = data.get("cases")
+    if not isinstance(cases, list):
+        return paths
+    for case in cases:
+        checks = case.get("checks") if isinstance(case, dict) else None
+        if not isinstance(checks, list):
             continue
+        for check in checks:
+            if isinstance(check, dict) and isinstance(check.get("path"), str):
+                paths.append(resolve_path(check["path"]))
+    return paths
 
-        case_id = case.get("id")
-        checks = case.get("checks")
 
-        if not isinstance(case_id, str) or not case_id.strip():
-            errors.append(f"{context}: missing string 'id'")
-            continue
-        if not isinstance(checks, list) or not checks:
-            errors.append(f"{context} ({case_id}): missing non-empty list 'checks'")
-            continue
+def validate_manifests(
+    manifests: Sequence[Tuple[Path, Dict[str, Any]]], jobs: int = 1
+) -> List[List[str]]:
+    """Validate manifests as one plan, so files they share are read once; findings per manifest."""
+    plan = ExecutionPlan()
+    for index, (path, data) in enumerate(manifests):
+        plan.add_manifest(index, path, data)
+    results: List[List[str]] = [[] for _ in manifests]
+    for (index, _), message in execute_plan(plan, jobs):
+        results[index].append(message)
+    return results
 
-        for check_index, check in enumerate(checks, start=1):
-            if not isinstance(check, dict):
-                errors.append(f"{context} ({case_id}) check[{check_index}]: check must be an object")
-                continue
-            run_check(check, errors, f"{context} ({case_id}) check[{check_index}]")
 
-    return errors
+def validate_manifest(path: Path, data: Dict[str, Any] | None = None) -> List[str]:
+    if data is None:
+        data = load_data(path)
+    return validate_manifests([(path, data)])[0]
 
 
 def parse_args(argv: Sequence[str]) -> argparse.Namespace:
@@ -193,6 +407,14 @@ def parse_args(argv: Sequence[str]) -> argparse.Namespace:
         default=[],
         help="Relative manifest path. Repeat flag to pass multiple manifests.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Evaluate checks for different files on N threads (0 = one per CPU; default: 0).",
+    )
+    add_cache_arguments(parser)
     return parser.parse_args(argv)
 
 
@@ -209,21 +431,43 @@ def main(argv: Sequence[str]) -> int:
         fail(f"No functional manifests found: {DEFAULT_MANIFEST_GLOB}")
         return 1
 
+    cache = ValidationCache(
+        "validate_skill_functional_contracts",
+        source_version(__file__, frontmatter.__file__),
+        not args.no_cache,
+    )
     errors: List[str] = []
+    loaded: List[Tuple[Path, Dict[str, Any], str]] = []
     for manifest in manifests:
         if not manifest.exists():
             errors.append(f"Manifest does not exist: {manifest.relative_to(ROOT)}")
             continue
         try:
-            manifest_errors = validate_manifest(manifest)
+            data = load_data(manifest)
         except (ValueError, json.JSONDecodeError) as exc:
             errors.append(str(exc))
             continue
+        loaded.append((manifest, data, cache.key([manifest, *manifest_inputs(data)])))
+
+    findings = [cache.get(key) for _, _, key in loaded]
+    pending = [position for position, found in enumerate(findings) if found is None]
+    if pending:
+        jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+        fresh = validate_manifests([loaded[position][:2] for position in pending], jobs)
+        for position, manifest_errors in zip(pending, fresh):
+            findings[position] = manifest_errors
+            cache.put(loaded[position][2], manifest_errors)
+
+    for (manifest, _, _), manifest_errors in zip(loaded, findings):
         if manifest_errors:
             errors.extend(manifest_errors)
         else:
             ok(f"Validated functional contract manifest: {manifest.relative_to(ROOT)}")
 
+    cache.save()
+    if args.cache_stats:
+        print(cache.summary())
+
     if errors:
         for error in errors:
             fail(error)
@@ -3,12 +3,17 @@
 
 from __future__ import annotations
 
+import argparse
 import json
 import re
 import sys
 from pathlib import Path
 from typing import Dict, List, Sequence, Set
 
+import frontmatter
+from frontmatter import parse_frontmatter
+from validation_cache import ValidationCache, add_cache_arguments, run_cached_main, source_version
+
 ROOT = Path(__file__).resolve().parent.parent
 MAP_PATH = ROOT / ".claude/skills/ciso/references/policy-area-map.json"
 POLICY_SKILL_MAP_PATH = ROOT / ".claude/skills/ciso-policy/references/policy-area-map.json"
@@ -118,20 +123,6 @@ def load_json(path: Path) -> Dict[str, object]:
         raise ValueError(f"Invalid JSON in {path}: {exc}") from exc
 
 
-def parse_frontmatter(text: str) -> Dict[str, str]:
-    match = re.match(r"^---\n(.*?)\n---\n?", text, re.DOTALL)
-    if not match:
-        return {}
-    data: Dict[str, str] = {}
-    for line in match.group(1).splitlines():
-        m = re.match(r"^([A-Za-z0-9_-]+):\s*(.*)$", line.strip())
-        if not m:
-            continue
-        key, value = m.groups()
-        data[key] = value.strip()
-    return data
-
-
 def expected_mirror_text(name: str, mirror_skill: str) -> str:
     canonical = (
         ROOT / f".claude/skills/ciso/references/{name}"
@@ -288,22 +279,21 @@ def validate_skill_contracts() -> List[str]:
             errors.append(f"Missing skill file: {skill_file.relative_to(ROOT)}")
             continue
         text = skill_file.read_text(encoding="utf-8")
-        fm = parse_frontmatter(text)
+        parsed = parse_frontmatter(text)
+        fm = parsed.data if parsed is not None else {}
         skill_name = skill_file.parent.name
+        if parsed is not None:
+            for issue in parsed.issues:
+                errors.append(f"{skill_file.relative_to(ROOT)}:{issue.line} {issue.message}")
 
-        if "license: MIT" not in text:
+        if fm.get("license") != "MIT":
             errors.append(f"{skill_file.relative_to(ROOT)} missing `license: MIT` frontmatter")
 
-        metadata_match = re.search(r"\nmetadata:\n(.*?)(?:\n[A-Za-z0-9_-]+:|\n---)", text, re.DOTALL)
-        if not metadata_match:
+        metadata = fm.get("metadata")
+        if not isinstance(metadata, dict):
             errors.append(f"{skill_file.relative_to(ROOT)} missing metadata block")
         else:
-            metadata_block = metadata_match.group(1)
-            present_keys = {
-                m.group(1)
-                for m in re.finditer(r"^\s{2}([A-Za-z0-9_-]+):", metadata_block, re.MULTILINE)
-            }
-            missing = sorted(REQUIRED_METADATA_FIELDS - present_keys)
+            missing = sorted(REQUIRED_METADATA_FIELDS - set(metadata))
             if missing:
                 errors.append(
                     f"{skill_file.relative_to(ROOT)} missing metadata keys: {', '.join(missing)}"
@@ -313,7 +303,8 @@ def validate_skill_contracts() -> List[str]:
         if not allowed:
             errors.append(f"{skill_file.relative_to(ROOT)} missing allowed-tools frontmatter")
         else:
-            actual_tools = {token.strip() for token in allowed.split(",") if token.strip()}
+            tokens = allowed.split(",") if isinstance(allowed, str) else allowed
+            actual_tools = {str(token).strip() for token in tokens if str(token).strip()}
             expected_tools = EXPECTED_ALLOWED_TOOLS.get(skill_name)
             if expected_tools and actual_tools != expected_tools:
                 errors.append(
@@ -372,7 +363,22 @@ def validate_mirror_references() -> List[str]:
     return errors
 
 
-def main() -> int:
+def validation_inputs() -> List[Path]:
+    """Every file whose content or existence can change this validator's verdict."""
+    inputs: List[Path] = [MAP_PATH, POLICY_SKILL_MAP_PATH, ASSESS_SKILL_MAP_PATH]
+    inputs.extend(REFERENCE_FILES)
+    inputs.extend(path for path, _ in PORTABILITY_RULES)
+    inputs.extend(SKILL_FILES)
+    inputs.extend(
+        [ROOT / "scripts/resolve_entity_tags.py", ROOT / ".claude/skills/ciso/scripts/resolve_entity_tags.py"]
+    )
+    for skill in ("ciso", "ciso-policy", "ciso-assess"):
+        for filename in (*MIRROR_EXACT_FILES, *MIRROR_PATH_AWARE_FILES):
+            inputs.append(ROOT / f".claude/skills/{skill}/references/{filename}")
+    return inputs
+
+
+def validate_all() -> int:
     errors: List[str] = []
 
     try:
@@ -405,5 +411,27 @@ def main() -> int:
     return 0
 
 
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_cache_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    cache = ValidationCache(
+        "validate_skill_mappings", source_version(__file__, frontmatter.__file__), not args.no_cache
+    )
+    # Framework files are only checked for existence, so the tree listing is key material.
+    framework_listing = ",".join(
+        path.relative_to(ROOT).as_posix() for path in sorted((ROOT / "framework").rglob("*.md"))
+    )
+    code = run_cached_main(cache, validation_inputs(), framework_listing, validate_all)
+    cache.save()
+    if args.cache_stats:
+        print(cache.summary())
+    return code
+
+
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(main(sys.argv[1:]))
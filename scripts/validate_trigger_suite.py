@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import argparse
 import json
 import re
 import sys
@@ -10,6 +11,8 @@ from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List, Sequence
 
+from validation_cache import ValidationCache, add_cache_arguments, run_cached_main, source_version
+
 ROOT = Path(__file__).resolve().parent.parent
 SUITE_PATHS = {
     "ciso": ROOT / ".claude/skills/ciso/references/trigger-tests.yaml",
@@ -159,7 +162,7 @@ def normalized_json(data: Dict[str, Any]) -> str:
     return json.dumps(data, sort_keys=True, separators=(",", ":"))
 
 
-def main() -> int:
+def validate_suites() -> int:
     errors: List[str] = []
     suites: Dict[str, Dict[str, Any]] = {}
 
@@ -211,5 +214,21 @@ def main() -> int:
     return 0
 
 
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    add_cache_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    cache = ValidationCache("validate_trigger_suite", source_version(__file__), not args.no_cache)
+    code = run_cached_main(cache, SUITE_PATHS.values(), "", validate_suites)
+    cache.save()
+    if args.cache_stats:
+        print(cache.summary())
+    return code
+
+
 if __name__ == "__main__":
-    sys.exit(main())
+    sys.exit(main(sys.argv[1:]))
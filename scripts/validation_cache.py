@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Content-addressed result cache shared by the validation scripts.
+
+A cache key is the SHA-256 of the validator namespace, the validator version
+(the hash of its own source), any extra key material, and the content hashes
+of every input file of the check. Stored values are the check's findings, so
+an unchanged check replays its PASS/FAIL result without re-validating.
+
+File content hashes are memoized by (size, mtime_ns) so unchanged inputs are
+not re-read on every run. As with git's "racily clean" rule, a memo is only
+trusted when the file's mtime is older than the cache file's last save; a
+same-size rewrite within one timestamp tick of the hash is re-hashed. Set
+CSCRF_NO_CACHE=1 or pass --no-cache to the validators to bypass the cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Sequence, Set
+
+ROOT = Path(__file__).resolve().parent.parent
+CACHE_PATH = ROOT / ".cache/validation-results.json"
+
+# Bump when the on-disk layout changes.
+CACHE_FORMAT = 1
+# Oldest-written entries are dropped past this size.
+MAX_ENTRIES = 50_000
+
+_MISSING = "missing"
+
+
+def source_version(*module_files: str) -> str:
+    """Return a version string derived from a validator's source and the shared modules it uses."""
+    digest = hashlib.sha256()
+    for module_file in module_files:
+        digest.update(Path(module_file).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _read_payload(path: Path) -> tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}, {}
+    if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT:
+        return {}, {}
+    return data.get("entries", {}), data.get("files", {})
+
+
+def cache_disabled_by_env() -> bool:
+    return os.environ.get("CSCRF_NO_CACHE", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+class ValidationCache:
+    """Persistent findings cache for one validator namespace."""
+
+    def __init__(
+        self,
+        namespace: str,
+        version: str,
+        enabled: bool = True,
+        path: Path = CACHE_PATH,
+    ) -> None:
+        self.namespace = namespace
+        self.version = version
+        self.enabled = enabled and not cache_disabled_by_env()
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Any] = {}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        # Files hashed by this process, and the mtime of the last save; memos
+        # for files touched at or after that save are re-verified.
+        self._hashed: Set[str] = set()
+        self._saved_ns = 0
+        self._dirty = False
+        if self.enabled:
+            # Stat before reading: a concurrent save in between only makes the stamp older.
+            with contextlib.suppress(OSError):
+                self._saved_ns = path.stat().st_mtime_ns
+            self._entries, self._files = _read_payload(path)
+
+    def file_digest(self, path: Path) -> str:
+        """Content hash of a file, memoized by size and mtime unless racily clean."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return _MISSING
+        key = str(path.resolve())
+        cached = self._files.get(key)
+        if (
+            cached
+            and cached["size"] == stat.st_size
+            and cached["mtime_ns"] == stat.st_mtime_ns
+            and (key in self._hashed or stat.st_mtime_ns < self._saved_ns)
+        ):
+            return cached["sha256"]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        self._files[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}
+        self._hashed.add(key)
+        self._dirty = True
+        return digest
+
+    def key(self, inputs: Iterable[Path], extra: str = "") -> str:
+        hasher = hashlib.sha256(f"{self.namespace}\0{self.version}\0{extra}\n".encode("utf-8"))
+        for path in sorted({Path(item) for item in inputs}, key=str):
+            hasher.update(f"{path}\0{self.file_digest(path)}\n".encode("utf-8"))
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> Any | None:
+        if not self.enabled:
+            return None
+        entry = self._entries.get(f"{self.namespace}:{key}")
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        full_key = f"{self.namespace}:{key}"
+        # Re-insert so the newest entries sit at the end for eviction.
+        self._entries.pop(full_key, None)
+        self._entries[full_key] = value
+        self._dirty = True
+
+    def save(self) -> None:
+        """Merge with any concurrent writer's entries and persist atomically."""
+        if not self.enabled or not self._dirty:
+            return
+        disk_entries, disk_files = _read_payload(self.path)
+        # Drop our keys from the disk copy first so entries written this run sit
+        # at the end, where eviction reaches them last.
+        for key in self._entries:
+            disk_entries.pop(key, None)
+        entries = {**disk_entries, **self._entries}
+        files = {**disk_files, **self._files}
+        if len(entries) > MAX_ENTRIES:
+            entries = dict(list(entries.items())[-MAX_ENTRIES:])
+
+        payload = {"format": CACHE_FORMAT, "entries": entries, "files": files}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=".validation-results-", dir=self.path.parent)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump(payload, handle, separators=(",", ":"))
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            # Caching is best-effort; a read-only tree still validates.
+            return
+        self._dirty = False
+
+    def summary(self) -> str:
+        if not self.enabled:
+            return f"[INFO] {self.namespace} cache disabled"
+        total = self.hits + self.misses
+        rate = (self.hits / total) if total else 0.0
+        return (
+            f"[INFO] {self.namespace} cache: hits={self.hits}, misses={self.misses}, "
+            f"hit_rate={rate:.0%}"
+        )
+
+
+def run_cached_main(
+    cache: ValidationCache,
+    inputs: Iterable[Path],
+    extra: str,
+    run: Callable[[], int],
+) -> int:
+    """Run a whole validator pass, or replay its stored output and exit code."""
+    key = cache.key(inputs, extra)
+    stored = cache.get(key)
+    if stored is None:
+        buffer = io.StringIO()
+        with contextlib.redirect_stdout(buffer):
+            code = run()
+        stored = {"output": buffer.getvalue(), "code": code}
+        cache.put(key, stored)
+    sys.stdout.write(stored["output"])
+    return stored["code"]
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-validate everything and do not read or write the result cache.",
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Print cache hit/miss counts after validation.",
+    )
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Inspect or clear the validation result cache.")
+    parser.add_argument("--clear", action="store_true", help="Delete the cache file.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    if args.clear:
+        CACHE_PATH.unlink(missing_ok=True)
+        print(f"[PASS] Cleared {CACHE_PATH.relative_to(ROOT)}")
+        return 0
+
+    try:
+        data = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        print(f"[INFO] No validation cache at {CACHE_PATH.relative_to(ROOT)}")
+        return 0
+    counts: Dict[str, int] = {}
+    for key in data.get("entries", {}):
+        namespace = key.split(":", 1)[0]
+        counts[namespace] = counts.get(namespace, 0) + 1
+    print(f"[INFO] {CACHE_PATH.relative_to(ROOT)}: {CACHE_PATH.stat().st_size} bytes")
+    for namespace, count in sorted(counts.items()):
+        print(f"  {namespace}: {count} entries")
+    print(f"  tracked files: {len(data.get('files', {}))}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
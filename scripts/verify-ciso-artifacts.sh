@@ -1,35 +1,71 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
+# Usage: bash scripts/verify-ciso-artifacts.sh [--strict] [--workspace-root DIR] [--workspace NAME]...
+# Checks every per-entity workspace under the root (default: $CISO_WORKSPACE_ROOT, else
+# docs/.ciso-work; relative to the repo root) in parallel. A root that itself holds
+# artifacts is the legacy single workspace, with its policies in the sibling policies/.
+
+usage="Usage: bash scripts/verify-ciso-artifacts.sh [--strict] [--workspace-root DIR] [--workspace NAME]..."
 strict=0
-if [[ "${1:-}" == "--strict" ]]; then
-  strict=1
-fi
+workspace_root="${CISO_WORKSPACE_ROOT:-docs/.ciso-work}"
+workspaces=()
+while [[ $# -gt 0 ]]; do
+  case "$1" in
+    --strict) strict=1 ;;
+    --workspace-root)
+      [[ $# -ge 2 ]] || { echo "[FAIL] --workspace-root needs a directory"; echo "$usage"; exit 1; }
+      workspace_root="$2"
+      shift
+      ;;
+    --workspace)
+      [[ $# -ge 2 ]] || { echo "[FAIL] --workspace needs a name"; echo "$usage"; exit 1; }
+      workspaces+=("$2")
+      shift
+      ;;
+    *)
+      echo "[FAIL] unknown argument: $1"
+      echo "$usage"
+      exit 1
+      ;;
+  esac
+  shift
+done
 
 repo_root="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
 cd "$repo_root"
 
 required_files=(
-  "docs/.ciso-work/entity-profile.md"
-  "docs/.ciso-work/entity-profile.json"
-  "docs/.ciso-work/entity-tags.json"
-  "docs/.ciso-work/gap-analysis.md"
-  "docs/.ciso-work/gap-analysis.json"
-  "docs/.ciso-work/roadmap.md"
+  "entity-profile.md"
+  "entity-profile.json"
+  "entity-tags.json"
+  "gap-analysis.md"
+  "gap-analysis.json"
+  "roadmap.md"
 )
 
 optional_files=(
-  "docs/.ciso-work/policy-plan.md"
-  "docs/.ciso-work/review-findings.md"
-  "docs/policies/access-control.md"
+  "policy-plan.md"
+  "review-findings.md"
 )
 
-missing_required=0
-missing_optional=0
-content_failures=0
-
-echo "Verifying CSCRF workflow artifacts in: $repo_root"
-echo
+if [[ ${#workspaces[@]} -eq 0 ]]; then
+  for f in "${required_files[@]}" "${optional_files[@]}" "gap-analysis.jsonl"; do
+    if [[ -f "$workspace_root/$f" ]]; then
+      workspaces+=(".")
+      break
+    fi
+  done
+  for dir in "$workspace_root"/*/; do
+    [[ -d "$dir" ]] || continue
+    name="$(basename "$dir")"
+    [[ "$name" == "policies" ]] && continue
+    workspaces+=("$name")
+  done
+  if [[ ${#workspaces[@]} -eq 0 ]]; then
+    workspaces=(".")
+  fi
+fi
 
 check_file() {
   local path="$1"
@@ -56,44 +92,110 @@ check_contains() {
   fi
 }
 
-echo "Required files:"
-for f in "${required_files[@]}"; do
-  if ! check_file "$f"; then
-    missing_required=$((missing_required + 1))
+# Verify one workspace; prints its report and writes "<required> <optional> <content>" to $2.
+verify_workspace() {
+  local name="$1"
+  local counts_file="$2"
+  local dir="$workspace_root"
+  local policy_dir
+  if [[ "$name" == "." ]]; then
+    policy_dir="$(dirname "$workspace_root")/policies"
+  else
+    dir="$workspace_root/$name"
+    policy_dir="$dir/policies"
   fi
-done
-echo
+  local missing_required=0
+  local missing_optional=0
+  local content_failures=0
 
-echo "Optional files:"
-for f in "${optional_files[@]}"; do
-  if [[ -f "$f" ]]; then
-    echo "[PASS] file exists: $f"
-  else
-    echo "[WARN] missing optional file: $f"
-    missing_optional=$((missing_optional + 1))
+  # Hold the workspace's shared lock so writers cannot swap artifacts mid-check.
+  # Readers never create the lock file; without one the check runs unlocked.
+  if command -v flock >/dev/null 2>&1 && [[ -f "$dir/.lock" && -r "$dir/.lock" ]]; then
+    exec 9<"$dir/.lock"
+    flock -s 9
   fi
-done
-echo
 
-echo "Content checks:"
-if ! check_contains "docs/.ciso-work/entity-profile.md" "^## Entity Profile|Entity Profile" "entity profile heading"; then
-  content_failures=$((content_failures + 1))
-fi
-if ! check_contains "docs/.ciso-work/entity-profile.json" "\"entity_type\"|\"category\"" "entity profile json core keys"; then
-  content_failures=$((content_failures + 1))
-fi
-if ! check_contains "docs/.ciso-work/gap-analysis.md" "Mandatory Gaps|Priority 1|GAP" "gap analysis core section"; then
-  content_failures=$((content_failures + 1))
-fi
-if ! check_contains "docs/.ciso-work/roadmap.md" "90-Day|Phase|Ongoing Compliance Calendar" "roadmap phase/calendar section"; then
-  content_failures=$((content_failures + 1))
-fi
-if ! check_contains "docs/policies/access-control.md" "CSCRF Ref|PR.AA|Traceability Matrix" "policy traceability content"; then
-  content_failures=$((content_failures + 1))
-fi
+  echo "Workspace: $dir"
+  echo
+  echo "Required files:"
+  local f
+  for f in "${required_files[@]}"; do
+    f="$dir/$f"
+    # Large gap analyses may ship as streaming JSONL instead of a single JSON document.
+    if [[ "$f" == */gap-analysis.json && ! -f "$f" && -f "${f}l" ]]; then
+      f="${f}l"
+    fi
+    if ! check_file "$f"; then
+      missing_required=$((missing_required + 1))
+    fi
+  done
+  echo
+
+  echo "Optional files:"
+  for f in "${optional_files[@]/#/$dir/}" "$policy_dir/access-control.md"; do
+    if [[ -f "$f" ]]; then
+      echo "[PASS] file exists: $f"
+    else
+      echo "[WARN] missing optional file: $f"
+      missing_optional=$((missing_optional + 1))
+    fi
+  done
+  echo
+
+  echo "Content checks:"
+  if ! check_contains "$dir/entity-profile.md" "^## Entity Profile|Entity Profile" "entity profile heading"; then
+    content_failures=$((content_failures + 1))
+  fi
+  if ! check_contains "$dir/entity-profile.json" "\"entity_type\"|\"category\"" "entity profile json core keys"; then
+    content_failures=$((content_failures + 1))
+  fi
+  if ! check_contains "$dir/gap-analysis.md" "Mandatory Gaps|Priority 1|GAP" "gap analysis core section"; then
+    content_failures=$((content_failures + 1))
+  fi
+  if ! check_contains "$dir/roadmap.md" "90-Day|Phase|Ongoing Compliance Calendar" "roadmap phase/calendar section"; then
+    content_failures=$((content_failures + 1))
+  fi
+  if ! check_contains "$policy_dir/access-control.md" "CSCRF Ref|PR.AA|Traceability Matrix" "policy traceability content"; then
+    content_failures=$((content_failures + 1))
+  fi
+  echo
+
+  echo "$missing_required $missing_optional $content_failures" > "$counts_file"
+}
+
+echo "Verifying CSCRF workflow artifacts in: $repo_root"
 echo
 
+tmp_dir="$(mktemp -d)"
+trap 'rm -rf "$tmp_dir"' EXIT
+
+pids=()
+for i in "${!workspaces[@]}"; do
+  verify_workspace "${workspaces[$i]}" "$tmp_dir/$i.counts" > "$tmp_dir/$i.log" 2>&1 &
+  pids+=("$!")
+done
+for pid in "${pids[@]}"; do
+  wait "$pid" || true
+done
+
+missing_required=0
+missing_optional=0
+content_failures=0
+for i in "${!workspaces[@]}"; do
+  cat "$tmp_dir/$i.log"
+  if [[ ! -f "$tmp_dir/$i.counts" ]]; then
+    echo "[FAIL] verification did not complete for workspace: ${workspaces[$i]}"
+    content_failures=$((content_failures + 1))
+    continue
+  fi
+  read -r required optional content < "$tmp_dir/$i.counts"
+  missing_required=$((missing_required + required))
+  missing_optional=$((missing_optional + optional))
+  content_failures=$((content_failures + content))
+done
+
 echo "Summary:"
+echo "- workspaces checked: ${#workspaces[@]}"
 echo "- missing required files: $missing_required"
 echo "- missing optional files: $missing_optional"
 echo "- content check failures: $content_failures"
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""Per-entity workspaces for /ciso workflow artifacts.
+
+Each regulated entity gets its own directory under a workspace root
+(--workspace-root, else $CISO_WORKSPACE_ROOT, else docs/.ciso-work; relative
+paths are taken from the repository root):
+
+    docs/.ciso-work/
+    ├── acme-broking/       # entity-profile.json ... roadmap.md, policies/*.md
+    └── zenith-amc/
+
+A root that itself holds artifacts is the legacy single workspace, with its
+policies in the sibling policies/ directory (docs/policies), and is still
+picked up, so existing checkouts keep working.
+
+Writers go through write_artifact(): it takes the workspace's advisory lock
+(flock on <workspace>/.lock), writes a temp file in the same directory,
+fsyncs it and renames it over the target. Concurrent agents therefore never
+leave a torn artifact, and readers see either the old or the new file.
+Readers that need a consistent view across several artifacts, such as the
+validators, hold the shared lock. Locks are advisory and POSIX-only; without
+fcntl, writes are still atomic but unlocked.
+
+Usage:
+    python3 scripts/workspaces.py list
+    python3 scripts/workspaces.py init acme-broking
+    python3 scripts/workspaces.py write acme-broking gap-analysis.json < gap.json
+    python3 scripts/workspaces.py write acme-broking policies/access-control.md --from draft.md
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import re
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_ROOT = ROOT / "docs/.ciso-work"
+ROOT_ENV = "CISO_WORKSPACE_ROOT"
+LOCK_FILE = ".lock"
+
+WORK_ARTIFACTS = [
+    "entity-profile.md",
+    "entity-profile.json",
+    "entity-tags.json",
+    "gap-analysis.md",
+    "gap-analysis.json",
+    "policy-plan.md",
+    "review-findings.md",
+    "roadmap.md",
+]
+# Large gap analyses may ship as streaming JSONL instead of a single JSON document.
+ARTIFACT_ALTERNATES = {"gap-analysis.json": "gap-analysis.jsonl"}
+
+NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+
+def ok(message: str) -> None:
+    print(f"[PASS] {message}")
+
+
+def fail(message: str) -> None:
+    print(f"[FAIL] {message}")
+
+
+def display_path(path: Path) -> str:
+    """Repository-relative path when inside the checkout, else the absolute path."""
+    try:
+        return path.resolve().relative_to(ROOT).as_posix()
+    except ValueError:
+        return str(path)
+
+
+def workspace_root(value: Optional[Path] = None) -> Path:
+    if value is None:
+        env = os.environ.get(ROOT_ENV)
+        value = Path(env) if env else DEFAULT_ROOT
+    return value if value.is_absolute() else ROOT / value
+
+
+def artifact_path(directory: Path, name: str) -> Path:
+    path = directory / name
+    alternate = ARTIFACT_ALTERNATES.get(name)
+    if not path.exists() and alternate and (directory / alternate).exists():
+        return directory / alternate
+    return path
+
+
+@dataclass(frozen=True)
+class Workspace:
+    name: str
+    path: Path
+    legacy: bool = False
+
+    @property
+    def label(self) -> str:
+        return display_path(self.path)
+
+    @property
+    def policy_dir(self) -> Path:
+        return (self.path.parent if self.legacy else self.path) / "policies"
+
+    def policy_files(self) -> List[Path]:
+        if not self.policy_dir.is_dir():
+            return []
+        return sorted(path for path in self.policy_dir.glob("*.md") if path.name.lower() != "readme.md")
+
+
+def _has_artifacts(directory: Path) -> bool:
+    return any(
+        (directory / name).exists() for name in [*WORK_ARTIFACTS, *ARTIFACT_ALTERNATES.values()]
+    )
+
+
+def discover(root: Path) -> List[Workspace]:
+    """The legacy workspace (if the root holds artifacts) followed by every entity directory."""
+    workspaces: List[Workspace] = []
+    if not root.is_dir():
+        return workspaces
+    if _has_artifacts(root):
+        workspaces.append(Workspace(".", root, legacy=True))
+    for child in sorted(root.iterdir()):
+        if child.is_dir() and NAME_RE.match(child.name) and child.name != "policies":
+            workspaces.append(Workspace(child.name, child))
+    return workspaces
+
+
+def select(root: Path, names: Sequence[str] = ()) -> List[Workspace]:
+    """Named workspaces, else all discovered ones, else the (possibly empty) legacy root.
+
+    Raises ValueError for an invalid or missing workspace name.
+    """
+    if names:
+        selected: List[Workspace] = []
+        for name in names:
+            if name == ".":
+                selected.append(Workspace(".", root, legacy=True))
+                continue
+            if not NAME_RE.match(name):
+                raise ValueError(f"invalid workspace name: {name!r}")
+            path = root / name
+            if not path.is_dir():
+                raise ValueError(f"workspace does not exist: {display_path(path)}")
+            selected.append(Workspace(name, path))
+        return selected
+    return discover(root) or [Workspace(".", root, legacy=True)]
+
+
+@contextlib.contextmanager
+def locked(directory: Path, shared: bool = False) -> Iterator[None]:
+    """Hold the workspace's advisory lock: exclusive for writers, shared for readers.
+
+    Only writers (and ``init``) create the lock file. Readers open an existing
+    one read-only and proceed unlocked when it is missing or unreadable, so a
+    read-only run never leaves a .lock behind.
+    """
+    if not HAS_FCNTL:
+        yield
+        return
+    try:
+        handle = open(directory / LOCK_FILE, "rb" if shared else "a+b")
+    except OSError:
+        if not shared:
+            raise
+        yield
+        return
+    with handle:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write ``data`` to a temp file beside ``path``, fsync it and rename it into place."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}-", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def write_artifact(directory: Path, name: str, data: bytes) -> Path:
+    """Atomically replace ``name`` (e.g. ``roadmap.md``, ``policies/x.md``) under the workspace lock."""
+    relative = Path(name)
+    if relative.is_absolute() or ".." in relative.parts or not relative.parts:
+        raise ValueError(f"artifact path must stay inside the workspace: {name}")
+    directory.mkdir(parents=True, exist_ok=True)
+    with locked(directory):
+        atomic_write(directory / relative, data)
+    return directory / relative
+
+
+def parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="List, create and write to per-entity /ciso workspaces.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("mode", choices=["list", "init", "write"], help="What to do")
+    parser.add_argument("workspace", nargs="?", help="init/write: workspace (entity) name")
+    parser.add_argument("artifact", nargs="?", help="write: artifact path inside the workspace")
+    parser.add_argument("--from", dest="source", type=Path, help="write: read content from FILE (default: stdin)")
+    parser.add_argument(
+        "--workspace-root",
+        type=Path,
+        help=f"Workspace root (default: ${ROOT_ENV} or {DEFAULT_ROOT.relative_to(ROOT)})",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str]) -> int:
+    args = parse_args(argv)
+    root = workspace_root(args.workspace_root)
+
+    if args.mode == "list":
+        for workspace in discover(root):
+            present = sum(artifact_path(workspace.path, name).exists() for name in WORK_ARTIFACTS)
+            policies = len(workspace.policy_files())
+            print(
+                f"{workspace.name}\t{workspace.label}\t"
+                f"{present}/{len(WORK_ARTIFACTS)} artifacts\t{policies} policies"
+            )
+        return 0
+
+    if not args.workspace or not NAME_RE.match(args.workspace):
+        fail(f"{args.mode} needs a workspace name matching {NAME_RE.pattern}")
+        return 2
+    directory = root / args.workspace
+
+    if args.mode == "init":
+        (directory / "policies").mkdir(parents=True, exist_ok=True)
+        (directory / LOCK_FILE).touch()
+        ok(f"workspace ready: {display_path(directory)}")
+        return 0
+
+    if not args.artifact:
+        fail("write needs an artifact path")
+        return 2
+    try:
+        data = args.source.read_bytes() if args.source else sys.stdin.buffer.read()
+        target = write_artifact(directory, args.artifact, data)
+    except (OSError, ValueError) as exc:
+        fail(str(exc))
+        return 2
+    ok(f"wrote {display_path(target)} ({len(data)} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))